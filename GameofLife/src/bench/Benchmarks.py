@@ -0,0 +1,248 @@
+'''
+
+Benchmark suite for stepping the Game of Life World
+times neighbor_cell_counter, mark_for_transition, clean_up_grid, whole
+generations & DisplayWorld.draw_world across grid sizes, random densities
+& standard patterns, and writes the results as JSON so runs of different
+versions or engines can be compared
+
+run from src, eg
+    python -m bench.Benchmarks --engines python numpy --sizes 64 256 \\
+        --output results.json
+    python -m bench.Benchmarks --engines numpy --compare results.json
+
+Created on Oct 18, 2026
+
+'''
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+from main.GameofLife import World, DisplayWorld
+from main.Patterns import pattern_grid
+
+SIZES = [64, 128, 256, 512, 1024, 2048, 4096]
+DENSITIES = [0.1, 0.3, 0.5]
+PATTERNS = ['r_pentomino', 'gosper_gun', 'acorn']
+
+def parse_args(argv):
+    '''
+    command line arguments
+    '''
+    parser = argparse.ArgumentParser(
+        description="benchmark Game of Life World stepping")
+    parser.add_argument('--engines', nargs='+', default=['python'],
+                        help="World backends to time")
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES,
+                        help="side lengths of the square grids")
+    parser.add_argument('--densities', nargs='+', type=float,
+                        default=DENSITIES, help="random grid densities")
+    parser.add_argument('--patterns', nargs='+', default=PATTERNS,
+                        help="standard patterns from main.Patterns")
+    parser.add_argument('--repeats', type=int, default=3,
+                        help="timings per benchmark, the fastest is kept")
+    parser.add_argument('--seed', type=int, default=1,
+                        help="seed for the random grids")
+    parser.add_argument('--draw', action='store_true',
+                        help="also time DisplayWorld.draw_world")
+    parser.add_argument('--render-mode', default='rects',
+                        choices=['rects', 'blit'],
+                        help="DisplayWorld render mode for --draw")
+    parser.add_argument('--output', default=None,
+                        help="JSON file for the results, stdout if not given")
+    parser.add_argument('--compare', default=None,
+                        help="JSON results of an earlier run to compare to")
+    return parser.parse_args(argv)
+
+def random_grid(ncol, nrow, density, seed):
+    '''
+    ncol x nrow grid in the World nested list format
+    each cell is alive with probability density
+    '''
+    rand = random.Random(seed)
+    return [['a' if rand.random() < density else 'd' for _ in range(ncol)]
+            for _ in range(nrow)]
+
+def grid_cases(args):
+    '''
+    (description, grid) for every size x (density or pattern)
+    '''
+    for size in args.sizes:
+        for density in args.densities:
+            yield ({'ncol' : size, 'nrow' : size, 'density' : density},
+                   random_grid(size, size, density, args.seed))
+        for name in args.patterns:
+            try:
+                grid = pattern_grid(name, size, size)
+            except ValueError:
+                # pattern is bigger than the grid
+                continue
+            yield {'ncol' : size, 'nrow' : size, 'pattern' : name}, grid
+
+def best_time(func, repeats, setup=None):
+    '''
+    fastest of repeats calls of func in seconds
+    setup is called before each call without being timed
+    '''
+    best = None
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def time_world(engine, grid, repeats):
+    '''
+    time the World methods on a copy of grid
+    every timed step starts again from grid, so dirty cell tracking
+    can't shrink later repeats to the cells still changing
+    returns {benchmark : seconds}
+    '''
+    world = World(len(grid[0]), len(grid), engine)
+    world.set_grid(grid)
+    timings = {}
+
+    def reset():
+        world.set_grid(grid)
+        # the population scan after set_grid isn't part of a step
+        world.get_population()
+
+    # neighbor_cell_counter is per call, averaged over a sample of cells
+    rand = random.Random(0)
+    cells = [(rand.randrange(world.numX), rand.randrange(world.numY))
+             for _ in range(1000)]
+
+    def count_neighbors():
+        for x, y in cells:
+            world.neighbor_cell_counter(x, y)
+
+    timings['neighbor_cell_counter'] = (best_time(count_neighbors, repeats) /
+                                        len(cells))
+    mark = []
+    clean = []
+    for _ in range(repeats):
+        reset()
+        start = time.perf_counter()
+        world.mark_for_transition()
+        middle = time.perf_counter()
+        world.clean_up_grid()
+        mark.append(middle - start)
+        clean.append(time.perf_counter() - middle)
+    timings['mark_for_transition'] = min(mark)
+    timings['clean_up_grid'] = min(clean)
+    timings['generation'] = best_time(world.step, repeats, reset)
+    if hasattr(world, 'close'):
+        world.close()
+    return timings
+
+def time_draw(engine, grid, repeats, render_mode='rects'):
+    '''
+    seconds for DisplayWorld.draw_world, None if the grid doesn't fit
+    in the window at 1 pixel per cell
+    '''
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    display_world = DisplayWorld(len(grid[0]), len(grid), 't', grid,
+                                 engine=engine, render_mode=render_mode)
+    try:
+        if display_world.get_scale() < 1:
+            return None
+        # every frame draws the whole grid, like the first frame
+        def draw():
+            display_world.redraw_world()
+            display_world.draw_world()
+
+        return best_time(draw, repeats)
+    finally:
+        if hasattr(display_world.game_world, 'close'):
+            display_world.game_world.close()
+        import pygame
+        pygame.quit()
+
+def run_benchmarks(args, log=None):
+    '''
+    run every benchmark & return the list of result records
+    '''
+    results = []
+    for description, grid in grid_cases(args):
+        cells = description['ncol'] * description['nrow']
+        for engine in args.engines:
+            timings = time_world(engine, grid, args.repeats)
+            if args.draw:
+                timings['draw_world'] = time_draw(engine, grid, args.repeats,
+                                                  args.render_mode)
+            for benchmark, seconds in timings.items():
+                record = dict(description, engine=engine,
+                              benchmark=benchmark, seconds=seconds)
+                if seconds and benchmark != 'neighbor_cell_counter':
+                    record['cells_per_sec'] = cells / seconds
+                results.append(record)
+                if log:
+                    print(json.dumps(record), file=log)
+    return results
+
+def version():
+    '''
+    git commit of the code being timed, None outside a git checkout
+    '''
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def result_key(record):
+    '''
+    fields that identify the same benchmark in two runs
+    '''
+    return (record['benchmark'], record['engine'], record['ncol'],
+            record['nrow'], record.get('density'), record.get('pattern'))
+
+def compare(old_results, new_results, out=None):
+    '''
+    print how the new timings compare to the old ones
+    returns {key : old seconds / new seconds}
+    '''
+    old = {result_key(record) : record['seconds'] for record in old_results}
+    speedups = {}
+    for record in new_results:
+        key = result_key(record)
+        if old.get(key) and record['seconds']:
+            speedups[key] = old[key] / record['seconds']
+            print(f"{key}: {speedups[key]:.2f}x", file=out)
+    return speedups
+
+def main(argv=None):
+    '''
+    entry point - returns the exit code
+    '''
+    args = parse_args(argv)
+    report = {
+        'version' : version(),
+        'python' : platform.python_version(),
+        'platform' : platform.platform(),
+        'time' : time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results' : run_benchmarks(args, sys.stderr),
+        }
+    if args.output:
+        with open(args.output, 'w') as out_file:
+            json.dump(report, out_file, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    if args.compare:
+        with open(args.compare) as in_file:
+            compare(json.load(in_file)['results'], report['results'],
+                    sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
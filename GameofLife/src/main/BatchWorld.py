@@ -0,0 +1,189 @@
+'''
+
+Batch of independent Game of Life boards stepped together
+N boards of the same size are stacked into one N x nrow x ncol array of
+0 / 1 cells, so one vectorized call steps every board. Used for soup
+searches & parameter sweeps over many seeds
+
+board i seeded from seeds[i] is the same grid World gives after
+    random.seed(seeds[i])
+    world.set_random_grid()
+so any board can be replayed in a regular World
+
+Created on Oct 18, 2026
+
+'''
+
+import random
+import numpy as np
+from main.GameofLife import BOUNDARIES
+from main.NumpyEngine import neighbor_sums, cell_keys, PAD_MODES
+from main.Rules import get_rule
+
+class BatchWorld:
+    '''
+    stack of boards with the same edges as World - see BOUNDARIES
+    '''
+
+    def __init__(self, ncol, nrow, seeds, max_period=64, rule=None,
+                 boundary='dead'):
+        '''
+        constructor - one random board per seed
+        Parameters
+        ncol, nrow = size of every board
+        seeds = list of seeds, one per board
+        max_period = longest oscillator period that is looked for
+        rule = B/S rule, Conway's B3/S23 if None
+        boundary = what lies past the edges of every board
+        '''
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"unknown boundary {boundary}")
+        self.boundary = boundary
+        self.rule = get_rule(rule)
+        # next cell state at index alive * 9 + neighbor count
+        self._table = np.array(self.rule.next_state,
+                               dtype=np.uint8).ravel()
+        self.numX = ncol
+        self.numY = nrow
+        self.seeds = list(seeds)
+        self.max_period = max_period
+        self.generation = 0
+        self.grid = np.zeros((len(self.seeds), nrow, ncol), dtype=np.uint8)
+        for board, seed in enumerate(self.seeds):
+            rand = random.Random(seed)
+            # same draw order as World.set_random_grid
+            cells = [rand.random() <= 0.5 for _ in range(nrow * ncol)]
+            self.grid[board] = np.array(cells, dtype=np.uint8).reshape(
+                nrow, ncol)
+        # 0 until the board repeats, then the length of its cycle
+        self.periods = np.zeros(len(self.seeds), dtype=np.int64)
+        # generation the board first repeated an earlier grid, -1 if not yet
+        self.first_repeat = np.full(len(self.seeds), -1, dtype=np.int64)
+        # Zobrist key of every cell, so a board hashes like World.get_hash
+        ys, xs = np.indices((nrow, ncol))
+        self._keys = cell_keys(xs, ys)
+        # per board, a ring of the grid hashes of the last max_period
+        # generations & the generation each was seen at, -1 if empty
+        self._hashes = np.zeros((len(self.seeds), max_period),
+                                dtype=np.uint64)
+        self._seen = np.full((len(self.seeds), max_period), -1,
+                             dtype=np.int64)
+        self.record_history()
+
+    def get_size(self):
+        '''
+        number of boards
+        '''
+        return len(self.seeds)
+
+    def get_board(self, board):
+        '''
+        board in the World nested list format for World.set_grid
+        '''
+        return [['a' if cell else 'd' for cell in row]
+                for row in self.grid[board].tolist()]
+
+    def set_board(self, board, in_list):
+        '''
+        replace a board with a grid in the World nested list format
+        its repeat history starts over
+        '''
+        if len(in_list) == self.numY and len(in_list[0]) == self.numX:
+            self.grid[board] = np.array(
+                [[cell == 'a' or cell == 'z' for cell in row]
+                 for row in in_list], dtype=np.uint8)
+            self.periods[board] = 0
+            self.first_repeat[board] = -1
+            self._seen[board] = -1
+            slot = self.generation % self.max_period
+            self._hashes[board, slot] = self.get_hashes()[board]
+            self._seen[board, slot] = self.generation
+        else:
+            raise Exception("set_board ERROR - incorrect list dimensions")
+
+    def get_populations(self):
+        '''
+        number of live cells on each board
+        '''
+        return self.grid.sum(axis=(1, 2))
+
+    def get_extinct(self):
+        '''
+        True for boards with no live cells
+        '''
+        return ~self.grid.any(axis=(1, 2))
+
+    def get_periods(self):
+        '''
+        period of each board - 0 if no repeat found yet, 1 for still
+        lifes & extinct boards, n for a period n oscillator
+        '''
+        return self.periods.copy()
+
+    def get_first_repeat(self):
+        '''
+        generation each board first repeated an earlier grid, -1 if not yet
+        '''
+        return self.first_repeat.copy()
+
+    def get_settled(self):
+        '''
+        True for boards whose outcome is known
+        '''
+        return self.periods > 0
+
+    def get_hashes(self):
+        '''
+        grid hash of each board, the same as World.get_hash
+        '''
+        return np.bitwise_xor.reduce(
+            np.where(self.grid != 0, self._keys, np.uint64(0)),
+            axis=(1, 2))
+
+    def record_history(self):
+        '''
+        hash the boards that haven't settled & look for repeats, for
+        every board at once
+        extinct boards settle with period 1 the generation they die out,
+        as in World.record_generation
+        only the last max_period generations are kept per board
+        '''
+        running = self.periods == 0
+        hashes = self.get_hashes()
+        extinct = running & ~self.grid.any(axis=(1, 2))
+        matches = ((self._hashes == hashes[:, None]) & (self._seen >= 0) &
+                   running[:, None])
+        # a board can't match twice - it would have settled the first time
+        repeated = matches.any(axis=1)
+        seen = self._seen[repeated, matches[repeated].argmax(axis=1)]
+        self.periods[repeated] = self.generation - seen
+        self.periods[extinct] = 1
+        settled = repeated | extinct
+        self.first_repeat[settled] = self.generation
+        # the slot of the oldest generation is written over
+        slot = self.generation % self.max_period
+        record = running & ~settled
+        self._hashes[record, slot] = hashes[record]
+        self._seen[record, slot] = self.generation
+
+    def step(self):
+        '''
+        advance every board by one generation
+        '''
+        counts = neighbor_sums(np.pad(self.grid, ((0, 0), (1, 1), (1, 1)),
+                                      mode=PAD_MODES[self.boundary]))
+        self.grid = self._table.take(self.grid * 9 + counts)
+        self.generation += 1
+        self.record_history()
+
+    def run(self, generations, stop_when_settled=True):
+        '''
+        step the boards up to generations times
+        stops early once every board has settled if stop_when_settled
+        returns the number of generations stepped
+        '''
+        for done in range(generations):
+            if stop_when_settled and self.get_settled().all():
+                return done
+            self.step()
+        return generations
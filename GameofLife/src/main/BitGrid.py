@@ -0,0 +1,519 @@
+'''
+
+Bit-packed storage for the Game of Life World
+two bit planes with 1 bit per cell instead of a python str per cell
+
+    alive plane : cell counts as a live neighbor ('a' or 'z')
+    marks plane : transient mark for the next half-step ('z' or 'e')
+
+             alive  marks
+        'd'    0      0
+        'a'    1      0
+        'e'    0      1
+        'z'    1      1
+
+each row starts on a byte boundary & cell x of a row is bit x of the
+row read as a little-endian integer, so a whole row can be stepped
+with python integer bit operations
+
+Created on Oct 18, 2026
+
+'''
+
+import copy
+import random
+from main.GameofLife import World, cell_key, ghost_indices
+
+# (alive bit | marks bit << 1) -> cell state character
+_states = 'daez'
+# cell state character -> cell state after set_cell - e > a > z > d > e
+_next_state = {'e' : 'a', 'a' : 'z', 'z' : 'd', 'd' : 'e'}
+# cell state character -> binary digit of its alive bit
+_alive_digits = str.maketrans('daze', '0110')
+
+def add_bits(inputs):
+    '''
+    bit-sliced sum of one bit inputs
+    returns the bit planes of the sum, least significant plane first
+    Parameter
+    inputs = list of ints, each bit is a separate one bit input
+    '''
+    planes = []
+    for carry in inputs:
+        for i in range(len(planes)):
+            if not carry:
+                break
+            planes[i], carry = planes[i] ^ carry, planes[i] & carry
+        if carry:
+            planes.append(carry)
+    return planes
+
+def count_equals(planes, count, mask):
+    '''
+    bits where the bit-sliced sum in planes equals count
+    Parameter
+    planes = bit planes from add_bits
+    count = value to compare against
+    mask = bits that are inside the grid
+    '''
+    if count >> len(planes):
+        return 0
+    result = mask
+    for i, plane in enumerate(planes):
+        result &= plane if (count >> i) & 1 else ~plane
+    return result
+
+def pack_alive(world):
+    '''
+    live cells of any World engine packed like the BitGrid alive plane
+    '''
+    grid = world.grid
+    if isinstance(grid, BitGrid):
+        return bytes(grid.alive)
+    if hasattr(grid, 'shape'):
+        import numpy as np
+        return np.packbits(grid & 1, axis=1, bitorder='little').tobytes()
+    stride = (world.numX + 7) // 8
+    if hasattr(world, 'alive'):
+        # sparse engine - only the live cells inside the grid
+        packed = bytearray(stride * world.numY)
+        for x, y in world.alive:
+            if 0 <= x < world.numX and 0 <= y < world.numY:
+                packed[y * stride + (x >> 3)] |= 1 << (x & 7)
+        return bytes(packed)
+    # nested list engines - each row read through the view, no copy of
+    # the grid, & packed from its binary digits, last cell first
+    packed = bytearray()
+    for row in world.get_view():
+        digits = ''.join(row)[::-1].translate(_alive_digits)
+        packed += int(digits or '0', 2).to_bytes(stride, 'little')
+    return bytes(packed)
+
+class BitGrid:
+    '''
+    2 bit planes of numX x numY cells packed 8 cells per byte
+    '''
+
+    def __init__(self, ncol, nrow, buffer=None):
+        '''
+        constructor - all cells dead
+        Parameters
+        ncol
+        nrow
+        buffer = writable buffer of 2 * stride * nrow bytes to hold the
+            alive plane then the marks plane, eg a memory mapped file.
+            It is used as is, new bytearrays are made if None
+        '''
+        self.numX = ncol
+        self.numY = nrow
+        # bytes per row
+        self.stride = (ncol + 7) // 8
+        size = self.stride * nrow
+        if buffer is None:
+            self.alive = bytearray(size)
+            self.marks = bytearray(size)
+        else:
+            view = memoryview(buffer)
+            self.alive = view[:size]
+            self.marks = view[size:2 * size]
+
+    @classmethod
+    def from_nested_list(cls, in_list):
+        '''
+        build a BitGrid from the World nested list format
+        '''
+        bit_grid = cls(len(in_list[0]) if in_list else 0, len(in_list))
+        for y, row in enumerate(in_list):
+            alive = 0
+            marks = 0
+            for x, cell in enumerate(row):
+                if cell == 'a' or cell == 'z':
+                    alive |= 1 << x
+                if cell == 'z' or cell == 'e':
+                    marks |= 1 << x
+            bit_grid.put_row(bit_grid.alive, y, alive)
+            bit_grid.put_row(bit_grid.marks, y, marks)
+        return bit_grid
+
+    def copy(self):
+        '''
+        BitGrid with its own copies of both planes
+        '''
+        grid = BitGrid(self.numX, self.numY)
+        grid.alive[:] = self.alive
+        grid.marks[:] = self.marks
+        return grid
+
+    def readonly(self):
+        '''
+        BitGrid sharing both planes through read-only memoryviews
+        '''
+        view = copy.copy(self)
+        view.alive = memoryview(self.alive).toreadonly()
+        view.marks = memoryview(self.marks).toreadonly()
+        return view
+
+    def to_nested_list(self):
+        '''
+        convert to the World nested list format
+        '''
+        out_list = []
+        for y in range(self.numY):
+            alive = self.get_row(self.alive, y)
+            marks = self.get_row(self.marks, y)
+            out_list.append([_states[((alive >> x) & 1) |
+                                     (((marks >> x) & 1) << 1)]
+                             for x in range(self.numX)])
+        return out_list
+
+    def get_row(self, plane, y):
+        '''
+        row y of plane as an int - bit x is cell x
+        '''
+        start = y * self.stride
+        return int.from_bytes(plane[start:start + self.stride], 'little')
+
+    def put_row(self, plane, y, value):
+        '''
+        overwrite row y of plane with the bits of value
+        '''
+        start = y * self.stride
+        plane[start:start + self.stride] = value.to_bytes(self.stride,
+                                                          'little')
+
+    def get_state(self, x, y):
+        '''
+        cell state character for pos x,y - pos must be inside the grid
+        '''
+        i = y * self.stride + (x >> 3)
+        bit = x & 7
+        return _states[((self.alive[i] >> bit) & 1) |
+                       (((self.marks[i] >> bit) & 1) << 1)]
+
+    def put_state(self, x, y, state):
+        '''
+        store cell state character for pos x,y
+        '''
+        i = y * self.stride + (x >> 3)
+        bit = 1 << (x & 7)
+        if state == 'a' or state == 'z':
+            self.alive[i] |= bit
+        else:
+            self.alive[i] &= ~bit
+        if state == 'z' or state == 'e':
+            self.marks[i] |= bit
+        else:
+            self.marks[i] &= ~bit
+
+class BitWorld(World):
+    '''
+    World that stores the grid in a BitGrid
+    about 2 bits per cell instead of a pointer per cell
+    '''
+
+    def __init__(self, ncol, nrow, engine='bitpacked', rule=None,
+                 boundary='dead', step_mode='buffered'):
+        super().__init__(ncol, nrow, engine, rule, boundary, step_mode)
+
+    def set_rule(self, rule):
+        '''
+        change the rule - the neighbor counts of its births & survivals
+        are what mark_for_transition compares the bit-sliced sums with
+        '''
+        super().set_rule(rule)
+        self._birth = sorted(self.rule.birth)
+        self._survival = sorted(self.rule.survival)
+
+    def empty_grid(self):
+        '''
+        new grid of dead cells
+        '''
+        return BitGrid(self.numX, self.numY)
+
+    def set_grid(self, in_list):
+        '''
+        seed grid with values from a nested list of cell states
+        '''
+        if len(in_list) == self.numY and len(in_list[0]) == self.numX:
+            self.grid = BitGrid.from_nested_list(in_list)
+            self.grid_changed()
+        else:
+            raise Exception("set_grid ERROR - incorrect list dimensions")
+
+    def clear_grid(self):
+        '''
+        clear the grid in between unit tests
+        '''
+        self.grid = BitGrid(0, 0)
+        self.grid_changed()
+
+    def view_of(self, grid):
+        '''
+        read-only view of grid storage - a BitGrid over memoryviews of
+        its planes, not copied
+        '''
+        return grid.readonly()
+
+    @staticmethod
+    def grid_from_view(view, ncol, nrow):
+        '''
+        World nested list format of a BitGrid
+        '''
+        return view.to_nested_list()
+
+    def copy_grid(self, grid):
+        '''
+        copy of grid storage
+        '''
+        return grid.copy()
+
+    def get_cell(self, x, y):
+        '''
+        return the state of the cell for pos x,y
+        if pos x,y is outside the grid, return dead
+        '''
+        if (x >= 0 and x < self.numX) and (y >= 0 and y < self.numY):
+            return self.grid.get_state(x, y)
+        else:
+            return 'd'
+
+    def neighbor_cell_counter(self, xpos, ypos):
+        '''
+        number of live & zombie neighbors of the cell at xpos,ypos
+        the neighbor rows & columns come from set_boundary
+        '''
+        alive = self.grid.alive
+        stride = self.grid.stride
+        cols = [(x >> 3, x & 7) for x in self._neighbor_cols[xpos]]
+        total = 0
+        for y in self._neighbor_rows[ypos]:
+            start = y * stride
+            for byte, bit in cols:
+                total += (alive[start + byte] >> bit) & 1
+        start = ypos * stride + (xpos >> 3)
+        return total - ((alive[start] >> (xpos & 7)) & 1)
+
+    def put_run(self, x, y, length):
+        '''
+        set cells x to x+length-1 of row y alive, skipping cells outside
+        the grid - call grid_changed once all the runs are in
+        '''
+        start = max(x, 0)
+        end = min(x + length, self.numX)
+        if 0 <= y < self.numY and start < end:
+            self.own_grid()
+            run = ((1 << (end - start)) - 1) << start
+            self.grid.put_row(self.grid.alive, y,
+                              self.grid.get_row(self.grid.alive, y) | run)
+
+    def put_block(self, x, y, block):
+        '''
+        set the cells of a 2-D 0 / 1 numpy array alive with its upper
+        left corner at x, y - packed into the alive plane all at once
+        '''
+        import numpy as np
+        height, width = block.shape
+        rows = np.zeros((height, self.numX), dtype=np.uint8)
+        rows[:, x:x + width] = block
+        self.or_rows(y, rows)
+
+    def or_rows(self, top, rows):
+        '''
+        set the cells of the numX wide 0 / 1 numpy rows alive, starting
+        at row top
+        '''
+        import numpy as np
+        self.own_grid()
+        packed = np.packbits(rows, axis=1, bitorder='little')
+        alive = np.frombuffer(self.grid.alive, dtype=np.uint8)
+        stride = self.grid.stride
+        alive[top * stride:(top + len(rows)) * stride] |= packed.ravel()
+
+    def put_runs(self, xs, ys, lengths):
+        '''
+        put_run for each x, y, length - numpy arrays are packed into the
+        alive plane all at once
+        '''
+        if not hasattr(ys, 'shape'):
+            return super().put_runs(xs, ys, lengths)
+        from main.NumpyEngine import runs_mask
+        if len(ys):
+            top = max(int(ys.min()), 0)
+            bottom = min(int(ys.max()) + 1, self.numY)
+            if top < bottom:
+                self.or_rows(top, runs_mask(self.numX, bottom - top,
+                                            xs, ys - top, lengths))
+
+    def set_cell(self, x, y):
+        '''
+        change the cell state in the order e > a > z > d > e
+        '''
+        self.own_grid()
+        state = self.grid.get_state(x, y)
+        self.grid.put_state(x, y, _next_state[state])
+        if state == 'e':
+            self.toggle_alive(x, y, True)
+        elif state == 'z':
+            self.toggle_alive(x, y, False)
+
+    def set_random_cell(self, x, y):
+        '''
+        set cell to a or d randomly
+        draws from random the same way World does so seeds match
+        '''
+        self.own_grid()
+        was_alive = self.grid.get_state(x, y) in ('a', 'z')
+        self.grid.put_state(x, y, 'a' if random.random() <= 0.5 else 'd')
+        if was_alive != (self.grid.get_state(x, y) == 'a'):
+            self.toggle_alive(x, y, not was_alive)
+
+    def hash_row(self, y, row):
+        '''
+        xor of the Zobrist keys & count of the cells set in row y
+        '''
+        key = 0
+        count = 0
+        while row:
+            low = row & -row
+            key ^= cell_key(low.bit_length() - 1, y)
+            count += 1
+            row ^= low
+        return key, count
+
+    def hash_bits(self, plane):
+        '''
+        xor of the Zobrist keys & count of the cells set in plane
+        '''
+        key = 0
+        count = 0
+        for y in range(self.numY):
+            row_key, row_count = self.hash_row(y, self.grid.get_row(plane, y))
+            key ^= row_key
+            count += row_count
+        return key, count
+
+    def rehash(self):
+        '''
+        work out the grid hash & population from the alive plane
+        '''
+        self._hash, self._population = self.hash_bits(self.grid.alive)
+
+    def get_bounding_box(self):
+        '''
+        (x, y, width, height) of the live cells, None if there are none
+        the columns come from the OR of the live rows
+        '''
+        grid = self.grid
+        union = 0
+        rows = []
+        for y in range(self.numY):
+            row = grid.get_row(grid.alive, y)
+            if row:
+                union |= row
+                rows.append(y)
+        if not rows:
+            return None
+        left = (union & -union).bit_length() - 1
+        return (left, rows[0], union.bit_length() - left,
+                rows[-1] - rows[0] + 1)
+
+    def mark_for_transition(self):
+        '''
+        first half-step - mark cell for birth/death
+        '''
+        self.cells_evaluated = self.numX * self.numY
+        self.own_grid()
+        grid = self.grid
+        for y, _, marks, change in self.row_changes():
+            grid.put_row(grid.marks, y, marks | change)
+
+    def step_buffered(self):
+        '''
+        one pass - each row's flips go straight into the alive plane
+        every row is read before any is written, so the alive plane
+        needs no second buffer, & no marks are stored
+        '''
+        self.cells_evaluated = self.numX * self.numY
+        self.own_grid()
+        grid = self.grid
+        marked = False
+        for y, row, marks, change in self.row_changes():
+            flips = marks | change
+            marked = marked or marks
+            if flips:
+                grid.put_row(grid.alive, y, row ^ flips)
+                if self._population is not None:
+                    if self._hash is not None:
+                        self._hash ^= self.hash_row(y, flips)[0]
+                    count = flips.bit_count()
+                    self._population += count - 2 * (flips & row).bit_count()
+                    self._flips += count
+        if marked:
+            grid.marks[:] = bytes(len(grid.marks))
+
+    def row_changes(self):
+        '''
+        yields y, the alive row, the marks row & the unmarked cells of
+        the row that change this generation, for every row
+        a whole row is done at once with bit-sliced neighbor sums
+        the rows are padded with the ghost cells of the boundary first
+        so the sums never check for the edges
+        '''
+        grid = self.grid
+        mask = (1 << self.numX) - 1
+        rows = [grid.get_row(grid.alive, y) for y in range(self.numY)]
+        # each row moved up a bit with its ghost cells either side, so
+        # bit x is the left neighbor of cell x & bit x + 2 the right one
+        left, *_, right = ghost_indices(self.numX, self.boundary)
+        if left is None:
+            padded = [row << 1 for row in rows]
+        else:
+            padded = [(row << 1) | ((row >> left) & 1) |
+                      (((row >> right) & 1) << (self.numX + 1))
+                      for row in rows]
+        # dead ghost rows read the empty row added at the end
+        rows.append(0)
+        padded.append(0)
+        ghost_rows = [self.numY if y is None else y
+                      for y in ghost_indices(self.numY, self.boundary)]
+        for y in range(self.numY):
+            row = rows[y]
+            above = ghost_rows[y]
+            below = ghost_rows[y + 2]
+            planes = add_bits([padded[above], rows[above],
+                               padded[above] >> 2,
+                               padded[y], padded[y] >> 2,
+                               padded[below], rows[below],
+                               padded[below] >> 2])
+            born = 0
+            for count in self._birth:
+                born |= count_equals(planes, count, mask)
+            survive = 0
+            for count in self._survival:
+                survive |= count_equals(planes, count, mask)
+            marks = grid.get_row(grid.marks, y)
+            # only 'a' & 'd' cells can be marked
+            unmarked = ~marks & mask
+            change = ((row & unmarked & ~survive) |
+                      (~row & unmarked & born))
+            yield y, row, marks, change
+
+    def clean_up_grid(self):
+        '''
+        second half-step - kill off zombies & vivify embryo cells
+        marked cells flip their alive bit, done on the whole plane at once
+        '''
+        self.own_grid()
+        grid = self.grid
+        size = len(grid.alive)
+        alive = int.from_bytes(grid.alive, 'little')
+        marks = int.from_bytes(grid.marks, 'little')
+        if self._population is not None:
+            if self._hash is not None:
+                self._hash ^= self.hash_bits(grid.marks)[0]
+            # marked cells that are alive die, the rest are born
+            self._population += (marks.bit_count() -
+                                 2 * (alive & marks).bit_count())
+            self._flips += marks.bit_count()
+        grid.alive[:] = (alive ^ marks).to_bytes(size, 'little')
+        grid.marks[:] = bytes(size)
@@ -0,0 +1,138 @@
+'''
+
+Neighbor count cache backend for the Game of Life World
+the grid is World's nested lists plus the live neighbor count of every
+cell, kept up to date as cells are born & die - a birth adds 1 to the
+counts of its 8 neighbors & a death takes 1 away
+
+a generation reads each active cell's count instead of summing its
+neighborhood, & only the cells around the cells that changed are active
+the next generation, so a settling board costs its changes not its area
+
+    counts[y][x] : live & zombie neighbors of cell x,y - None until the
+                   first step after the grid changed, then built once
+
+Created on Oct 18, 2026
+
+'''
+
+from main.GameofLife import World, _alive
+
+class CountedWorld(World):
+    '''
+    World that caches every cell's neighbor count
+    '''
+
+    def __init__(self, ncol, nrow, engine='counted', rule=None,
+                 boundary='dead', step_mode='buffered'):
+        self.counts = None
+        super().__init__(ncol, nrow, engine, rule, boundary, step_mode)
+
+    def set_boundary(self, boundary):
+        '''
+        change what lies past the grid edges
+        the cells' neighbors change so the counts are built again
+        '''
+        super().set_boundary(boundary)
+        self.counts = None
+
+    def grid_changed(self):
+        '''
+        the whole grid was replaced - the counts are built again
+        '''
+        super().grid_changed()
+        self.counts = None
+
+    def get_counts(self):
+        '''
+        the neighbor counts, built from the live cells if not cached
+        '''
+        if self.counts is None:
+            self.counts = [[0] * self.numX for _ in range(self.numY)]
+            for y, row in enumerate(self.grid):
+                for x, cell in enumerate(row):
+                    if _alive[cell]:
+                        self.add_neighbor(x, y, 1)
+        return self.counts
+
+    def add_neighbor(self, x, y, delta):
+        '''
+        add delta to the counts of the neighbors of cell x,y
+        delta is 1 when it starts counting as alive & -1 when it stops
+        the ghost cells past the edges come from set_boundary, so a
+        neighbor seen twice on a small torus is counted twice
+        '''
+        counts = self.counts
+        cols = self._neighbor_cols[x]
+        for ny in self._neighbor_rows[y]:
+            row = counts[ny]
+            for nx in cols:
+                row[nx] += delta
+        # the cell was counted with its neighbors
+        counts[y][x] -= delta
+
+    def neighbor_cell_counter(self, xpos, ypos):
+        '''
+        number of live & zombie neighbors of the cell at xpos,ypos
+        read from the cache
+        '''
+        return self.get_counts()[ypos][xpos]
+
+    def set_cell(self, x, y):
+        '''
+        change the cell state in the order e > a > z > d > e
+        the counts change when the cell starts or stops counting as alive
+        '''
+        state = self.get_cell(x, y)
+        super().set_cell(x, y)
+        delta = _alive[self.grid[y][x]] - _alive[state]
+        if delta and self.counts is not None:
+            self.add_neighbor(x, y, delta)
+
+    def set_random_cell(self, x, y):
+        '''
+        set cell to a or d randomly
+        '''
+        state = self.get_cell(x, y)
+        super().set_random_cell(x, y)
+        delta = _alive[self.grid[y][x]] - _alive[state]
+        if delta and self.counts is not None:
+            self.add_neighbor(x, y, delta)
+
+    def step_buffered(self):
+        '''
+        one pass over the active cells looking up the next state from
+        each cell's cached count, then the cells that change are
+        written & their neighbors' counts updated
+        every next state is worked out before any count changes, so the
+        grid needs no second buffer
+        '''
+        counts = self.get_counts()
+        cells = self.active_cells()
+        dirty = self._dirty = set()
+        self.cells_evaluated = len(cells)
+        next_states = self._next_states
+        grid = self.grid
+        changes = []
+        for x, y in cells:
+            state = grid[y][x]
+            new_state = next_states[state][counts[y][x]]
+            if new_state != state:
+                changes.append((x, y, state, new_state))
+        if not changes:
+            return
+        self.own_grid()
+        grid = self.grid
+        rows = self._neighbor_rows
+        cols = self._neighbor_cols
+        for x, y, state, new_state in changes:
+            grid[y][x] = new_state
+            delta = _alive[new_state] - _alive[state]
+            if delta:
+                self.toggle_alive(x, y, delta > 0)
+                for ny in rows[y]:
+                    row = counts[ny]
+                    for nx in cols[x]:
+                        row[nx] += delta
+                        dirty.add((nx, ny))
+                counts[y][x] -= delta
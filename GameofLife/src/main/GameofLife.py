@@ -13,10 +13,27 @@ cell values - 'd' : not alive
 @author: Paul Taniguchi
 '''
 
+import time
 import random
-import pygame
-import pygame.freetype as freetype
+import weakref
+import importlib
 from enum import Enum
+from collections import namedtuple
+from collections.abc import Sequence
+from main.Rules import get_rule
+
+# pygame is only imported once a DisplayWorld is built so headless
+# runs of World don't need a display or pay the pygame start up cost
+pygame = None
+freetype = None
+
+def load_pygame():
+    '''
+    import pygame & pygame.freetype into this module
+    '''
+    global pygame, freetype
+    import pygame
+    import pygame.freetype as freetype
 
 # where grid_type is
 # t = Test Grid
@@ -32,6 +49,199 @@ def copy_nested_list(orig_list):
     '''
     return [lst.copy() for lst in orig_list]
 
+_mask64 = (1 << 64) - 1
+
+def cell_key(x, y):
+    '''
+    64 bit Zobrist key of a live cell at x,y
+    the grid hash is the xor of the keys of all live cells, so a cell
+    being born or dying updates it with one xor
+    keys come from splitmix64 of the packed coords so no table is needed
+    see https://en.wikipedia.org/wiki/Zobrist_hashing
+    '''
+    z = ((((x & 0xffffffff) << 32) | (y & 0xffffffff)) +
+         0x9e3779b97f4a7c15) & _mask64
+    z = ((z ^ (z >> 30)) * 0xbf58476d1ce4e5b9) & _mask64
+    z = ((z ^ (z >> 27)) * 0x94d049bb133111eb) & _mask64
+    return z ^ (z >> 31)
+
+# backends that World can pick at construction
+# name : (module, class) - the module is only imported when the engine
+# is asked for so optional dependencies (eg numpy) stay optional
+_engines = {
+    'numpy' : ('main.NumpyEngine', 'NumpyWorld'),
+    'bitpacked' : ('main.BitGrid', 'BitWorld'),
+    'tiled' : ('main.TiledEngine', 'TiledWorld'),
+    'sparse' : ('main.SparseWorld', 'SparseWorld'),
+    'mapped' : ('main.MappedWorld', 'MappedWorld'),
+    'counted' : ('main.CountedWorld', 'CountedWorld'),
+    'jit' : ('main.JitEngine', 'JitWorld'),
+    }
+
+def get_engine(name):
+    '''
+    return the World class that implements engine name
+    Parameter
+    name = 'python' for the nested list World or a key of _engines
+    '''
+    if name == 'python':
+        return World
+    if name not in _engines:
+        raise ValueError(f"unknown engine {name}")
+    module_name, class_name = _engines[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+# what the cells past the grid edges are
+# dead    - always dead, the original World edges
+# torus   - the cells on the opposite edge, the grid wraps around
+# reflect - the edge cells mirrored, so each edge cell neighbors itself
+BOUNDARIES = ('dead', 'torus', 'reflect')
+
+def ghost_indices(size, boundary):
+    '''
+    source index of each position along an axis padded with a ghost
+    cell at both ends - position p is index p - 1 of the axis
+    dead ghosts are None
+    Parameters
+    size = number of cells along the axis
+    boundary = one of BOUNDARIES
+    '''
+    if boundary not in BOUNDARIES:
+        raise ValueError(f"unknown boundary {boundary}")
+    if boundary == 'dead' or size == 0:
+        ghosts = (None, None)
+    elif boundary == 'torus':
+        ghosts = (size - 1, 0)
+    else:
+        ghosts = (0, size - 1)
+    return [ghosts[0]] + list(range(size)) + [ghosts[1]]
+
+def neighbor_indices(size, boundary):
+    '''
+    for each index along an axis, the indices of itself & the cells on
+    either side with the ghost cells already resolved, so neighbor
+    loops never check for the edges - dead ghosts are left out
+    '''
+    padded = ghost_indices(size, boundary)
+    return [tuple(index for index in padded[i:i + 3] if index is not None)
+            for i in range(size)]
+
+# how step moves the world on a generation
+# buffered  - one pass reading the grid & writing the next generation
+#             into a second buffer, then the buffers are swapped
+# halfsteps - mark_for_transition then clean_up_grid through the
+#             'z' & 'e' states, for code that inspects the half steps
+STEP_MODES = ('buffered', 'halfsteps')
+
+# 1 for the cell states that count as a live neighbor
+_alive = {'a' : 1, 'z' : 1, 'd' : 0, 'e' : 0}
+
+# live counts of the world after its last step - see World.get_stats
+#     generation : generations stepped since the grid was set
+#     population : number of live cells
+#     births, deaths : cells born & died in the last step
+#     bounding_box : (x, y, width, height) of the live cells, None if
+#         there are none
+#     step_time : seconds the last step took
+Stats = namedtuple('Stats', ['generation', 'population', 'births', 'deaths',
+                             'bounding_box', 'step_time'])
+
+def centered_region(ncol, nrow, width, height=None):
+    '''
+    (x, y, width, height) of a width x height rectangle, a square if
+    height is None, in the middle of a ncol x nrow grid
+    for World.seed_random
+    '''
+    if height is None:
+        height = width
+    return ((ncol - width) // 2, (nrow - height) // 2, width, height)
+
+class RowView(Sequence):
+    '''
+    read-only view of one row of a World nested list grid
+    '''
+
+    def __init__(self, row):
+        self._row = row
+
+    def __getitem__(self, x):
+        return self._row[x]
+
+    def __len__(self):
+        return len(self._row)
+
+    def __iter__(self):
+        return iter(self._row)
+
+    def __eq__(self, other):
+        if isinstance(other, RowView):
+            other = other._row
+        elif not isinstance(other, list):
+            other = list(other)
+        return self._row == other
+
+class GridView(Sequence):
+    '''
+    read-only view of a World nested list grid without copying it
+    view[y][x] is the state character of cell x,y
+    '''
+
+    def __init__(self, grid):
+        self._grid = grid
+
+    def __getitem__(self, y):
+        return RowView(self._grid[y])
+
+    def __len__(self):
+        return len(self._grid)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def tolist(self):
+        '''
+        nested list copy of the grid
+        '''
+        return copy_nested_list(self._grid)
+
+class GridSnapshot:
+    '''
+    one generation of a World held without copying the grid up front
+    the snapshot shares the world's storage & the world swaps in a
+    copy of its own before changing shared storage in place, so a
+    snapshot never changes - copy on write
+    engines whose storage can't be swapped, shared memory or a mapped
+    file, copy it when the snapshot is taken
+    '''
+
+    def __init__(self, world):
+        '''
+        constructor - use World.snapshot
+        '''
+        self.numX = world.numX
+        self.numY = world.numY
+        self.generation = world.get_generation()
+        self.population = world.get_population()
+        # the snapshot doesn't turn cycle detection on
+        self.outcome = (world.get_outcome() if world.detect_cycles
+                        else 'running')
+        # the storage the world checks before changing it in place
+        self.storage, self._view = world.share_grid()
+        self._grid_from_view = world.grid_from_view
+
+    def get_view(self):
+        '''
+        read-only view of the grid - the same kind as World.get_view of
+        the engine that took the snapshot
+        '''
+        return self._view
+
+    def get_grid(self):
+        '''
+        the grid in the World nested list format, a new copy every call
+        '''
+        return self._grid_from_view(self._view, self.numX, self.numY)
+
 class DisplayState(Enum):
     PAUSED = 0
     RUNNING = 1
@@ -40,12 +250,105 @@ class DisplayState(Enum):
 class World:
     
     grid = []
+    # True for engines whose grid lives in memory that can't be swapped
+    # for a copy, so snapshots copy it when taken instead of on write
+    copy_snapshots = False
+    
+    # pick the class for the requested engine
+    # World(ncol, nrow, engine='numpy') returns a NumpyWorld
+    def __new__(cls, ncol, nrow, engine='python', **options):
+        if cls is World:
+            cls = get_engine(engine)
+        return super().__new__(cls)
     
     # constructor - create the grid
-    def __init__(self, ncol, nrow):
+    # engine = backend that stores & steps the grid - see _engines
+    # rule = B/S rule string, name or Rule - Conway's B3/S23 if None
+    # boundary = what lies past the edges - see BOUNDARIES
+    # step_mode = how step works - see STEP_MODES
+    def __init__(self, ncol, nrow, engine='python', rule=None,
+                 boundary='dead', step_mode='buffered'):
+        if step_mode not in STEP_MODES:
+            raise ValueError(f"unknown step mode {step_mode}")
+        self.step_mode = step_mode
+        self.engine = engine
+        # snapshots that may still share the grid storage - see own_grid
+        self._snapshots = weakref.WeakSet()
         self.numY = nrow
         self.numX = ncol
-        self.grid = [ ['d' for _ in range(self.numX)] for _ in range(self.numY)]
+        self.grid = self.empty_grid()
+        # second buffer that step_buffered writes the next generation to
+        # None until the first buffered step after the grid changed
+        self._back = None
+        # cells whose neighborhood changed since the last mark_for_transition
+        # None means every cell has to be evaluated
+        self._dirty = None
+        # cells evaluated by mark_for_transition, for clean_up_grid to
+        # check along with the cells marked since - None after clean up
+        self._marked = None
+        # number of cells evaluated by the last mark_for_transition
+        self.cells_evaluated = 0
+        # grid hash & live cell count, None until first asked for
+        # then kept up to date as cells are born & die
+        # the hash is only kept while get_hash or cycle detection needs it
+        self._hash = None
+        self._population = None
+        # live cells in each row & column, kept with the population by
+        # the nested list engines so get_bounding_box needn't scan
+        self._row_live = None
+        self._col_live = None
+        # cells born or died since the step began, counted wherever the
+        # population is kept up to date
+        self._flips = 0
+        # births, deaths & wall time of the last step
+        self.births = 0
+        self.deaths = 0
+        self.step_time = 0.0
+        # called with the world after every step - see set_step_callback
+        self.step_callback = None
+        # look for still lifes, oscillators & extinction while stepping
+        # off until run with stop_when_settled, the outcome getters or
+        # set_cycle_detection turn it on - see set_cycle_detection
+        self.detect_cycles = False
+        # longest oscillator period looked for - the history of
+        # grid hashes is never longer than this
+        self.max_period = 64
+        self.reset_history()
+        self.set_rule(rule)
+        self.set_boundary(boundary)
+    
+    # change the rule the world is stepped with - see main.Rules
+    # engines override this to compile the rule for their hot path
+    def set_rule(self, rule):
+        self.rule = get_rule(rule)
+        # 1 if a cell flips - _change[alive][neighbor count]
+        self._change = self.rule.change
+        # state next generation - _next_states[state][neighbor count]
+        # marked cells finish their transition like clean_up_grid
+        states = ('d', 'a')
+        self._next_states = {
+            'd' : tuple(states[alive] for alive in self.rule.next_state[0]),
+            'a' : tuple(states[alive] for alive in self.rule.next_state[1]),
+            'e' : ('a',) * 9,
+            'z' : ('d',) * 9}
+        # cells left alone by the old rule may change under the new one
+        self._dirty = None
+        self.reset_history()
+    
+    # change what lies past the grid edges - see BOUNDARIES
+    # the neighbors of every row & column are worked out here once
+    # engines override this to set up their own ghost cells
+    def set_boundary(self, boundary):
+        self._neighbor_rows = neighbor_indices(self.numY, boundary)
+        self._neighbor_cols = neighbor_indices(self.numX, boundary)
+        self.boundary = boundary
+        self._dirty = None
+        self.reset_history()
+    
+    # new grid of dead cells
+    # engines override this to build their own storage
+    def empty_grid(self):
+        return [ ['d' for _ in range(self.numX)] for _ in range(self.numY)]
     
     # seed grid with values from list
     def set_grid(self, in_list):
@@ -53,6 +356,7 @@ class World:
             # make a copy of in_list to avoid changing in_list
             # see https://www.iditect.com/programming/python-example/python-how-to-copy-a-nested-list.html
             self.grid = copy_nested_list(in_list)
+            self.grid_changed()
         else:
             raise Exception("set_grid ERROR - incorrect list dimensions")
         
@@ -61,34 +365,413 @@ class World:
         clear the grid in between unit tests
         '''
         self.grid = []
+        self.grid_changed()
+    
+    # kill every cell, keeping the grid size
+    def reset_grid(self):
+        self.grid = self.empty_grid()
+        self.grid_changed()
+    
+    # set cells x to x+length-1 of row y alive, cells outside the grid
+    # are skipped - for loading patterns straight into the storage
+    # call grid_changed once all the runs are in
+    def put_run(self, x, y, length):
+        if y < 0 or y >= self.numY:
+            return
+        start = max(x, 0)
+        end = min(x + length, self.numX)
+        if start < end:
+            self.own_grid()
+            self.grid[y][start:end] = ['a'] * (end - start)
+    
+    # put_run for each x, y, length - engines override this to write a
+    # whole chunk of a pattern at once
+    def put_runs(self, xs, ys, lengths):
+        for x, y, length in zip(xs, ys, lengths):
+            self.put_run(int(x), int(y), int(length))
+    
+    # set the cells of a 2-D 0 / 1 numpy array alive with its upper left
+    # corner at x, y - the block must fit in the grid
+    # call grid_changed once all the blocks are in
+    def put_block(self, x, y, block):
+        self.own_grid()
+        for row_index, row in enumerate(block.tolist()):
+            grid_row = self.grid[y + row_index]
+            for col_index, cell in enumerate(row):
+                if cell:
+                    grid_row[x + col_index] = 'a'
     
     # random pick which cells are alive / dead
     def set_random_grid(self):    
+        self.grid_changed()
         for y in range(self.numY):
             for x in range(self.numX):
                 self.set_random_cell(x, y)
+    
+    # random soup - cells in region (x, y, width, height), the whole grid
+    # if None, are alive with probability density & the rest are dead
+    # drawn a band of rows at a time with numpy if it is installed, so
+    # the same seed gives the same grid on every engine
+    def seed_random(self, density=0.5, seed=None, region=None):
+        x, y, width, height = region or (0, 0, self.numX, self.numY)
+        if (x < 0 or y < 0 or width < 0 or height < 0 or
+                x + width > self.numX or y + height > self.numY):
+            raise ValueError(f"region {region} is outside the grid")
+        if not 0 <= density <= 1:
+            raise ValueError(f"density {density} is not between 0 and 1")
+        self.reset_grid()
+        try:
+            import numpy as np
+        except ImportError:
+            rand = random.Random(seed)
+            for row in range(y, y + height):
+                for col in range(x, x + width):
+                    if rand.random() < density:
+                        self.put_run(col, row, 1)
+        else:
+            rng = np.random.default_rng(seed)
+            band = max(1, (1 << 22) // max(width, 1))
+            for top in range(0, height, band):
+                rows = min(band, height - top)
+                block = rng.random((rows, width), dtype=np.float32) < density
+                self.put_block(x, y + top, block.view(np.uint8))
+        self.grid_changed()
    
-    # getter for the grid
+    # getter for the grid - a nested list copy, kept for compatibility
+    # get_view & snapshot don't copy the grid
     def get_grid(self):
-        return copy_nested_list(self.grid)
+        return self.grid_from_view(self.get_view(), self.numX, self.numY)
+    
+    # read-only view of the grid without copying it
+    # engines return a view of their own storage
+    # valid until the next step - it shows cells changed by hand, but a
+    # step may swap the storage for a back buffer or a new array, so
+    # take a new view after each step or a snapshot to keep a generation
+    def get_view(self):
+        return self.view_of(self.grid)
+    
+    # read-only view of grid storage - a GridView of the nested lists
+    def view_of(self, grid):
+        return GridView(grid)
+    
+    # nested list copy of a view from get_view, ncol x nrow cells
+    @staticmethod
+    def grid_from_view(view, ncol, nrow):
+        return view.tolist()
+    
+    # copy of grid storage that shares nothing with it
+    def copy_grid(self, grid):
+        return copy_nested_list(grid)
+    
+    # the current generation as a GridSnapshot without copying the grid
+    # the grid is only copied if it is changed in place while the
+    # snapshot is still held
+    def snapshot(self):
+        snapshot = GridSnapshot(self)
+        self._snapshots.add(snapshot)
+        return snapshot
+    
+    # (storage, view) for a new snapshot - the grid itself, or a copy
+    # if copy_snapshots
+    # engines that keep the cells somewhere other than grid override this
+    def share_grid(self):
+        grid = self.grid
+        if self.copy_snapshots:
+            grid = self.copy_grid(grid)
+        return grid, self.view_of(grid)
+    
+    # True if a snapshot still holds storage
+    def is_shared(self, storage):
+        return any(snapshot.storage is storage for snapshot in self._snapshots)
+    
+    # call before the grid is changed in place - a grid still shared
+    # with a snapshot is swapped for a copy first, copy on write
+    def own_grid(self):
+        if self._snapshots and self.is_shared(self.grid):
+            self.grid = self.copy_grid(self.grid)
+    
+    # getter for the number of cells evaluated by the last
+    # mark_for_transition - shrinks as the board settles
+    def get_cells_evaluated(self):
+        return self.cells_evaluated
+    
+    # the whole grid was replaced - forget everything worked out
+    # from the old grid & start counting generations again
+    def grid_changed(self):
+        self._back = None
+        self._dirty = None
+        self._marked = None
+        self._hash = None
+        self._population = None
+        self._row_live = None
+        self._col_live = None
+        self.births = 0
+        self.deaths = 0
+        self.reset_history()
+    
+    # forget the grid hashes seen so far
+    def reset_history(self):
+        self.generation = 0
+        self._history = {}
+        self.period = 0
+        self.first_repeat = -1
+    
+    # work out the grid hash & population from scratch
+    # engines override this with a faster scan of their storage
+    def rehash(self):
+        self._hash = 0
+        self._population = 0
+        self._row_live = [0] * self.numY
+        self._col_live = [0] * self.numX
+        for y in range(self.numY):
+            for x in range(self.numX):
+                if self.get_cell(x, y) in ('a', 'z'):
+                    self._hash ^= cell_key(x, y)
+                    self._population += 1
+                    self._row_live[y] += 1
+                    self._col_live[x] += 1
+    
+    # cell x,y started (alive True) or stopped counting as alive
+    # keeps the grid hash & population up to date without a rescan
+    def toggle_alive(self, x, y, alive):
+        if self._population is not None:
+            if self._hash is not None:
+                self._hash ^= cell_key(x, y)
+            delta = 1 if alive else -1
+            self._population += delta
+            self._flips += 1
+            if self._row_live is not None:
+                self._row_live[y] += delta
+                self._col_live[x] += delta
+    
+    # getter for the hash of the live cells
+    def get_hash(self):
+        if self._hash is None:
+            self.rehash()
+        return self._hash
+    
+    # getter for the number of live cells
+    # the hash worked out with it is dropped unless cycle detection
+    # needs it, so stepping doesn't keep it up to date
+    def get_population(self):
+        if self._population is None:
+            self.rehash()
+            if not self.detect_cycles:
+                self._hash = None
+        return self._population
+    
+    # getter for the number of generations stepped since the grid was set
+    def get_generation(self):
+        return self.generation
+    
+    # getter for the number of cells born in the last step
+    def get_births(self):
+        return self.births
+    
+    # getter for the number of cells that died in the last step
+    def get_deaths(self):
+        return self.deaths
+    
+    # getter for the seconds the last step took
+    def get_step_time(self):
+        return self.step_time
+    
+    # (x, y, width, height) of the smallest rectangle holding every live
+    # cell, None if there are none
+    # found from the live counts of the rows & columns, which are kept
+    # up to date as cells flip, so it costs the grid's sides not its area
+    # engines override this with a scan of their own storage
+    def get_bounding_box(self):
+        if self.get_population() == 0:
+            return None
+        rows = self._row_live
+        cols = self._col_live
+        top = next(y for y, live in enumerate(rows) if live)
+        bottom = next(y for y in range(self.numY - 1, -1, -1) if rows[y])
+        left = next(x for x, live in enumerate(cols) if live)
+        right = next(x for x in range(self.numX - 1, -1, -1) if cols[x])
+        return (left, top, right - left + 1, bottom - top + 1)
+    
+    # live counts after the last step without copying the grid
+    # returns a Stats
+    def get_stats(self):
+        return Stats(self.generation, self.get_population(), self.births,
+                     self.deaths, self.get_bounding_box(), self.step_time)
+    
+    # have callback(world) called after every step, eg to log get_stats
+    # None to stop calling it
+    def set_step_callback(self, callback):
+        self.step_callback = callback
+    
+    # start (or stop) looking for still lifes, oscillators & extinction
+    # each step then keeps the grid hash up to date & looks it up in
+    # the history - about 6x the cost of a numpy step, so it is off
+    # until needed
+    # the outcome getters turn it on, so the search starts from the
+    # generation they are first called on
+    def set_cycle_detection(self, enabled=True):
+        if enabled == self.detect_cycles:
+            return
+        self.detect_cycles = enabled
+        self._history = {}
+        if enabled:
+            self.record_generation()
+        else:
+            self._hash = None
+    
+    # getter for the period of the board
+    # 0 if no repeat found yet, 1 for still lifes & extinction
+    def get_period(self):
+        self.set_cycle_detection()
+        return self.period
+    
+    # getter for the generation the board first repeated an earlier 
+    # generation, -1 if not yet
+    def get_first_repeat(self):
+        self.set_cycle_detection()
+        return self.first_repeat
+    
+    # True once the outcome of the board is known
+    def is_settled(self):
+        self.set_cycle_detection()
+        return self.period > 0
+    
+    # outcome of the board
+    # 'running', 'extinct', 'still' or 'oscillating'
+    def get_outcome(self):
+        self.set_cycle_detection()
+        if self.period == 0:
+            return 'running'
+        elif self.get_population() == 0:
+            return 'extinct'
+        elif self.period == 1:
+            return 'still'
+        else:
+            return 'oscillating'
+    
+    # look the current grid up in the history of grid hashes
+    # the oldest hash is dropped once there are more than max_period
+    # nothing is recorded unless detect_cycles
+    def record_generation(self):
+        if self.period > 0 or not self.detect_cycles:
+            return
+        key = self.get_hash()
+        if self.get_population() == 0:
+            self.period = 1
+            self.first_repeat = self.generation
+        elif key in self._history:
+            self.period = self.generation - self._history[key]
+            self.first_repeat = self.generation
+            self._history = {}
+        else:
+            self._history[key] = self.generation
+            if len(self._history) > self.max_period:
+                # dicts keep insertion order so the first key is the oldest
+                del self._history[next(iter(self._history))]
+    
+    # step one whole generation - in one buffered pass or both half
+    # steps depending on step_mode
+    # then check whether the board has settled
+    # births & deaths come from the number of cells that flipped &
+    # the change in population, so the engines only count the flips
+    def step(self):
+        start = time.perf_counter()
+        if self.generation == 0 and not self._history:
+            self.record_generation()
+        population = self.get_population()
+        self._flips = 0
+        if self.step_mode == 'buffered':
+            self.step_buffered()
+        else:
+            self.mark_for_transition()
+            self.clean_up_grid()
+        self.generation += 1
+        self.record_generation()
+        self.births = (self._flips + self.get_population() - population) // 2
+        self.deaths = self._flips - self.births
+        self.step_time = time.perf_counter() - start
+        if self.step_callback is not None:
+            self.step_callback(self)
+    
+    # one pass over the active cells reading the grid & writing the
+    # next generation into the back buffer, then the buffers swap
+    # a cell that isn't active kept its state last generation, so the
+    # back buffer already holds it from the pass before
+    # engines override this with a single pass over their own storage
+    def step_buffered(self):
+        grid = self._back
+        if grid is None:
+            # the back buffer is only made after the grid changed
+            grid = [row.copy() for row in self.grid]
+            self._dirty = None
+        elif self._snapshots and self.is_shared(grid):
+            # a snapshot holds the generation before - copy on write
+            # the cells that aren't active are the same as the grid's
+            grid = [row.copy() for row in self.grid]
+        front = self.grid
+        cells = self.active_cells()
+        self._dirty = set()
+        self.cells_evaluated = len(cells)
+        alive = _alive
+        next_states = self._next_states
+        neighbor_rows = self._neighbor_rows
+        neighbor_cols = self._neighbor_cols
+        for x, y in cells:
+            cell_total = 0
+            cols = neighbor_cols[x]
+            for ny in neighbor_rows[y]:
+                row = front[ny]
+                for nx in cols:
+                    cell_total += alive[row[nx]]
+            state = front[y][x]
+            # the target node was summed with its neighbors
+            cell_total -= alive[state]
+            new_state = next_states[state][cell_total]
+            grid[y][x] = new_state
+            if alive[new_state] != alive[state]:
+                self.toggle_alive(x, y, not alive[state])
+                self.touch_cell(x, y)
+        self._back = front
+        self.grid = grid
+    
+    # step up to generations times
+    # stops early once the board has settled if stop_when_settled
+    # returns the number of generations stepped
+    def run(self, generations, stop_when_settled=True):
+        for done in range(generations):
+            if stop_when_settled and self.is_settled():
+                return done
+            self.step()
+        return generations
+    
+    # remember that cell x,y changed so it & its neighbors
+    # are evaluated by the next mark_for_transition
+    def touch_cell(self, x, y):
+        if self._dirty is None:
+            return
+        for ny in self._neighbor_rows[y]:
+            for nx in self._neighbor_cols[x]:
+                self._dirty.add((nx, ny))
     
     # sum live & zombie neighboring cells that surround the target cell
-    # for corner & edge nodes only sum neighbors that are 
-    # within the grid
+    # past the edges the ghost cells of the boundary are summed - the
+    # rows & columns come from set_boundary so no neighbor is
+    # bounds checked. In dead mode corner & edge nodes only sum
+    # neighbors that are within the grid
     def neighbor_cell_counter(self, xpos, ypos):
         cell_total = 0
-        for y in range(-1,2):
-            for x in range(-1,2):
-                # skip over the target node
-                if x==y and x == 0:
-                    continue
-                
-                cell_state = self.get_cell(x+xpos,y+ypos)
+        cols = self._neighbor_cols[xpos]
+        for y in self._neighbor_rows[ypos]:
+            row = self.grid[y]
+            for x in cols:
+                cell_state = row[x]
                 cell_total += (1 if (cell_state == 'a'
                         or cell_state == 'z') else 0)
-                
-                
-        return cell_total
+        
+        # the target node was summed with its neighbors
+        cell_state = self.grid[ypos][xpos]
+        return cell_total - (1 if (cell_state == 'a'
+                or cell_state == 'z') else 0)
     
     # return the state of the cell for pos x,y
     # if pos x,y is outside the grid, return dead
@@ -104,42 +787,42 @@ class World:
     #   e > a > z > d > e
     def set_cell(self,x,y):
         
+        self.own_grid()
         if self.get_cell(x, y) == 'e':
             self.grid[y][x] = 'a'
+            self.toggle_alive(x, y, True)
         elif self.get_cell(x, y) == 'a':
             self.grid[y][x] = 'z'
         elif self.get_cell(x, y) == 'z':
             self.grid[y][x] = 'd'
+            self.toggle_alive(x, y, False)
         else:
             self.grid[y][x] = 'e' 
+        self.touch_cell(x, y)
             
     # set cell to a or d randomly
     def set_random_cell(self, x, y):
+        self.own_grid()
+        was_alive = self.get_cell(x, y) in ('a', 'z')
         self.grid[y][x] = 'a' if random.random() <= 0.5 else 'd'
+        if was_alive != (self.grid[y][x] == 'a'):
+            self.toggle_alive(x, y, not was_alive)
+        self.touch_cell(x, y)
 
 
     # determine if the cell state should be changed
     # based on current cell state & # of neighbors
     # return True if cell should change state
     # return False if cell should not change state
+    # the rule's change table is looked up instead of branching on
+    # the neighbor count
     def should_change(self, x, y):
 
-        neighbor_count = self.neighbor_cell_counter(x, y)        
-        # when cell is on
-        if self.get_cell(x,y) == 'a':
-            # change state when less than 2 neighbors or more than 3
-            if neighbor_count < 2 or neighbor_count > 3:
-                return True
-            #otherwise leave alone
-            else:
-                return False
-        # when cell is off
-        elif self.get_cell(x, y) == 'd':
-            # change state when there are 3 neighbors
-            if neighbor_count == 3:
-                return True
-            else:
-                return False
+        cell_state = self.get_cell(x, y)
+        # when cell is on or off look up the rule
+        if cell_state == 'a' or cell_state == 'd':
+            neighbor_count = self.neighbor_cell_counter(x, y)
+            return self._change[cell_state == 'a'][neighbor_count] == 1
         # catch-all for other cell states - don't change cell state
         else:
             return False
@@ -152,23 +835,48 @@ class World:
         else:
             return False
     
+    # list of cells that may need to change
+    # every cell when nothing is being tracked, otherwise
+    # only the cells whose neighborhood changed
+    def active_cells(self):
+        if self._dirty is None:
+            return [(x, y) for y in range(self.numY)
+                    for x in range(self.numX)]
+        else:
+            return list(self._dirty)
+    
     # first half-step - mark cell for birth/death
     # change 'a' cell to 'z' if too crowded
     # change 'd' cell to 'e' if there are enough neighbors
+    # cells in quiescent areas are skipped - a cell whose neighborhood
+    # didn't change keeps the same answer from should_change
     def mark_for_transition(self): 
-        for y in range(self.numY):
-            for x in range(self.numX):
-                if self.should_change(x, y) == True:
-                    self.set_cell(x, y)
+        # cells marked here are flipped in place, so the back buffer
+        # no longer holds the generation before
+        self._back = None
+        cells = self.active_cells()
+        self._dirty = set()
+        self._marked = cells
+        self.cells_evaluated = len(cells)
+        for x, y in cells:
+            if self.should_change(x, y) == True:
+                self.set_cell(x, y)
         
     # send half-step kill off zombies & vivify embryo cells
     # change 'z' cells to 'd'
     # change 'e' cells to 'a'
+    # every cell marked by mark_for_transition was touched by set_cell
+    # & a 'z' or 'e' cell from set_grid or set_cell was active when
+    # marking began, so the cells marking evaluated & the active cells
+    # cover every cell to check
     def clean_up_grid(self):
-        for y in range(self.numY):
-            for x in range(self.numX):
-                if self.is_zombie_or_embryo(x, y) == True:
-                    self.set_cell(x, y) 
+        cells = set(self.active_cells())
+        if self._marked is not None:
+            cells.update(self._marked)
+            self._marked = None
+        for x, y in cells:
+            if self.is_zombie_or_embryo(x, y) == True:
+                self.set_cell(x, y) 
     
 # frontend part
 """
@@ -176,7 +884,11 @@ DisplayWorld defaults to _test_nrow x _test_ncol test grid
 """
 class DisplayWorld:
     
-    def __init__(self, ncol, nrow, init_cond_type, initial_grid=None):
+    def __init__(self, ncol, nrow, init_cond_type, initial_grid=None,
+                 stop_when_settled=False, engine='python',
+                 render_mode='rects', generations_per_sec=None,
+                 frames_per_sec=30, rule=None, boundary='dead',
+                 step_mode='buffered'):
         '''
         constructor - set up GUI window
              Parameters
@@ -184,7 +896,26 @@ class DisplayWorld:
              ncol
              grid : defaults to None so it can be optional
              init_cond_type
+             stop_when_settled : end the loop once the world is still,
+                 oscillating or extinct
+             engine : World backend - see _engines
+             render_mode : 'rects' draws each changed cell as a rect
+                 'blit' scales a 1 pixel per cell surface up to the
+                 container in one blit - needs numpy, faster on big grids
+             generations_per_sec : None steps once per frame, otherwise
+                 a background thread steps at this rate (inf for as fast
+                 as possible) & the latest generation is drawn
+             frames_per_sec : frame rate cap with generations_per_sec
+             rule : B/S rule, eg 'B36/S23' - Conway's B3/S23 if None
+             boundary : dead, torus or reflect edges - see BOUNDARIES
+             step_mode : one buffered pass or the two half steps per
+                 generation - see STEP_MODES
         '''
+        load_pygame()
+        
+        if render_mode not in ('rects', 'blit'):
+            raise ValueError(f"incorrect render mode {render_mode}")
+        self.render_mode = render_mode
         
         # properties related to the GUI window
         # keep margin for now since time counter still uses it
@@ -208,7 +939,10 @@ class DisplayWorld:
         self.world_state = DisplayState.RUNNING 
         
         # initialize world
-        self.game_world = World(self._ncol, self._nrow)
+        # the caption shows the outcome, so look for it from the start
+        self.game_world = World(self._ncol, self._nrow, engine, rule=rule,
+                                boundary=boundary, step_mode=step_mode)
+        self.game_world.set_cycle_detection()
 
         pygame.init()
         self.scr = pygame.display.set_mode((self.get_window_width(), 
@@ -226,19 +960,37 @@ class DisplayWorld:
         # font for time counter
         self.font = freetype.Font(None)
         
+        # container layout - the window has a fixed size so this is
+        # worked out once
+        self.update_layout()
+        # screen areas changed by the last draw_world
+        self._dirty_rects = []
+        self._full_redraw = True
+        # frame time counter - seconds for the last draw_world &
+        # the number of cells it had to redraw
+        self.frame_time = 0.0
+        self.cells_drawn = 0
+        
         self.loop = True
         self.time_step = 0
+        self.stop_when_settled = stop_when_settled
+        
+        # background stepping - started by main or the first world_loop
+        self._generations_per_sec = generations_per_sec
+        self._frames_per_sec = frames_per_sec
+        self.stepper = None
+        self._clock = None
+        self._shown_generation = None
         
         # put the initial population
         # test grid initial condition
+        # set_grid copies the grid so initial_grid is left alone
         if initial_grid is None:
-            display_world_grid = []
-        else:
-            display_world_grid = copy_nested_list(initial_grid)
+            initial_grid = []
 
         # user selected initial condition            
         if init_cond_type == 't':
-            self.game_world.set_grid(display_world_grid)
+            self.game_world.set_grid(initial_grid)
         # random grid initial condition
         elif init_cond_type == 'r' or init_cond_type == 'u':
             self.game_world.set_random_grid()
@@ -250,22 +1002,98 @@ class DisplayWorld:
         main loop for keeping the GUI window on screen
         '''
                 
-        while self.loop == True:
-            self.world_loop()
+        if self._generations_per_sec is not None:
+            self.start_stepping()
+        try:
+            while self.loop == True:
+                self.world_loop()
+        finally:
+            self.stop_stepping()
         pygame.quit()
+    
+    def start_stepping(self):
+        '''
+        start the thread stepping the world in the background
+        the world must not be used directly until stop_stepping
+        '''
+        from main.Stepper import SteppingThread
+        if self.stepper is None:
+            self.stepper = SteppingThread(self.game_world,
+                    self._generations_per_sec, self.stop_when_settled)
+            if self.world_state == DisplayState.PAUSED:
+                self.stepper.pause()
+            self._clock = pygame.time.Clock()
+            self.stepper.start()
+    
+    def stop_stepping(self):
+        '''
+        stop the background thread, the world is left at its latest
+        generation
+        '''
+        if self.stepper is not None:
+            self.stepper.stop()
+            self.stepper = None
+    
+    def get_frame_view(self):
+        '''
+        read-only view of the grid to draw, not copied - the latest
+        finished generation when stepping in the background
+        '''
+        if self.stepper is not None:
+            return self.stepper.get_snapshot().cells.get_view()
+        return self.game_world.get_view()
+        
+    def update_layout(self):
+        '''
+        cache the cell size & container corner used when drawing
+        & forget what was drawn
+        '''
+        self._cell_size = self.get_cell_size()
+        self._ulc_x = self.get_ulc_x()
+        self._ulc_y = self.get_ulc_y()
+        # surfaces for render_mode 'blit', made on the next frame
+        self._cell_surface = None
+        # cell states as last drawn, None when every cell has to be
+        # drawn again - on the first frame & after the layout changed
+        self._drawn = None
         
     def draw_world(self):
         '''
         draw white square if the cell is d
         draw black square if the cell is a
+        only cells that changed since the last frame are drawn
+        returns the screen areas that were drawn on
         '''
-        for y in range(self.game_world.numY):
-            for x in range(self.game_world.numX):
+        if self.render_mode == 'blit':
+            return self.blit_world()
+        start = time.perf_counter()
+        grid = self.get_frame_view()
+        if not isinstance(grid, GridView):
+            # engines with their own storage are converted - render_mode
+            # 'blit' reads their arrays without converting
+            grid = self.game_world.grid_from_view(
+                grid, self.game_world.numX, self.game_world.numY)
+        self._full_redraw = self._drawn is None
+        if self._full_redraw:
+            self._drawn = [[None] * self.game_world.numX 
+                           for _ in range(self.game_world.numY)]
+        size = self._cell_size
+        rects = []
+        cells_drawn = 0
+        for y, row in enumerate(grid):
+            drawn_row = self._drawn[y]
+            # most rows of a settled board don't change
+            if row == drawn_row:
+                continue
+            row_rect = None
+            for x, state in enumerate(row):
+                if state == drawn_row[x]:
+                    continue
                 
                 # get cell state to determine cell color
-                if self.game_world.get_cell(x, y) == 'a':
+                if state == 'a':
                     cell_color = self._black
-                elif self.game_world.get_cell(x, y) == 'd':
+                elif state == 'd':
                     cell_color = self._white
                 else:
                     print("Invalid cell state")
@@ -273,13 +1101,111 @@ class DisplayWorld:
                     
                 # note: cells are squares so cell width = cell height
                 
-                pygame.draw.rect(self.scr, cell_color,
-                        (self.get_container_xpos(x), self.get_container_ypos(y),
-                         self.get_cell_size(), self.get_cell_size()))
+                rect = pygame.draw.rect(self.scr, cell_color,
+                        (self._ulc_x + x * size, self._ulc_y + y * size,
+                         size, size))
+                row_rect = rect if row_rect is None else row_rect.union(rect)
+                drawn_row[x] = state
+                cells_drawn += 1
+            if row_rect is not None:
+                rects.append(row_rect)
+        self._dirty_rects = rects
+        self.cells_drawn = cells_drawn
+        self.frame_time = time.perf_counter() - start
+        return rects
+    
+    def blit_world(self):
+        '''
+        draw the world by writing 1 pixel per cell into a small surface
+        & scaling it up to the container with one blit
+        nearest neighbor scaling gives the same image as the rects
+        returns the screen area that was drawn on
+        '''
+        from main.NumpyEngine import alive_array
+        import numpy as np
+        start = time.perf_counter()
+        ncol = self.game_world.numX
+        nrow = self.game_world.numY
+        size = self._cell_size
+        self._full_redraw = self._cell_surface is None
+        if self._full_redraw:
+            self._cell_surface = pygame.Surface((ncol, nrow))
+            self._scaled_surface = pygame.Surface((ncol * size, nrow * size))
+            self._palette = np.array([self._white, self._black], 
+                                     dtype=np.uint8)
+        # surfarray is indexed [x][y]
+        # numpy worlds & their snapshots are read without converting
+        if self.stepper is not None:
+            alive = alive_array(self.stepper.get_snapshot().cells)
+        else:
+            alive = alive_array(self.game_world)
+        pixels = self._palette[alive.T]
+        pygame.surfarray.blit_array(self._cell_surface, pixels)
+        pygame.transform.scale(self._cell_surface, 
+                               (ncol * size, nrow * size), 
+                               self._scaled_surface)
+        rect = self.scr.blit(self._scaled_surface, (self._ulc_x, self._ulc_y))
+        # every cell was drawn over, so a switch back to the rects
+        # has to draw every cell again
+        self._drawn = None
+        self._dirty_rects = [rect]
+        self.cells_drawn = ncol * nrow
+        self.frame_time = time.perf_counter() - start
+        return [rect]
+    
+    def redraw_world(self):
+        '''
+        forget what was drawn so the next draw_world draws every cell
+        '''
+        self._drawn = None
+    
+    def get_frame_time(self):
+        '''
+        seconds taken by the last draw_world
+        '''
+        return self.frame_time
+    
+    def get_cells_drawn(self):
+        '''
+        number of cells drawn by the last draw_world
+        '''
+        return self.cells_drawn
                  
-    def get_display_world(self):            
+    def get_display_world(self, as_array=False):            
         '''
         returns the node states based on the rendered grid
+        as_array : return the get_display_array uint8 array instead of
+            the nested list
+        reads the screen in one copy when numpy is installed
+        '''
+        try:
+            displayed = self.get_display_array()
+        except ImportError:
+            if as_array:
+                raise
+            return self.get_display_world_by_cell()
+        if as_array:
+            return displayed
+        return [['a' if cell else 'd' for cell in row]
+                for row in displayed.tolist()]
+    
+    def get_display_array(self):
+        '''
+        nrow x ncol uint8 array, 1 where the rendered cell is alive
+        copies the screen once & samples the pixel at each cell origin
+        '''
+        import numpy as np
+        size = self.get_cell_size()
+        xs = np.arange(self.game_world.numX) * size + self.get_ulc_x()
+        ys = np.arange(self.game_world.numY) * size + self.get_ulc_y()
+        # surfarray is indexed [x][y]
+        pixels = pygame.surfarray.array3d(self.scr)[np.ix_(xs, ys)]
+        return (pixels == self._black).all(axis=2).T.astype(np.uint8)
+    
+    def get_display_world_by_cell(self):
+        '''
+        returns the node states based on the rendered grid
+        reads one pixel at a time - used without numpy
         '''
         displayed_grid = []
         
@@ -403,35 +1329,72 @@ class DisplayWorld:
                 if ( event.key == pygame.K_p and 
                 self.world_state == DisplayState.RUNNING ):
                     self.world_state = DisplayState.PAUSED
+                    if self.stepper is not None:
+                        self.stepper.pause()
                 elif ( event.key == pygame.K_r and 
                 self.world_state == DisplayState.PAUSED ):
                     self.world_state = DisplayState.RUNNING
+                    if self.stepper is not None:
+                        self.stepper.resume()
         
-        if self.world_state == DisplayState.RUNNING:
+        if self._generations_per_sec is not None:
+            self.show_latest_generation()
+        elif self.world_state == DisplayState.RUNNING:
             
             # draw world
             self.draw_world()
             pygame.time.delay(self._delay)
         
-            # first half step
-            self.game_world.mark_for_transition()
-        
-            # second half step
-            self.game_world.clean_up_grid()
+            # one generation
+            self.game_world.step()
                         
             # display current time step
             # move this outside if block for user-specified initial world?
-            pygame.display.set_caption(f"Time = {self.get_time_step()}")
-            # time counter in UI
-            self.scr.blit(self.background,(self.get_window_width()/3,
-                self.get_window_height()-self._margin/2))
-            self.font.render_to(self.scr,
-            (self.get_window_width()/3,self.get_window_height()-self._margin/2),
-            f"Time = {self.get_time_step()}",self._black,size=20)
-            pygame.display.flip()
+            self.update_display(self.game_world.get_outcome())
         
             #update time
             self.update_time_step()
+    
+    def show_latest_generation(self):
+        '''
+        one frame while the world steps in the background
+        draws the latest finished generation if it is new, then waits
+        for the next frame so events are handled frames_per_sec times a
+        second whatever the stepping rate
+        '''
+        self.start_stepping()
+        snapshot = self.stepper.get_snapshot()
+        if snapshot.generation != self._shown_generation:
+            self._shown_generation = snapshot.generation
+            self.time_step = snapshot.generation
+            self.draw_world()
+            self.update_display(snapshot.outcome)
+        self._clock.tick(self._frames_per_sec)
+    
+    def update_display(self, outcome):
+        '''
+        show the time step in the caption & the counter, then send the
+        drawn areas to the display
+        ends the loop if the world settled & stop_when_settled
+        '''
+        caption = f"Time = {self.get_time_step()}"
+        if outcome is not None and outcome != 'running':
+            caption += f" - {outcome}"
+            if self.stop_when_settled:
+                self.loop = False
+        pygame.display.set_caption(caption)
+        # time counter in UI
+        counter_rect = self.scr.blit(self.background,
+            (self.get_window_width()/3,
+            self.get_window_height()-self._margin/2))
+        self.font.render_to(self.scr,
+        (self.get_window_width()/3,self.get_window_height()-self._margin/2),
+        f"Time = {self.get_time_step()}",self._black,size=20)
+        # only send the changed areas to the display
+        if self._full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._dirty_rects + [counter_rect])
 
 if __name__ == '__main__':
         
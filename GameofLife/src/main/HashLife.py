@@ -0,0 +1,402 @@
+'''
+
+HashLife for jumping a Game of Life pattern far into the future
+see https://en.wikipedia.org/wiki/Hashlife
+
+the plane is a quadtree of canonical nodes - identical sub-squares are
+stored once & the future of every node is cached, so repetitive
+patterns can be advanced 2^N generations in roughly N steps
+
+unlike World the plane has no edges, so results match World stepping
+as long as the pattern stays away from the World border. Any B/S rule
+without B0 can be used - a B0 rule would fill the infinite plane
+
+Created on Oct 18, 2026
+
+'''
+
+from main.Rules import get_rule
+
+class Node:
+    '''
+    square of 2^level x 2^level cells
+    level 0 nodes are single cells, otherwise 4 child quadrants
+    '''
+
+    __slots__ = ('nw', 'ne', 'sw', 'se', 'level', 'population')
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+# the two level 0 nodes
+OFF = Node(None, None, None, None, 0, 0)
+ON = Node(None, None, None, None, 0, 1)
+
+# collects one jump may make before it is given up & done as 2 jumps of
+# half the size - see HashLife.jump
+JUMP_COLLECTS = 8
+
+class _JumpTooBig(Exception):
+    '''
+    a jump needed more collects than it was allowed - see HashLife.jump
+    '''
+
+class HashLife:
+    '''
+    quadtree Game of Life on an unbounded plane
+    '''
+
+    def __init__(self, max_nodes=1000000, rule=None):
+        '''
+        constructor - empty plane at generation 0
+        Parameter
+        max_nodes = cap on the number of cached nodes & futures on top
+                    of the nodes of the live pattern, the caches are
+                    trimmed as soon as it is passed - see collect
+        rule = B/S rule, Conway's B3/S23 if None
+        '''
+        self.rule = get_rule(rule)
+        if self.rule.has_b0():
+            raise ValueError(f"HashLife can't run {self.rule}")
+        self.max_nodes = max_nodes
+        # canonical node for each (nw, ne, sw, se)
+        self._nodes = {}
+        # (node, j) -> centre of node advanced 2^j generations
+        self._results = {}
+        # empty node for each level
+        self._empty = [OFF]
+        # nodes kept by the last collect, which max_nodes comes on top of
+        self._kept = 0
+        # nodes whose successor is being worked out, outermost first
+        self._active = []
+        # number of collects so far
+        self._collects = 0
+        # largest j that advance jumps 2^j generations at once, None for
+        # no limit - see jump
+        self._jump_limit = None
+        # collects the jump in progress may still make, None for any
+        self._collects_left = None
+        self.generation = 0
+        self.root = self.empty(3)
+        # world coords of the upper left corner of root
+        self._originX = 0
+        self._originY = 0
+
+    def join(self, nw, ne, sw, se):
+        '''
+        canonical node with the 4 quadrants
+        '''
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = Node(nw, ne, sw, se, nw.level + 1,
+                        nw.population + ne.population +
+                        sw.population + se.population)
+            self._nodes[key] = node
+            self.trim()
+        return node
+
+    def empty(self, level):
+        '''
+        node of all dead cells
+        '''
+        while len(self._empty) <= level:
+            e = self._empty[-1]
+            self._empty.append(self.join(e, e, e, e))
+        return self._empty[level]
+
+    def centre(self, node):
+        '''
+        node one level up with node in the middle & dead cells around it
+        '''
+        e = self.empty(node.level - 1)
+        return self.join(self.join(e, e, e, node.nw),
+                         self.join(e, e, node.ne, e),
+                         self.join(e, node.sw, e, e),
+                         self.join(node.se, e, e, e))
+
+    def inner(self, node):
+        '''
+        middle quarter of node, one level down
+        '''
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def life_4x4(self, node):
+        '''
+        middle 2x2 cells of a level 2 node after 1 generation
+        '''
+        # cells of the 4x4 as a row major list of 0/1
+        cells = []
+        for left, right in ((node.nw, node.ne), (node.sw, node.se)):
+            for row in (('nw', 'ne'), ('sw', 'se')):
+                for quad in (left, right):
+                    for cell in row:
+                        cells.append(getattr(quad, cell).population)
+        neighborhood = self.rule.neighborhood
+        result = []
+        for y in (1, 2):
+            for x in (1, 2):
+                # 3x3 around the cell packed row major into 9 bits
+                index = 0
+                for dy in (-1, 0, 1):
+                    for dx in (-1, 0, 1):
+                        index |= (cells[(y + dy) * 4 + x + dx] <<
+                                  ((dy + 1) * 3 + dx + 1))
+                result.append(ON if neighborhood[index] else OFF)
+        return self.join(*result)
+
+    def successor(self, node, j):
+        '''
+        middle half of node advanced 2^j generations, j <= level - 2
+        '''
+        key = (node, j)
+        result = self._results.pop(key, None)
+        if result is not None:
+            # moved to the end, so the futures are in least recently
+            # used order
+            self._results[key] = result
+            return result
+        if node.population == 0:
+            result = self.empty(node.level - 1)
+        elif node.level == 2:
+            result = self.life_4x4(node)
+        else:
+            self._active.append(node)
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            # 9 overlapping sub-squares one level down
+            subs = [nw, self.join(nw.ne, ne.nw, nw.se, ne.sw), ne,
+                    self.join(nw.sw, nw.se, sw.nw, sw.ne),
+                    self.join(nw.se, ne.sw, sw.ne, se.nw),
+                    self.join(ne.sw, ne.se, se.nw, se.ne),
+                    sw, self.join(sw.ne, se.nw, sw.se, se.sw), se]
+            if j == node.level - 2:
+                # full speed - each pass advances 2^(level-3)
+                j = j - 1
+                subs = [self.successor(sub, j) for sub in subs]
+            else:
+                subs = [self.inner(sub) for sub in subs]
+            result = self.join(
+                self.successor(self.join(subs[0], subs[1],
+                                         subs[3], subs[4]), j),
+                self.successor(self.join(subs[1], subs[2],
+                                         subs[4], subs[5]), j),
+                self.successor(self.join(subs[3], subs[4],
+                                         subs[6], subs[7]), j),
+                self.successor(self.join(subs[4], subs[5],
+                                         subs[7], subs[8]), j))
+            self._active.pop()
+        self._results[key] = result
+        self.trim()
+        return result
+
+    def is_padded(self, node):
+        '''
+        True if all live cells of node are in its middle half
+        '''
+        return (node.level >= 3 and
+                node.nw.population == node.nw.se.population and
+                node.ne.population == node.ne.sw.population and
+                node.sw.population == node.sw.ne.population and
+                node.se.population == node.se.nw.population)
+
+    def expand(self):
+        '''
+        grow root by one level keeping its cells in place
+        '''
+        half = 1 << (self.root.level - 1)
+        self.root = self.centre(self.root)
+        self._originX -= half
+        self._originY -= half
+
+    def advance(self, generations):
+        '''
+        step the plane forward by generations
+        each set bit of generations is one jump of 2^j generations
+        '''
+        j = 0
+        while generations > 0:
+            if generations & 1:
+                self.jump(j)
+            generations >>= 1
+            j += 1
+
+    def jump(self, j):
+        '''
+        step the plane forward by 2^j generations
+        a bigger jump needs more nodes & futures at once, so a jump
+        making more than JUMP_COLLECTS collects is given up & done as 2
+        jumps of half the size, as are the later jumps that big
+        a jump making no collects lets the later ones grow again
+        so a small max_nodes costs more, smaller jumps rather than
+        recomputing the futures it had to evict over & over
+        '''
+        if self._jump_limit is not None and j > self._jump_limit:
+            self.jump(j - 1)
+            self.jump(j - 1)
+            return
+        collects = self._collects
+        while self.root.level < j + 2 or not self.is_padded(self.root):
+            self.expand()
+        # one more level so the pattern can't reach the edge
+        self.expand()
+        self._collects_left = JUMP_COLLECTS if j > 0 else None
+        try:
+            result = self.successor(self.root, j)
+        except _JumpTooBig:
+            result = None
+        self._collects_left = None
+        if result is None:
+            # the caches only hold finished futures, so they stay valid
+            self._active = []
+            self._jump_limit = j - 1
+            self.jump(j - 1)
+            self.jump(j - 1)
+            return
+        quarter = 1 << (self.root.level - 2)
+        self.root = result
+        self._originX += quarter
+        self._originY += quarter
+        self.generation += 1 << j
+        if self._collects == collects and self._jump_limit == j:
+            self._jump_limit = j + 1
+
+    def trim(self):
+        '''
+        collect once the cached nodes & futures pass max_nodes
+        checked as each is added, so a single deep jump stays under the
+        cap - the nodes of the jump in progress are still referenced by
+        it, so trimming loses sharing, never results
+        '''
+        if len(self._nodes) + len(self._results) > self.max_nodes + self._kept:
+            self.collect()
+
+    def collect(self):
+        '''
+        evict every node not used by root, except the most recently
+        used futures & their nodes - those are kept while they fit in
+        half of max_nodes, so the next collect is at least max_nodes / 2
+        additions away & the jump in progress keeps its latest futures
+        gives up the jump in progress once it has made too many collects
+        '''
+        nodes = {}
+        stack = [self.root] + self._empty
+        while stack:
+            node = stack.pop()
+            if node.level == 0:
+                continue
+            key = (node.nw, node.ne, node.sw, node.se)
+            if key not in nodes:
+                nodes[key] = node
+                stack.extend(key)
+        # a node of the jump in progress that isn't kept would be made
+        # again by join as a new node, missing its futures
+        for node in self._active:
+            nodes.setdefault((node.nw, node.ne, node.sw, node.se), node)
+        self._kept = len(nodes)
+        room = self.max_nodes // 2
+        results = {}
+        # successor moves a future to the end of the dict when it is
+        # used, so the last key is the most recently used
+        for key in reversed(self._results):
+            if room <= 0:
+                break
+            result = self._results[key]
+            results[key] = result
+            room -= 1
+            for node in (key[0], result):
+                if node.level:
+                    node_key = (node.nw, node.ne, node.sw, node.se)
+                    if node_key not in nodes:
+                        nodes[node_key] = node
+                        room -= 1
+        self._nodes = nodes
+        self._results = dict(reversed(results.items()))
+        self._collects += 1
+        if self._collects_left is not None:
+            self._collects_left -= 1
+            if self._collects_left < 0:
+                raise _JumpTooBig()
+
+    def get_collects(self):
+        '''
+        number of times the caches were trimmed to max_nodes
+        '''
+        return self._collects
+
+    def get_cache_size(self):
+        '''
+        number of canonical nodes held in the cache
+        '''
+        return len(self._nodes)
+
+    def get_population(self):
+        '''
+        number of live cells on the plane
+        '''
+        return self.root.population
+
+    def get_generation(self):
+        '''
+        number of generations advanced so far
+        '''
+        return self.generation
+
+    def set_grid(self, in_list, x=0, y=0):
+        '''
+        load the plane from a grid in the World nested list format
+        'a' & 'z' cells are alive, everything else is dead
+        Parameters
+        in_list = nested list of cell states
+        x, y = plane coords of the upper left corner of in_list
+        '''
+        size = max(len(in_list), max((len(row) for row in in_list),
+                                     default=0), 8)
+        size = 1 << (size - 1).bit_length()
+        # square of level 0 nodes, padded with dead cells
+        nodes = []
+        for row_index in range(size):
+            row = in_list[row_index] if row_index < len(in_list) else []
+            nodes.append([ON if (col_index < len(row) and
+                                 (row[col_index] == 'a' or
+                                  row[col_index] == 'z')) else OFF
+                          for col_index in range(size)])
+        # join 2x2 blocks until one node is left
+        while len(nodes) > 1:
+            nodes = [[self.join(nodes[y][x], nodes[y][x + 1],
+                                nodes[y + 1][x], nodes[y + 1][x + 1])
+                      for x in range(0, len(nodes), 2)]
+                     for y in range(0, len(nodes), 2)]
+        self.root = nodes[0][0]
+        self._originX = x
+        self._originY = y
+        self.generation = 0
+
+    def get_grid(self, ncol, nrow, x=0, y=0):
+        '''
+        ncol x nrow window of the plane in the World nested list format
+        Parameters
+        ncol, nrow = window size
+        x, y = plane coords of the upper left corner of the window
+        '''
+        out_list = [['d' for _ in range(ncol)] for _ in range(nrow)]
+        stack = [(self.root, self._originX - x, self._originY - y)]
+        while stack:
+            node, left, top = stack.pop()
+            size = 1 << node.level
+            if (node.population == 0 or left >= ncol or top >= nrow or
+                    left + size <= 0 or top + size <= 0):
+                continue
+            if node.level == 0:
+                out_list[top][left] = 'a'
+                continue
+            half = size >> 1
+            stack.append((node.nw, left, top))
+            stack.append((node.ne, left + half, top))
+            stack.append((node.sw, left, top + half))
+            stack.append((node.se, left + half, top + half))
+        return out_list
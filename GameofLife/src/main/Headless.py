@@ -0,0 +1,210 @@
+'''
+
+Headless runner for the Game of Life
+steps a random World as fast as the engine allows & reports throughput
+pygame is only imported when --gui is given
+
+run from src, eg
+    python -m main.Headless --ncol 1000 --nrow 1000 --seed 1 \\
+        --generations 100 --engine numpy --output final.txt
+
+Created on Oct 18, 2026
+
+'''
+
+import sys
+import time
+import random
+import argparse
+from main.GameofLife import World, DisplayWorld, centered_region
+from main.GameofLife import BOUNDARIES, STEP_MODES
+from main.Recorder import Recorder
+from main.Patterns import load_pattern
+from main.MappedWorld import resume_world
+from main.StatsLog import StatsLog, LOG_FORMATS
+
+def parse_args(argv):
+    '''
+    command line arguments
+    '''
+    parser = argparse.ArgumentParser(
+        description="step a random Game of Life world")
+    parser.add_argument('--ncol', type=int, default=100,
+                        help="number of columns")
+    parser.add_argument('--nrow', type=int, default=100,
+                        help="number of rows")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed for the random grid")
+    parser.add_argument('--generations', type=int, default=100,
+                        help="number of generations to step")
+    parser.add_argument('--engine', default='python',
+                        help="World backend, eg python, numpy, bitpacked")
+    parser.add_argument('--rule', default=None,
+                        help="B/S rule, eg B36/S23, or a name from "
+                        "main.Rules.RULES - Conway's B3/S23 by default")
+    parser.add_argument('--boundary', default='dead',
+                        choices=BOUNDARIES,
+                        help="what lies past the grid edges")
+    parser.add_argument('--step-mode', default='buffered',
+                        choices=STEP_MODES,
+                        help="one buffered pass or both half steps per "
+                        "generation")
+    parser.add_argument('--output', default=None,
+                        help="file to write the final grid to")
+    parser.add_argument('--density', type=float, default=None,
+                        help="seed a soup of this density with "
+                        "World.seed_random instead of set_random_grid")
+    parser.add_argument('--soup-size', type=int, default=None,
+                        help="with --density, only seed a centered square "
+                        "of this size")
+    parser.add_argument('--pattern', default=None,
+                        help=".rle or .cells file centered on the grid "
+                        "instead of a random grid")
+    parser.add_argument('--map-file', default=None,
+                        help="step the world in this memory mapped file, "
+                        "see main.MappedWorld")
+    parser.add_argument('--checkpoint-interval', type=int, default=0,
+                        help="with --map-file, checkpoint every this many "
+                        "generations")
+    parser.add_argument('--resume', action='store_true',
+                        help="carry on from the last checkpoint in "
+                        "--map-file")
+    parser.add_argument('--record', default=None,
+                        help="recording file for every generation, see "
+                        "main.Recorder")
+    parser.add_argument('--stats-log', default=None,
+                        help="file to log the population, births, deaths, "
+                        "bounding box & step time of every generation to, "
+                        "see main.StatsLog")
+    parser.add_argument('--stats-format', default=None,
+                        choices=LOG_FORMATS,
+                        help="format of --stats-log, csv for a .csv file & "
+                        "jsonl otherwise by default")
+    parser.add_argument('--stop-when-settled', action='store_true',
+                        help="stop once the world is still, oscillating "
+                        "or extinct")
+    parser.add_argument('--gui', action='store_true',
+                        help="show the world in a pygame window instead")
+    parser.add_argument('--generations-per-sec', type=float, default=None,
+                        help="with --gui, step in a background thread at "
+                        "this rate instead of once per frame")
+    return parser.parse_args(argv)
+
+def write_grid(world, path):
+    '''
+    write the grid to path, one row of cell state characters per line
+    '''
+    with open(path, 'w') as out_file:
+        for row in world.get_grid():
+            out_file.write(''.join(row) + '\n')
+
+def run_recorded(world, args):
+    '''
+    step the world like World.run, recording every generation to
+    args.record
+    returns the number of generations stepped
+    '''
+    with Recorder(args.record, world.numX, world.numY) as recorder:
+        recorder.record(world)
+        for done in range(args.generations):
+            if world.run(1, args.stop_when_settled) == 0:
+                return done
+            recorder.record(world)
+    return args.generations
+
+def start_stats_log(world, args):
+    '''
+    StatsLog for --stats-log attached to the world, None without it
+    '''
+    if not args.stats_log:
+        return None
+    log = StatsLog(args.stats_log, args.stats_format)
+    log.attach(world)
+    return log
+
+def make_world(args):
+    '''
+    the World to step - seeded from the pattern file or at random,
+    or resumed from its last checkpoint
+    '''
+    if args.map_file and args.resume:
+        return resume_world(args.map_file, args.checkpoint_interval)
+    random.seed(args.seed)
+    if args.map_file:
+        world = World(args.ncol, args.nrow, 'mapped', path=args.map_file,
+                      checkpoint_interval=args.checkpoint_interval,
+                      rule=args.rule, boundary=args.boundary,
+                      step_mode=args.step_mode)
+    else:
+        world = World(args.ncol, args.nrow, args.engine, rule=args.rule,
+                      boundary=args.boundary, step_mode=args.step_mode)
+    if args.pattern:
+        # a rule on the command line wins over the file's
+        load_pattern(world, args.pattern, use_rule=args.rule is None)
+    elif args.density is not None:
+        region = None
+        if args.soup_size:
+            region = centered_region(world.numX, world.numY, args.soup_size)
+        world.seed_random(args.density, args.seed, region)
+    else:
+        world.set_random_grid()
+    return world
+
+def run_headless(args, out=None):
+    '''
+    step the world & print the throughput
+    returns the World after stepping
+    '''
+    world = make_world(args)
+    log = start_stats_log(world, args)
+    try:
+        start = time.perf_counter()
+        if args.record:
+            generations = run_recorded(world, args)
+        else:
+            generations = world.run(args.generations, args.stop_when_settled)
+        elapsed = max(time.perf_counter() - start, 1e-9)
+    finally:
+        if log is not None:
+            log.close()
+    cells = world.numX * world.numY * generations
+    print(f"engine {world.engine} - {world.numX} x {world.numY}, "
+          f"{generations} generations in {elapsed:.3f} s", file=out)
+    print(f"{generations / elapsed:.1f} generations/sec, "
+          f"{cells / elapsed:.0f} cells/sec", file=out)
+    if world.detect_cycles and world.is_settled():
+        print(f"{world.get_outcome()} - period {world.get_period()} "
+              f"first repeat at generation {world.get_first_repeat()}",
+              file=out)
+    if args.output:
+        write_grid(world, args.output)
+    return world
+
+def main(argv=None):
+    '''
+    entry point - returns the exit code
+    '''
+    args = parse_args(argv)
+    if args.gui:
+        random.seed(args.seed)
+        display = DisplayWorld(args.ncol, args.nrow, 'r',
+                stop_when_settled=args.stop_when_settled,
+                engine=args.engine, rule=args.rule,
+                boundary=args.boundary, step_mode=args.step_mode,
+                generations_per_sec=args.generations_per_sec)
+        # the GUI loop & the stepping thread both step game_world, so
+        # its step callback logs either way
+        log = start_stats_log(display.game_world, args)
+        try:
+            display.main()
+        finally:
+            if log is not None:
+                log.close()
+        return 0
+    world = run_headless(args)
+    if hasattr(world, 'close'):
+        world.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+'''
+
+JIT compiled backend for the Game of Life World
+a NumpyWorld stepped by one fused loop over the uint8 cell codes - the
+neighbor count & the rule lookup are done cell by cell into a second
+buffer, so a generation makes no temporary arrays
+
+the loop is compiled with Numba if it is installed, cached to disk next
+to this module (or in NUMBA_CACHE_DIR) so only the first run pays the
+compile time. Without Numba the world falls back to the NumpyWorld
+mark_for_transition / clean_up_grid half steps
+
+Created on Oct 18, 2026
+
+'''
+
+import numpy as np
+from main.GameofLife import ghost_indices
+from main.NumpyEngine import NumpyWorld
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# splitmix64 of cell_key as uint64 scalars, so the compiled loop keeps
+# to wrapping 64 bit arithmetic instead of promoting to float
+_golden = np.uint64(0x9e3779b97f4a7c15)
+_mix1 = np.uint64(0xbf58476d1ce4e5b9)
+_mix2 = np.uint64(0x94d049bb133111eb)
+_shifts = (np.uint64(32), np.uint64(30), np.uint64(27), np.uint64(31))
+
+def fused_step(grid, out, table, rows, cols, hashing):
+    '''
+    one generation of grid written into out
+    returns (cells that flipped, live cells in out, xor of the cell_key
+    of the cells that flipped - 0 unless hashing)
+    Parameters
+    grid, out = 2-D uint8 arrays of cell codes, the same shape
+    table = next_table of the rule as a uint8 array
+    rows, cols = ghost_indices of each axis with -1 for dead ghosts
+    hashing = work out the hash of the cells that flipped
+    '''
+    nrow, ncol = grid.shape
+    shift32, shift30, shift27, shift31 = _shifts
+    flips = 0
+    population = 0
+    key = np.uint64(0)
+    for y in range(nrow):
+        for x in range(ncol):
+            count = 0
+            for dy in range(3):
+                ny = rows[y + dy]
+                if ny < 0:
+                    continue
+                for dx in range(3):
+                    nx = cols[x + dx]
+                    if nx >= 0:
+                        count += grid[ny, nx] & 1
+            code = grid[y, x]
+            # the cell was counted with its neighbors
+            count -= code & 1
+            new_code = int(table[(code << 4) | count])
+            out[y, x] = new_code
+            population += new_code
+            if new_code != (code & 1):
+                flips += 1
+                if hashing:
+                    # cell_key(x, y)
+                    z = (np.uint64(x) << shift32 | np.uint64(y)) + _golden
+                    z = (z ^ (z >> shift30)) * _mix1
+                    z = (z ^ (z >> shift27)) * _mix2
+                    key ^= z ^ (z >> shift31)
+    return flips, population, key
+
+# fused_step compiled, None without Numba
+if numba is not None:
+    compiled_step = numba.njit(cache=True, nogil=True)(fused_step)
+else:
+    compiled_step = None
+
+def ghost_array(size, boundary):
+    '''
+    ghost_indices as an int64 array with -1 for the dead ghosts
+    '''
+    return np.array([-1 if index is None else index
+                     for index in ghost_indices(size, boundary)],
+                    dtype=np.int64)
+
+class JitWorld(NumpyWorld):
+    '''
+    NumpyWorld stepped by the compiled fused_step
+    '''
+
+    def __init__(self, ncol, nrow, engine='jit', rule=None,
+                 boundary='dead', step_mode='buffered'):
+        # fused_step compiled, or None to step with the half steps
+        self.kernel = compiled_step
+        super().__init__(ncol, nrow, engine, rule, boundary, step_mode)
+
+    def set_rule(self, rule):
+        '''
+        change the rule & keep its next_table as an array for the kernel
+        '''
+        super().set_rule(rule)
+        self._kernel_table = np.frombuffer(self._next_table, dtype=np.uint8)
+
+    def set_boundary(self, boundary):
+        '''
+        change what lies past the grid edges - the ghost cells are
+        looked up by index in the kernel
+        '''
+        super().set_boundary(boundary)
+        self._ghost_rows = ghost_array(self.numY, boundary)
+        self._ghost_cols = ghost_array(self.numX, boundary)
+
+    def step_buffered(self):
+        '''
+        one pass of the kernel into the back buffer, then the buffers
+        swap - both half steps if there is no kernel
+        '''
+        if self.kernel is None:
+            self.mark_for_transition()
+            self.clean_up_grid()
+            return
+        grid = self.grid
+        self.cells_evaluated = grid.size
+        back = self._back
+        if (back is None or back.shape != grid.shape or
+                (self._snapshots and self.is_shared(back))):
+            back = np.empty_like(grid)
+        hashing = self._hash is not None
+        # the uncompiled loop wraps numpy uint64 scalars, which warn
+        with np.errstate(over='ignore'):
+            flips, population, key = self.kernel(
+                grid, back, self._kernel_table, self._ghost_rows,
+                self._ghost_cols, hashing)
+        if self._population is not None:
+            if hashing:
+                self._hash ^= int(key)
+            self._population = int(population)
+            self._flips += int(flips)
+        self._back = grid
+        self.grid = back
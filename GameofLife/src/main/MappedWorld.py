@@ -0,0 +1,256 @@
+'''
+
+Memory mapped backend for the Game of Life World
+a BitWorld whose bit planes live in a file mapped into memory, so a
+huge board is stepped in place in the file & saving it costs a copy
+of one bit plane instead of a get_grid deep copy
+
+file format, all integers little-endian
+    header, 128 bytes
+        magic       8 bytes  b'GOLMAP01'
+        ncol        uint32
+        nrow        uint32
+        rule        24 bytes B/S rule string, NUL padded - the longest,
+                             B012345678/S012345678, is 21 bytes
+        boundary    8 bytes  boundary name, NUL padded - all NUL for dead
+        slot        uint8    checkpoint slot of the last checkpoint
+        generation  uint64   generation of checkpoint slot 0
+        checksum    uint32   zlib.crc32 of checkpoint slot 0
+        generation  uint64   generation of checkpoint slot 1
+        checksum    uint32   zlib.crc32 of checkpoint slot 1
+        padding     up to 128 bytes
+    checkpoint slot 0  stride * nrow bytes
+    checkpoint slot 1  stride * nrow bytes
+    alive plane        stride * nrow bytes
+    marks plane        stride * nrow bytes
+
+each plane is packed like BitGrid - stride = (ncol + 7) // 8 bytes per
+row & cell x is bit x of its row read as a little-endian int. The alive
+& marks planes are the live board, the checkpoint slots copies of the
+alive plane taken between steps that a crashed run resumes from
+
+checkpoints take turns between the 2 slots - the plane is written into
+the older slot & flushed before the header points at it, so a crash in
+the middle of a checkpoint leaves the one before it to resume from
+
+Created on Oct 18, 2026
+
+'''
+
+import os
+import mmap
+import zlib
+import struct
+import weakref
+from main.BitGrid import BitGrid, BitWorld
+
+MAGIC = b'GOLMAP01'
+HEADER_SIZE = 128
+_header = struct.Struct('<8sII24s8sBQIQI')
+
+def unpack_header(data, path):
+    '''
+    (ncol, nrow, rule, boundary, slot, slots) from the header bytes of
+    path - slots is the (generation, checksum) of each checkpoint slot
+    '''
+    if len(data) < _header.size:
+        raise ValueError(f"{path} is not a mapped world")
+    (magic, ncol, nrow, rule, boundary, slot, generation0, checksum0,
+     generation1, checksum1) = _header.unpack_from(data)
+    if magic != MAGIC or slot > 1:
+        raise ValueError(f"{path} is not a mapped world")
+    return (ncol, nrow, rule.rstrip(b'\0').decode(),
+            boundary.rstrip(b'\0').decode() or 'dead', slot,
+            ((generation0, checksum0), (generation1, checksum1)))
+
+def read_header(path):
+    '''
+    (ncol, nrow, generation, checksum, rule, boundary, slot) from the
+    header of path, for the slot of the last checkpoint
+    '''
+    with open(path, 'rb') as in_file:
+        data = in_file.read(_header.size)
+    ncol, nrow, rule, boundary, slot, slots = unpack_header(data, path)
+    generation, checksum = slots[slot]
+    return ncol, nrow, generation, checksum, rule, boundary, slot
+
+def resume_world(path, checkpoint_interval=0):
+    '''
+    MappedWorld carrying on from the last checkpoint in path
+    '''
+    ncol, nrow, _, _, rule, boundary, _ = read_header(path)
+    return MappedWorld(ncol, nrow, path=path,
+                       checkpoint_interval=checkpoint_interval, resume=True,
+                       rule=rule, boundary=boundary)
+
+def _release(views, mapped):
+    '''
+    write the mapped file out & unmap it
+    '''
+    for view in views:
+        view.release()
+    if not mapped.closed:
+        mapped.flush()
+        mapped.close()
+
+class MappedWorld(BitWorld):
+    '''
+    BitWorld stored in a memory mapped file
+    call close() (or use it as a context manager) to unmap the file
+    '''
+
+    # the planes are stepped in the file, so snapshots copy them
+    copy_snapshots = True
+
+    def __init__(self, ncol, nrow, engine='mapped', path=None,
+                 checkpoint_interval=0, resume=False, rule=None,
+                 boundary='dead', step_mode='buffered'):
+        '''
+        constructor
+        Parameters
+        ncol, nrow = grid size
+        path = file to map, created or overwritten unless resume
+        checkpoint_interval = step() checkpoints every this many
+            generations, 0 for only when checkpoint() is called
+        resume = load the last checkpoint of an existing file instead
+        rule = B/S rule, Conway's B3/S23 if None
+        boundary = what lies past the grid edges, see BOUNDARIES
+            resume_world passes the rule & boundary saved in the header
+        step_mode = see STEP_MODES, buffered steps flip the mapped alive
+            plane in place
+        '''
+        if path is None:
+            raise ValueError("MappedWorld needs a path")
+        self.path = path
+        self.checkpoint_interval = checkpoint_interval
+        self.plane_size = (ncol + 7) // 8 * nrow
+        size = HEADER_SIZE + 4 * self.plane_size
+        # checkpoint slot the last checkpoint went in & the
+        # (generation, checksum) of each slot
+        self.slot = 1
+        self.slots = [(0, 0), (0, 0)]
+        if resume:
+            read_header(path)
+            if os.path.getsize(path) != size:
+                raise ValueError(f"{path} is not {ncol} x {nrow}")
+            mode = 'r+b'
+        else:
+            mode = 'w+b'
+        with open(path, mode) as map_file:
+            map_file.truncate(size)
+            self._map = mmap.mmap(map_file.fileno(), size)
+        # memoryviews of the map, released before it is closed
+        self._views = []
+        self._finalizer = weakref.finalize(self, _release, self._views,
+                                           self._map)
+        super().__init__(ncol, nrow, engine, rule, boundary, step_mode)
+        if resume:
+            self.resume()
+        else:
+            self.checkpoint()
+
+    def slot_range(self, slot):
+        '''
+        (start, end) of checkpoint slot 0 or 1 in the file
+        '''
+        start = HEADER_SIZE + slot * self.plane_size
+        return start, start + self.plane_size
+
+    def resume(self):
+        '''
+        load the last checkpoint whose plane matches its checksum
+        the slot before it is used if a crash damaged the last one
+        '''
+        _, _, _, _, slot, slots = unpack_header(self._map, self.path)
+        self.slots = list(slots)
+        for self.slot in (slot, 1 - slot):
+            generation, checksum = slots[self.slot]
+            start, end = self.slot_range(self.slot)
+            checkpoint = self._map[start:end]
+            if zlib.crc32(checkpoint) == checksum:
+                self.grid.alive[:] = checkpoint
+                self.grid_changed()
+                self.generation = generation
+                return
+        self.close()
+        raise ValueError(f"{self.path} checkpoint is damaged")
+
+    def empty_grid(self):
+        '''
+        dead cells in the alive & marks planes of the file
+        '''
+        start = HEADER_SIZE + 2 * self.plane_size
+        view = memoryview(self._map)[start:start + 2 * self.plane_size]
+        self._views.append(view)
+        view[:] = bytes(2 * self.plane_size)
+        return BitGrid(self.numX, self.numY, view)
+
+    def set_grid(self, in_list):
+        '''
+        seed grid with values from a nested list of cell states
+        the cells are copied into the mapped planes
+        '''
+        if len(in_list) == self.numY and len(in_list[0]) == self.numX:
+            grid = BitGrid.from_nested_list(in_list)
+            self.grid.alive[:] = grid.alive
+            self.grid.marks[:] = grid.marks
+            self.grid_changed()
+        else:
+            raise Exception("set_grid ERROR - incorrect list dimensions")
+
+    def clear_grid(self):
+        '''
+        clear the grid in between unit tests
+        '''
+        self.grid.alive[:] = bytes(self.plane_size)
+        self.grid.marks[:] = bytes(self.plane_size)
+        self.grid_changed()
+
+    def flush(self, start, end):
+        '''
+        write bytes start to end of the map out to the file
+        '''
+        start -= start % mmap.ALLOCATIONGRANULARITY
+        self._map.flush(start, end - start)
+
+    def checkpoint(self):
+        '''
+        copy the alive plane to the older checkpoint slot & write it
+        out, then point the header at it & write that out
+        call between steps - a crashed run resumes from here
+        '''
+        plane = bytes(self.grid.alive)
+        slot = 1 - self.slot
+        start, end = self.slot_range(slot)
+        self._map[start:end] = plane
+        self.flush(start, end)
+        self.slots[slot] = (self.generation, zlib.crc32(plane))
+        self._map[:_header.size] = _header.pack(
+            MAGIC, self.numX, self.numY, str(self.rule).encode(),
+            self.boundary.encode(), slot, *self.slots[0], *self.slots[1])
+        self.flush(0, HEADER_SIZE)
+        self.slot = slot
+
+    def step(self):
+        '''
+        both half steps, checkpointing every checkpoint_interval
+        generations
+        '''
+        super().step()
+        if (self.checkpoint_interval and
+                self.generation % self.checkpoint_interval == 0):
+            self.checkpoint()
+
+    def close(self):
+        '''
+        write the file out & unmap it
+        the world can't be used after closing
+        '''
+        self.grid = BitGrid(0, 0)
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,457 @@
+'''
+
+NumPy backend for the Game of Life World
+grid is kept as a 2-D uint8 array & a generation is computed with
+shifted-array neighbor sums instead of per-cell python calls
+
+cell codes - bit 0 : cell counts as a live neighbor ('a' or 'z')
+             bit 1 : cell is marked for transition ('z' or 'e')
+
+             0 : 'd'    1 : 'a'    2 : 'e'    3 : 'z'
+
+Created on Oct 18, 2026
+
+'''
+
+import random
+import numpy as np
+from main.GameofLife import World, ghost_indices
+from main.Rules import CONWAY
+
+DEAD = 0
+ALIVE = 1
+EMBRYO = 2
+ZOMBIE = 3
+
+# cell code -> cell state character
+_states = 'daez'
+# cell state character -> cell code
+_codes = {state : code for code, state in enumerate(_states)}
+# cell code after set_cell - e > a > z > d > e
+_next_code = (EMBRYO, ZOMBIE, ALIVE, DEAD)
+
+def to_array(in_list):
+    '''
+    convert a nested list of cell state characters to an array of codes
+    Parameter
+    in_list = nested list in the World grid format
+    '''
+    return np.array([[_codes[cell] for cell in row] for row in in_list],
+                    dtype=np.uint8).reshape(len(in_list), -1)
+
+def to_nested_list(grid):
+    '''
+    convert an array of cell codes to the World nested list format
+    Parameter
+    grid = 2-D uint8 array of cell codes
+    '''
+    return [[_states[code] for code in row] for row in grid.tolist()]
+
+def cell_keys(xs, ys):
+    '''
+    vectorized cell_key - Zobrist keys of the cells at xs, ys
+    Parameters
+    xs, ys = integer arrays of cell coords
+    '''
+    z = ((xs.astype(np.uint64) & np.uint64(0xffffffff)) << np.uint64(32) |
+         (ys.astype(np.uint64) & np.uint64(0xffffffff)))
+    z = z + np.uint64(0x9e3779b97f4a7c15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xbf58476d1ce4e5b9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94d049bb133111eb)
+    return z ^ (z >> np.uint64(31))
+
+def hash_cells(mask, x0=0, y0=0):
+    '''
+    xor of the Zobrist keys of the cells where mask is set
+    x0, y0 = grid coords of mask[0, 0], for a mask of one tile
+    '''
+    ys, xs = np.nonzero(mask)
+    return int(np.bitwise_xor.reduce(cell_keys(xs + x0, ys + y0),
+                                     initial=0))
+
+def alive_array(world):
+    '''
+    2-D uint8 array with 1 where a cell of world counts as alive
+    works for any World engine or GridSnapshot, numpy views are used
+    without converting
+    '''
+    view = world.get_view()
+    if isinstance(view, np.ndarray):
+        return view & 1
+    return grid_alive_array(world.get_grid())
+
+def grid_alive_array(in_list):
+    '''
+    2-D uint8 array with 1 where a cell of a World nested list is alive
+    '''
+    return np.array([[cell == 'a' or cell == 'z' for cell in row]
+                     for row in in_list],
+                    dtype=np.uint8).reshape(len(in_list), len(in_list[0]))
+
+def runs_mask(ncol, nrow, xs, ys, lengths):
+    '''
+    nrow x ncol uint8 array with 1 on the runs of length cells from x, y
+    the parts of runs outside the array are left out
+    '''
+    xs = np.asarray(xs, dtype=np.int64)
+    ys = np.asarray(ys, dtype=np.int64)
+    starts = np.clip(xs, 0, ncol)
+    ends = np.clip(xs + np.asarray(lengths, dtype=np.int64), 0, ncol)
+    keep = (ys >= 0) & (ys < nrow) & (starts < ends)
+    size = ncol * nrow
+    # +1 at the start of each run & -1 after it, the running sum is
+    # above 0 inside runs
+    edges = (np.bincount(ys[keep] * ncol + starts[keep], minlength=size + 1) -
+             np.bincount(ys[keep] * ncol + ends[keep], minlength=size + 1))
+    return (np.cumsum(edges[:size]) > 0).view(np.uint8).reshape(nrow, ncol)
+
+def neighbor_sums(live, out=None):
+    '''
+    sum of the 8 neighbors of every cell inside a one cell border
+    Parameter
+    live = array of 0/1 with a one cell border around the cells in the
+           last 2 dimensions - leading dimensions are separate boards
+    out = array to sum into instead of allocating new arrays
+    '''
+    if out is None:
+        return (live[..., :-2, :-2] + live[..., :-2, 1:-1] +
+                live[..., :-2, 2:] + live[..., 1:-1, :-2] +
+                live[..., 1:-1, 2:] + live[..., 2:, :-2] +
+                live[..., 2:, 1:-1] + live[..., 2:, 2:])
+    np.add(live[..., :-2, :-2], live[..., :-2, 1:-1], out=out)
+    for shifted in (live[..., :-2, 2:], live[..., 1:-1, :-2],
+                    live[..., 1:-1, 2:], live[..., 2:, :-2],
+                    live[..., 2:, 1:-1], live[..., 2:, 2:]):
+        np.add(out, shifted, out=out)
+    return out
+
+# np.pad mode that fills the one cell border for each boundary
+PAD_MODES = {'dead' : 'constant', 'torus' : 'wrap', 'reflect' : 'symmetric'}
+
+def neighbor_counts(grid, boundary='dead'):
+    '''
+    number of live & zombie neighbors for every cell
+    the border is padded with the ghost cells of boundary - 0 for dead
+    Parameter
+    grid = 2-D uint8 array of cell codes
+    boundary = one of main.GameofLife.BOUNDARIES
+    '''
+    return neighbor_sums(np.pad(grid & 1, 1, mode=PAD_MODES[boundary]))
+
+def fill_ghosts(live, grid, bounds, boundary):
+    '''
+    copy the ghost cells past the grid edges into the one cell border
+    of live - the cells inside the grid are already there
+    Parameters
+    live = 0/1 array of the tile at bounds with a one cell border
+    grid = 2-D uint8 array of cell codes
+    bounds = (x0, y0, x1, y1) of the tile, x1 & y1 exclusive
+    boundary = one of main.GameofLife.BOUNDARIES, dead ghosts stay 0
+    '''
+    if boundary == 'dead':
+        return
+    nrow, ncol = grid.shape
+    x0, y0, x1, y1 = bounds
+    rows = ghost_indices(nrow, boundary)[y0:y1 + 2]
+    cols = ghost_indices(ncol, boundary)[x0:x1 + 2]
+    if y0 == 0:
+        live[0] = grid[rows[0], cols] & 1
+    if y1 == nrow:
+        live[-1] = grid[rows[-1], cols] & 1
+    if x0 == 0:
+        live[:, 0] = grid[rows, cols[0]] & 1
+    if x1 == ncol:
+        live[:, -1] = grid[rows, cols[-1]] & 1
+
+def change_table(rule):
+    '''
+    256 byte lookup table for mark_for_transition - entry
+    code << 4 | count is the mark bit, 2, if a cell with that code &
+    neighbor count changes under rule & 0 otherwise
+    '''
+    table = bytearray(256)
+    for count in range(9):
+        table[DEAD << 4 | count] = rule.change[0][count] << 1
+        table[ALIVE << 4 | count] = rule.change[1][count] << 1
+    return bytes(table)
+
+_conway_table = change_table(CONWAY)
+
+def next_table(rule):
+    '''
+    256 byte lookup table for NumpyWorld.step_buffered - entry
+    code << 4 | count is the code of the cell next generation, marked
+    cells finish their transition like clean_up_grid
+    '''
+    table = bytearray(256)
+    for count in range(9):
+        table[DEAD << 4 | count] = rule.next_state[0][count]
+        table[ALIVE << 4 | count] = rule.next_state[1][count]
+        table[EMBRYO << 4 | count] = ALIVE
+    return bytes(table)
+
+def mark_for_transition(grid, counts=None, table=None):
+    '''
+    first half-step done in place on grid
+    'a' cells the rule kills become 'z', 'd' cells it gives birth to 'e'
+    counts = neighbor counts for grid, worked out from grid if None
+    table = change_table of the rule, Conway's B3/S23 if None
+    '''
+    if counts is None:
+        counts = neighbor_counts(grid)
+    if table is None:
+        table = _conway_table
+    # code << 4 | count fits in a byte, so bytearray.translate looks
+    # up every cell in one C loop without converting to an index array
+    index = bytearray(grid.size)
+    packed = np.frombuffer(index, dtype=np.uint8).reshape(grid.shape)
+    np.left_shift(grid, 4, out=packed)
+    packed |= counts
+    grid |= np.frombuffer(index.translate(table),
+                          dtype=np.uint8).reshape(grid.shape)
+
+def clean_up_grid(grid):
+    '''
+    second half-step done in place on grid
+    'z' becomes 'd' & 'e' becomes 'a' - the marked bit flips bit 0
+    '''
+    grid ^= grid >> 1
+    grid &= 1
+
+class NumpyWorld(World):
+    '''
+    World that stores the grid as a uint8 array of cell codes
+    same public methods as World so it can be used as a drop-in backend
+    '''
+
+    def __init__(self, ncol, nrow, engine='numpy', rule=None,
+                 boundary='dead', step_mode='buffered'):
+        # padded live cells, neighbor counts, lookup index & flipped
+        # cells reused by every step_buffered, made on the first
+        self._buffers = None
+        super().__init__(ncol, nrow, engine, rule, boundary, step_mode)
+
+    def set_rule(self, rule):
+        '''
+        change the rule & compile its lookup table
+        '''
+        super().set_rule(rule)
+        self._table = change_table(self.rule)
+        self._next_table = next_table(self.rule)
+
+    def set_boundary(self, boundary):
+        '''
+        change what lies past the grid edges
+        the padded buffer of step_buffered is made again for the new
+        ghost cells
+        '''
+        super().set_boundary(boundary)
+        self._buffers = None
+
+    def empty_grid(self):
+        '''
+        new grid of dead cells
+        '''
+        return np.zeros((self.numY, self.numX), dtype=np.uint8)
+
+    def set_grid(self, in_list):
+        '''
+        seed grid with values from a nested list of cell states
+        '''
+        if len(in_list) == self.numY and len(in_list[0]) == self.numX:
+            self.grid = to_array(in_list)
+            self.grid_changed()
+        else:
+            raise Exception("set_grid ERROR - incorrect list dimensions")
+
+    def clear_grid(self):
+        '''
+        clear the grid in between unit tests
+        '''
+        self.grid = np.zeros((0, 0), dtype=np.uint8)
+        self.grid_changed()
+
+    def view_of(self, grid):
+        '''
+        read-only array view of grid storage - cell codes, not copied
+        '''
+        view = grid.view()
+        view.flags.writeable = False
+        return view
+
+    @staticmethod
+    def grid_from_view(view, ncol, nrow):
+        '''
+        World nested list format of an array of cell codes
+        '''
+        return to_nested_list(view)
+
+    def copy_grid(self, grid):
+        '''
+        copy of grid storage
+        '''
+        return grid.copy()
+
+    def get_cell(self, x, y):
+        '''
+        return the state of the cell for pos x,y
+        if pos x,y is outside the grid, return dead
+        '''
+        if (x >= 0 and x < self.numX) and (y >= 0 and y < self.numY):
+            return _states[self.grid[y, x]]
+        else:
+            return 'd'
+
+    def neighbor_cell_counter(self, xpos, ypos):
+        '''
+        number of live & zombie neighbors of the cell at xpos,ypos
+        the neighbor rows & columns come from set_boundary
+        '''
+        grid = self.grid
+        cols = self._neighbor_cols[xpos]
+        total = 0
+        for y in self._neighbor_rows[ypos]:
+            for x in cols:
+                total += grid[y, x] & 1
+        return int(total - (grid[ypos, xpos] & 1))
+
+    def put_run(self, x, y, length):
+        '''
+        set cells x to x+length-1 of row y alive, skipping cells outside
+        the grid - call grid_changed once all the runs are in
+        '''
+        if 0 <= y < self.numY:
+            self.own_grid()
+            self.grid[y, max(x, 0):max(x + length, 0)] = ALIVE
+
+    def put_block(self, x, y, block):
+        '''
+        set the cells of a 2-D 0 / 1 array alive with its upper left
+        corner at x, y - call grid_changed once all the blocks are in
+        '''
+        height, width = block.shape
+        self.own_grid()
+        self.grid[y:y + height, x:x + width] |= block
+
+    def put_runs(self, xs, ys, lengths):
+        '''
+        put_run for each x, y, length of numpy arrays, all at once
+        '''
+        if len(ys):
+            top = max(int(ys.min()), 0)
+            bottom = min(int(ys.max()) + 1, self.numY)
+            if top < bottom:
+                self.own_grid()
+                self.grid[top:bottom] |= runs_mask(self.numX, bottom - top,
+                                                   xs, ys - top, lengths)
+
+    def set_cell(self, x, y):
+        '''
+        change the cell state in the order e > a > z > d > e
+        '''
+        self.own_grid()
+        code = self.grid[y, x]
+        self.grid[y, x] = _next_code[code]
+        if code == EMBRYO:
+            self.toggle_alive(x, y, True)
+        elif code == ZOMBIE:
+            self.toggle_alive(x, y, False)
+
+    def set_random_cell(self, x, y):
+        '''
+        set cell to a or d randomly
+        draws from random the same way World does so seeds match
+        '''
+        self.own_grid()
+        was_alive = bool(self.grid[y, x] & 1)
+        self.grid[y, x] = ALIVE if random.random() <= 0.5 else DEAD
+        if was_alive != bool(self.grid[y, x]):
+            self.toggle_alive(x, y, not was_alive)
+
+    def rehash(self):
+        '''
+        work out the grid hash & population from scratch
+        '''
+        live = (self.grid & 1).astype(bool)
+        self._hash = hash_cells(live)
+        self._population = int(np.count_nonzero(live))
+
+    def get_bounding_box(self):
+        '''
+        (x, y, width, height) of the live cells, None if there are none
+        '''
+        live = (self.grid & 1).astype(bool)
+        rows = np.flatnonzero(live.any(axis=1))
+        if not rows.size:
+            return None
+        cols = np.flatnonzero(live.any(axis=0))
+        return (int(cols[0]), int(rows[0]), int(cols[-1] - cols[0]) + 1,
+                int(rows[-1] - rows[0]) + 1)
+
+    def hash_transitions(self):
+        '''
+        update the grid hash & population for the marked cells
+        called just before the marked cells flip in clean_up_grid
+        '''
+        if self._population is not None:
+            if self._hash is not None:
+                self._hash ^= hash_cells(self.grid >= EMBRYO)
+            born = int(np.count_nonzero(self.grid == EMBRYO))
+            died = int(np.count_nonzero(self.grid == ZOMBIE))
+            self._population += born - died
+            self._flips += born + died
+
+    def mark_for_transition(self):
+        '''
+        first half-step - mark cell for birth/death
+        every cell is evaluated
+        '''
+        self.cells_evaluated = self.numX * self.numY
+        self.own_grid()
+        mark_for_transition(self.grid,
+                            neighbor_counts(self.grid, self.boundary),
+                            self._table)
+
+    def clean_up_grid(self):
+        '''
+        second half-step - kill off zombies & vivify embryo cells
+        '''
+        self.hash_transitions()
+        self.own_grid()
+        clean_up_grid(self.grid)
+
+    def step_buffered(self):
+        '''
+        one pass - the neighbor counts, lookup index & flipped cells
+        are worked out in preallocated buffers & one lookup gives the
+        code of every cell next generation, which becomes the grid
+        the old grid isn't written to, so snapshots of it never copy
+        the lookup is the one new buffer a generation - translate into
+        a new grid steps 1.4x to 2.4x faster than np.take into a reused
+        one, & the grid it replaces is freed for the next to reuse
+        '''
+        grid = self.grid
+        self.cells_evaluated = grid.size
+        if self._buffers is None or self._buffers[1].shape != grid.shape:
+            self._buffers = (np.zeros((self.numY + 2, self.numX + 2),
+                                      dtype=np.uint8),
+                             np.zeros(grid.shape, dtype=np.uint8),
+                             bytearray(grid.size),
+                             np.zeros(grid.shape, dtype=bool))
+        live, counts, index_bytes, flips = self._buffers
+        np.bitwise_and(grid, 1, out=live[1:-1, 1:-1])
+        fill_ghosts(live, grid, (0, 0, self.numX, self.numY), self.boundary)
+        neighbor_sums(live, counts)
+        index = np.frombuffer(index_bytes, dtype=np.uint8).reshape(grid.shape)
+        np.left_shift(grid, 4, out=index)
+        index |= counts
+        new_grid = np.frombuffer(index_bytes.translate(self._next_table),
+                                 dtype=np.uint8).reshape(grid.shape)
+        if self._population is not None:
+            # the middle of live still holds the grid's live cells
+            np.not_equal(live[1:-1, 1:-1], new_grid, out=flips)
+            if self._hash is not None:
+                self._hash ^= hash_cells(flips)
+            self._population = int(np.count_nonzero(new_grid))
+            self._flips += int(np.count_nonzero(flips))
+        self.grid = new_grid
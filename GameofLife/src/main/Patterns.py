@@ -0,0 +1,382 @@
+'''
+
+Standard Game of Life patterns
+each pattern is in the plaintext .cells format - 'O' alive, '.' dead
+see https://conwaylife.com/wiki/Plaintext
+
+pattern files in the .cells & RLE formats are read a line at a time &
+their live runs written straight into a World with put_run, so no
+nested list is built for big patterns
+see https://conwaylife.com/wiki/Run_Length_Encoded
+
+Created on Oct 18, 2026
+
+'''
+
+import re
+from main.BitGrid import pack_alive
+
+# an RLE item - optional run count & a tag, b dead, $ end of row,
+# ! end of pattern, any other letter alive
+_rle_item = re.compile(r'(\d*)([^\d\s])')
+_rle_header = re.compile(r'\s*x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)'
+                         r'(?:\s*,\s*rule\s*=\s*(\S+))?')
+_cells_run = re.compile(r'[O*]+')
+# longest line written to an RLE file
+_rle_width = 70
+
+PATTERNS = {
+    'glider' : '''
+.O.
+..O
+OOO
+''',
+    'r_pentomino' : '''
+.OO
+OO.
+.O.
+''',
+    'acorn' : '''
+.O.....
+...O...
+OO..OOO
+''',
+    'gosper_gun' : '''
+........................O...........
+......................O.O...........
+............OO......OO............OO
+...........O...O....OO............OO
+OO........O.....O...OO..............
+OO........O...O.OO....O.O...........
+..........O.....O.......O...........
+...........O...O....................
+............OO......................
+''',
+    }
+
+def pattern_rows(name):
+    '''
+    rows of the pattern as strings of 'O' & '.'
+    '''
+    if name not in PATTERNS:
+        raise ValueError(f"unknown pattern {name}")
+    return PATTERNS[name].strip().splitlines()
+
+def pattern_grid(name, ncol, nrow, x=None, y=None):
+    '''
+    ncol x nrow grid in the World nested list format with the pattern on it
+    Parameters
+    name = key of PATTERNS
+    ncol, nrow = grid size
+    x, y = upper left corner of the pattern, centered if None
+    '''
+    rows = pattern_rows(name)
+    width = max(len(row) for row in rows)
+    if x is None:
+        x = (ncol - width) // 2
+    if y is None:
+        y = (nrow - len(rows)) // 2
+    if x < 0 or y < 0 or x + width > ncol or y + len(rows) > nrow:
+        raise ValueError(f"pattern {name} doesn't fit in {ncol} x {nrow}")
+    grid = [['d' for _ in range(ncol)] for _ in range(nrow)]
+    for row_index, row in enumerate(rows):
+        for col_index, cell in enumerate(row):
+            if cell == 'O':
+                grid[y + row_index][x + col_index] = 'a'
+    return grid
+
+def cells_runs(lines):
+    '''
+    yields (x, y, length) for the live runs of .cells lines
+    lines starting with ! are comments
+    '''
+    y = 0
+    for line in lines:
+        if line.startswith('!'):
+            continue
+        for match in _cells_run.finditer(line):
+            yield match.start(), y, match.end() - match.start()
+        y += 1
+
+def cells_arrays(lines, chunk_lines=1 << 16):
+    '''
+    cells_runs as numpy arrays (xs, ys, lengths), one set of arrays per
+    chunk of lines - every live cell is a run of 1
+    '''
+    y = 0
+    chunk = []
+    for line in lines:
+        if not line.startswith('!'):
+            chunk.append(line.rstrip('\r\n'))
+        if len(chunk) == chunk_lines:
+            yield cells_chunk_arrays(chunk, y)
+            y += len(chunk)
+            chunk = []
+    if chunk:
+        yield cells_chunk_arrays(chunk, y)
+
+def cells_chunk_arrays(chunk, y):
+    '''
+    (xs, ys, lengths) of the live cells in a list of .cells rows that
+    starts at row y
+    '''
+    import numpy as np
+    chars = np.frombuffer('\n'.join(chunk).encode(), dtype=np.uint8)
+    line_ends = np.flatnonzero(chars == ord('\n'))
+    pos = np.flatnonzero((chars == ord('O')) | (chars == ord('*')))
+    lines = np.searchsorted(line_ends, pos)
+    line_starts = np.concatenate(([0], line_ends + 1))
+    return (pos - line_starts[lines], lines + y,
+            np.ones(len(pos), dtype=np.int64))
+
+def read_rle_header(lines):
+    '''
+    read up to & including the x = , y = header line of an RLE file
+    returns (width, height, rule) - rule is None if not given
+    '''
+    for line in lines:
+        if line.startswith('#') or not line.strip():
+            continue
+        match = _rle_header.match(line)
+        if match is None:
+            raise ValueError(f"incorrect RLE header {line.strip()}")
+        return int(match.group(1)), int(match.group(2)), match.group(3)
+    raise ValueError("RLE header missing")
+
+def rle_runs(lines):
+    '''
+    yields (x, y, length) for the live runs of the RLE lines after the
+    header, up to the !
+    '''
+    x = 0
+    y = 0
+    # a run count split over 2 lines
+    count = ''
+    for line in lines:
+        # spaces between items aren't cells
+        line = count + ''.join(line.split())
+        count = ''
+        end = 0
+        for match in _rle_item.finditer(line):
+            end = match.end()
+            run = int(match.group(1)) if match.group(1) else 1
+            tag = match.group(2)
+            if tag == 'b' or tag == '.':
+                x += run
+            elif tag == '$':
+                x = 0
+                y += run
+            elif tag == '!':
+                return
+            else:
+                yield x, y, run
+                x += run
+        count = line[end:]
+
+def rle_chunks(lines, chunk_size=1 << 20):
+    '''
+    yields the RLE items after the header with the whitespace taken out,
+    about chunk_size characters at a time, never splitting a run count
+    from its tag
+    '''
+    chunk = []
+    size = 0
+    for line in lines:
+        # spaces between items aren't cells
+        line = ''.join(line.split())
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            text = ''.join(chunk)
+            items = text.rstrip('0123456789')
+            yield items
+            chunk = [text[len(items):]]
+            size = len(chunk[0])
+    yield ''.join(chunk)
+
+def rle_arrays(lines, chunk_size=1 << 20):
+    '''
+    rle_runs as numpy arrays (xs, ys, lengths), one set of arrays per
+    chunk of about chunk_size characters
+    '''
+    x = 0
+    y = 0
+    for items in rle_chunks(lines, chunk_size):
+        xs, ys, lengths, x, y, done = rle_chunk_arrays(items, x, y)
+        yield xs, ys, lengths
+        if done:
+            return
+
+def rle_chunk_arrays(items, x, y):
+    '''
+    live runs of a string of RLE items, the pen starting at x, y
+    every item is parsed at once with array operations
+    returns (xs, ys, lengths, x, y, done) - x, y where the pen ends &
+    done if the ! was reached
+    '''
+    import numpy as np
+    chars = np.frombuffer(items.encode(), dtype=np.uint8)
+    digit = (chars >= ord('0')) & (chars <= ord('9'))
+    tag_pos = np.flatnonzero(~digit)
+    tags = chars[tag_pos]
+    ends = np.flatnonzero(tags == ord('!'))
+    done = len(ends) > 0
+    if done:
+        tag_pos = tag_pos[:ends[0]]
+        tags = tags[:ends[0]]
+    # run count of each tag from the digits in front of it
+    digit_pos = np.flatnonzero(digit)
+    digit_pos = digit_pos[digit_pos < (tag_pos[-1] if len(tag_pos) else 0)]
+    owner = np.searchsorted(tag_pos, digit_pos)
+    counts = np.ones(len(tags), dtype=np.int64)
+    if len(digit_pos):
+        values = np.bincount(owner, weights=(chars[digit_pos] - ord('0')) *
+                             10.0 ** (tag_pos[owner] - digit_pos - 1),
+                             minlength=len(tags))
+        has_count = np.zeros(len(tags), dtype=bool)
+        has_count[owner] = True
+        counts[has_count] = values[has_count].round().astype(np.int64)
+    new_row = tags == ord('$')
+    rows = np.where(new_row, counts, 0)
+    advance = np.where(new_row, 0, counts)
+    # pen x before each item - reset to 0 by the last $ before it
+    before = np.cumsum(advance) - advance
+    last_row = np.maximum.accumulate(
+        np.where(new_row, np.arange(len(tags)), -1))
+    row_start = np.where(last_row >= 0, before[np.maximum(last_row, 0)],
+                         -x)
+    xs = before - row_start
+    ys = np.cumsum(rows) - rows + y
+    alive = ~new_row & (tags != ord('b')) & (tags != ord('.'))
+    if len(tags):
+        x = int(xs[-1] + advance[-1])
+        y = int(ys[-1] + rows[-1])
+    return xs[alive], ys[alive], counts[alive], x, y, done
+
+def pattern_size(path):
+    '''
+    (width, height, rule) of the .rle or .cells file at path
+    rule is None if the file doesn't give one
+    .cells files are read through once to find their size
+    '''
+    with open(path) as in_file:
+        if str(path).endswith('.rle'):
+            return read_rle_header(in_file)
+        width = 0
+        height = 0
+        y = 0
+        for line in in_file:
+            if line.startswith('!'):
+                continue
+            live = line.rstrip().rstrip('.')
+            if live:
+                width = max(width, len(live))
+                height = y + 1
+            y += 1
+        return width, height, None
+
+def pattern_runs(path, arrays=False):
+    '''
+    yields the live runs of the .rle or .cells file at path
+    (x, y, length) for each run, or numpy arrays (xs, ys, lengths) for
+    each chunk of the file if arrays
+    '''
+    with open(path) as in_file:
+        if str(path).endswith('.rle'):
+            read_rle_header(in_file)
+            yield from (rle_arrays if arrays else rle_runs)(in_file)
+        else:
+            yield from (cells_arrays if arrays else cells_runs)(in_file)
+
+def load_pattern(world, path, x=None, y=None, clear=True, use_rule=True):
+    '''
+    put the pattern in the .rle or .cells file at path into world
+    the file is parsed a chunk at a time with numpy if it is installed
+    Parameters
+    world = World of any engine
+    path = pattern file, RLE if it ends in .rle, .cells otherwise
+    x, y = upper left corner of the pattern, centered if None
+    clear = kill the cells already in the world first
+    use_rule = switch world to the rule the file gives, if any
+    returns the (width, height) of the pattern
+    '''
+    width, height, rule = pattern_size(path)
+    if x is None:
+        x = (world.numX - width) // 2
+    if y is None:
+        y = (world.numY - height) // 2
+    if getattr(world, 'bounded', True) and (
+            x < 0 or y < 0 or x + width > world.numX or
+            y + height > world.numY):
+        raise ValueError(f"pattern {path} doesn't fit in "
+                         f"{world.numX} x {world.numY}")
+    if use_rule and rule is not None:
+        world.set_rule(rule)
+    if clear:
+        world.reset_grid()
+    try:
+        import numpy
+    except ImportError:
+        for run_x, run_y, length in pattern_runs(path):
+            world.put_run(x + run_x, y + run_y, length)
+    else:
+        for xs, ys, lengths in pattern_runs(path, arrays=True):
+            world.put_runs(xs + x, ys + y, lengths)
+    world.grid_changed()
+    return width, height
+
+def alive_rows(world):
+    '''
+    yields each row of world as a string of 'O' alive & '.' dead
+    '''
+    packed = pack_alive(world)
+    stride = (world.numX + 7) // 8
+    for y in range(world.numY):
+        row = int.from_bytes(packed[y * stride:(y + 1) * stride], 'little')
+        # bin puts cell 0 last
+        bits = bin(row)[2:].zfill(stride * 8)[::-1]
+        yield bits[:world.numX].replace('0', '.').replace('1', 'O')
+
+def save_cells(world, path, name=None):
+    '''
+    write world to path in the .cells format
+    '''
+    with open(path, 'w') as out_file:
+        if name:
+            out_file.write(f"!Name: {name}\n")
+        for row in alive_rows(world):
+            out_file.write(row.rstrip('.') + '\n')
+
+def save_rle(world, path, name=None):
+    '''
+    write world to path in the RLE format
+    the pattern is the whole grid so it loads back at x = y = 0
+    '''
+    items = []
+    empty_rows = 0
+    for row in alive_rows(world):
+        runs = re.findall(r'O+|\.+', row.rstrip('.'))
+        if not runs:
+            empty_rows += 1
+            continue
+        if items or empty_rows:
+            # end the rows before this one
+            rows = empty_rows + 1 if items else empty_rows
+            items.append(f"{rows if rows > 1 else ''}$")
+        empty_rows = 0
+        for run in runs:
+            tag = 'o' if run[0] == 'O' else 'b'
+            items.append(f"{len(run) if len(run) > 1 else ''}{tag}")
+    items.append('!')
+    with open(path, 'w') as out_file:
+        if name:
+            out_file.write(f"#N {name}\n")
+        out_file.write(f"x = {world.numX}, y = {world.numY}, "
+                       f"rule = {world.rule}\n")
+        line = ''
+        for item in items:
+            if len(line) + len(item) > _rle_width:
+                out_file.write(line + '\n')
+                line = ''
+            line += item
+        out_file.write(line + '\n')
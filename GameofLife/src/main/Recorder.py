@@ -0,0 +1,219 @@
+'''
+
+Streaming recorder for Game of Life runs
+generations are written to disk as keyframes & XOR deltas of the packed
+live cells, & RecordingReader seeks to any recorded generation by
+decoding from the nearest keyframe before it
+
+file format, all integers little-endian
+    header : magic b'GOLREC01', ncol uint32, nrow uint32,
+             keyframe_interval uint32
+    frames : kind b'K' keyframe or b'D' delta, generation uint64,
+             payload length uint32, payload
+
+the cells are packed like BitGrid's alive plane - each row starts on a
+byte boundary & cell x is bit x of the row read as a little-endian int.
+A payload is a list of spans, (offset uint32, length uint32, bytes),
+XORed into the packed cells - onto dead cells for a keyframe & onto the
+previous frame for a delta - so the unchanged parts of a settling board
+cost nothing
+
+Created on Oct 18, 2026
+
+'''
+
+import re
+import mmap
+import struct
+from main.BitGrid import BitGrid, pack_alive
+
+MAGIC = b'GOLREC01'
+_header = struct.Struct('<8sIII')
+_frame = struct.Struct('<cQI')
+_span = struct.Struct('<II')
+# non zero bytes, joining runs split by a few zero bytes so each span
+# header costs less than the zeros it skips
+_spans = re.compile(rb'[^\x00]+(?:\x00{1,8}[^\x00]+)*')
+
+def xor_bytes(first, second):
+    '''
+    bytewise XOR of 2 byte strings of the same length
+    '''
+    return (int.from_bytes(first, 'little') ^
+            int.from_bytes(second, 'little')).to_bytes(len(first), 'little')
+
+def encode_spans(data):
+    '''
+    payload with the non zero spans of data
+    '''
+    out = []
+    for match in _spans.finditer(data):
+        span = match.group()
+        out.append(_span.pack(match.start(), len(span)))
+        out.append(span)
+    return b''.join(out)
+
+def apply_spans(packed, payload):
+    '''
+    XOR the spans of payload into the bytearray packed
+    '''
+    pos = 0
+    while pos < len(payload):
+        offset, length = _span.unpack_from(payload, pos)
+        pos += _span.size
+        end = offset + length
+        packed[offset:end] = xor_bytes(packed[offset:end],
+                                       payload[pos:pos + length])
+        pos += length
+
+class Recorder:
+    '''
+    writes generations of a World to a recording file
+    '''
+
+    def __init__(self, path, ncol, nrow, keyframe_interval=64,
+                 buffer_size=1 << 20):
+        '''
+        constructor - creates or overwrites path
+        Parameters
+        path = recording file
+        ncol, nrow = grid size
+        keyframe_interval = frames between keyframes, a reader decodes
+            at most this many deltas to seek
+        buffer_size = bytes buffered before writing to disk
+        '''
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self.numX = ncol
+        self.numY = nrow
+        self.keyframe_interval = keyframe_interval
+        self.frames = 0
+        self._previous = None
+        self._file = open(path, 'wb', buffering=buffer_size)
+        self._file.write(_header.pack(MAGIC, ncol, nrow, keyframe_interval))
+
+    def record(self, world, generation=None):
+        '''
+        append the world's live cells
+        generation defaults to world.get_generation()
+        '''
+        if world.numX != self.numX or world.numY != self.numY:
+            raise ValueError("record ERROR - incorrect world dimensions")
+        if generation is None:
+            generation = world.get_generation()
+        packed = pack_alive(world)
+        if self.frames % self.keyframe_interval == 0:
+            kind = b'K'
+            payload = encode_spans(packed)
+        else:
+            kind = b'D'
+            payload = encode_spans(xor_bytes(packed, self._previous))
+        self._file.write(_frame.pack(kind, generation, len(payload)))
+        self._file.write(payload)
+        self._previous = packed
+        self.frames += 1
+
+    def close(self):
+        '''
+        flush & close the file
+        '''
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class RecordingReader:
+    '''
+    random access to the generations in a recording file
+    '''
+
+    def __init__(self, path):
+        '''
+        constructor - maps the file & indexes the frame headers
+        a recording cut short by a crash is read up to its last whole
+        frame
+        '''
+        with open(path, 'rb') as in_file:
+            self._map = mmap.mmap(in_file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        magic, self.numX, self.numY, self.keyframe_interval = \
+            _header.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a recording")
+        self.stride = (self.numX + 7) // 8
+        # (kind, generation, payload start, payload length) per frame
+        self._frames = []
+        # generation -> frame index
+        self._index = {}
+        pos = _header.size
+        while pos + _frame.size <= len(self._map):
+            kind, generation, length = _frame.unpack_from(self._map, pos)
+            pos += _frame.size
+            if pos + length > len(self._map):
+                break
+            self._index[generation] = len(self._frames)
+            self._frames.append((kind, generation, pos, length))
+            pos += length
+        # last decoded frame index & its packed cells
+        self._decoded = None
+
+    def get_generations(self):
+        '''
+        recorded generations in the order they were recorded
+        '''
+        return [frame[1] for frame in self._frames]
+
+    def get_packed(self, generation):
+        '''
+        packed live cells of generation - see pack_alive
+        '''
+        if generation not in self._index:
+            raise KeyError(f"generation {generation} was not recorded")
+        target = self._index[generation]
+        start = target
+        while self._frames[start][0] != b'K':
+            start -= 1
+        if self._decoded is not None and start <= self._decoded[0] <= target:
+            # carry on from the last frame decoded
+            start, packed = self._decoded
+            packed = bytearray(packed)
+            start += 1
+        else:
+            packed = bytearray(self.stride * self.numY)
+        for frame in range(start, target + 1):
+            kind, _, pos, length = self._frames[frame]
+            if kind == b'K':
+                packed = bytearray(self.stride * self.numY)
+            apply_spans(packed, self._map[pos:pos + length])
+        self._decoded = (target, bytes(packed))
+        return self._decoded[1]
+
+    def get_grid(self, generation):
+        '''
+        generation in the World nested list format
+        '''
+        bit_grid = BitGrid(self.numX, self.numY)
+        bit_grid.alive[:] = self.get_packed(generation)
+        return bit_grid.to_nested_list()
+
+    def load(self, world, generation):
+        '''
+        set the grid of world to generation
+        '''
+        world.set_grid(self.get_grid(generation))
+
+    def close(self):
+        '''
+        unmap the file
+        '''
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
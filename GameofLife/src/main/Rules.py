@@ -0,0 +1,112 @@
+'''
+
+Outer totalistic Life-like rules in B/S notation
+a dead cell is born if its number of live neighbors is in B & a live
+cell survives if its number is in S, eg
+    Conway's Life  B3/S23
+    HighLife       B36/S23
+    Day & Night    B3678/S34678
+    Seeds          B2/S
+a rule is compiled once into lookup tables that the engines index on
+the hot path instead of branching per cell
+
+Created on Oct 18, 2026
+
+'''
+
+import re
+
+# B/S notation, eg B36/S23, & the older S/B notation, eg 23/36
+_bs_rule = re.compile(r'\s*B([0-8]*)\s*/?\s*S([0-8]*)\s*$', re.IGNORECASE)
+_sb_rule = re.compile(r'\s*([0-8]*)\s*/\s*([0-8]*)\s*$')
+
+class Rule:
+    '''
+    compiled B/S rule
+        next_state[alive][count] : 1 if the cell is alive next generation
+        change[alive][count] : 1 if the cell flips, ie is marked 'z' / 'e'
+        neighborhood[index] : next_state for a 3x3 neighborhood packed
+            row major into 9 bits, bit 4 being the cell itself
+    '''
+
+    def __init__(self, birth, survival):
+        '''
+        constructor
+        Parameters
+        birth = neighbor counts that give birth to a dead cell
+        survival = neighbor counts that keep a live cell alive
+        '''
+        self.birth = frozenset(birth)
+        self.survival = frozenset(survival)
+        if not self.birth | self.survival <= set(range(9)):
+            raise ValueError("neighbor counts must be from 0 to 8")
+        self.next_state = tuple(
+            tuple(int(count in counts) for count in range(9))
+            for counts in (self.birth, self.survival))
+        self.change = tuple(
+            tuple(state ^ alive for state in self.next_state[alive])
+            for alive in (0, 1))
+        # the 8 neighbor bits of a neighborhood index
+        neighbors = 0b111101111
+        self.neighborhood = bytes(
+            self.next_state[(index >> 4) & 1][(index & neighbors).bit_count()]
+            for index in range(512))
+
+    def has_b0(self):
+        '''
+        True if dead cells with no live neighbors are born, so an empty
+        plane doesn't stay empty
+        '''
+        return 0 in self.birth
+
+    def __str__(self):
+        return ('B' + ''.join(map(str, sorted(self.birth))) +
+                '/S' + ''.join(map(str, sorted(self.survival))))
+
+    def __repr__(self):
+        return f"Rule('{self}')"
+
+    def __eq__(self, other):
+        return (isinstance(other, Rule) and self.birth == other.birth and
+                self.survival == other.survival)
+
+    def __hash__(self):
+        return hash((self.birth, self.survival))
+
+def parse_rule(text):
+    '''
+    Rule from B/S notation, eg 'B36/S23', or S/B notation, eg '23/36'
+    '''
+    match = _bs_rule.match(text)
+    if match:
+        birth, survival = match.groups()
+    else:
+        match = _sb_rule.match(text)
+        if match is None:
+            raise ValueError(f"incorrect rule {text}")
+        survival, birth = match.groups()
+    return Rule(map(int, birth), map(int, survival))
+
+CONWAY = parse_rule('B3/S23')
+
+# rules that can be given by name
+RULES = {
+    'conway' : CONWAY,
+    'highlife' : parse_rule('B36/S23'),
+    'day_and_night' : parse_rule('B3678/S34678'),
+    'seeds' : parse_rule('B2/S'),
+    }
+
+def get_rule(rule):
+    '''
+    return the Rule for rule
+    Parameter
+    rule = a Rule, a key of RULES, a rule string or None for Conway
+    '''
+    if rule is None:
+        return CONWAY
+    if isinstance(rule, Rule):
+        return rule
+    if rule.lower() in RULES:
+        return RULES[rule.lower()]
+    return parse_rule(rule)
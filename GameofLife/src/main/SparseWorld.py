@@ -0,0 +1,356 @@
+'''
+
+Sparse backend for the Game of Life World
+only the coordinates of live & marked cells are stored, so memory &
+stepping time scale with the population instead of the grid area
+
+    alive : set of (x, y) of cells that count as live neighbors ('a' or 'z')
+    marks : set of (x, y) of cells marked for transition ('z' or 'e')
+
+bounded mode (the default) keeps the World edges - cells outside
+numX x numY are the ghost cells of the boundary, dead unless it is a
+torus or reflect. Unbounded mode is an infinite plane & the numX x numY
+grid is just the window used by set_grid / get_grid
+
+Created on Oct 18, 2026
+
+'''
+
+import random
+from collections import Counter, namedtuple
+from collections.abc import Set
+from main.GameofLife import World, cell_key
+
+# (alive, marked) -> cell state character
+_states = {(False, False) : 'd', (True, False) : 'a',
+           (False, True) : 'e', (True, True) : 'z'}
+# cell state character -> cell state after set_cell - e > a > z > d > e
+_next_state = {'e' : 'a', 'a' : 'z', 'z' : 'd', 'd' : 'e'}
+
+class CellSet(Set):
+    '''
+    read-only view of a set of (x, y) cells without copying it
+    '''
+
+    def __init__(self, cells):
+        self._cells = cells
+
+    def __contains__(self, cell):
+        return cell in self._cells
+
+    def __iter__(self):
+        return iter(self._cells)
+
+    def __len__(self):
+        return len(self._cells)
+
+# read-only view of a SparseWorld - CellSets of the alive & marks sets
+SparseView = namedtuple('SparseView', ['alive', 'marks'])
+
+class SparseWorld(World):
+    '''
+    World that only stores live & marked cell coordinates
+    '''
+
+    def __init__(self, ncol, nrow, engine='sparse', bounded=True,
+                 rule=None, boundary='dead', step_mode='buffered'):
+        '''
+        constructor
+        Parameters
+        ncol, nrow = grid size, or the window on the plane if not bounded
+        bounded = True for edges like World
+        rule = B/S rule, Conway's B3/S23 if None
+        boundary = what lies past the edges when bounded, see BOUNDARIES
+        step_mode = see STEP_MODES
+        '''
+        self.bounded = bounded
+        super().__init__(ncol, nrow, engine, rule, boundary, step_mode)
+
+    def set_rule(self, rule):
+        '''
+        change the rule
+        a B0 rule would fill an infinite plane so needs bounded mode
+        '''
+        super().set_rule(rule)
+        if self.rule.has_b0() and not self.bounded:
+            raise ValueError(f"{self.rule} needs a bounded SparseWorld")
+
+    def set_boundary(self, boundary):
+        '''
+        change what lies past the edges
+        an infinite plane has no edges so only dead works unbounded
+        '''
+        if boundary != 'dead' and not self.bounded:
+            raise ValueError(f"{boundary} boundary needs a bounded "
+                             "SparseWorld")
+        super().set_boundary(boundary)
+
+    def empty_grid(self):
+        '''
+        no cells to allocate - the grid is the alive & marks sets
+        '''
+        self.alive = set()
+        self.marks = set()
+        return None
+
+    def get_view(self):
+        '''
+        read-only view of the alive & marks sets, not copied
+        '''
+        return SparseView(CellSet(self.alive), CellSet(self.marks))
+
+    @staticmethod
+    def grid_from_view(view, ncol, nrow):
+        '''
+        the ncol x nrow window of a SparseView in the World nested list
+        format
+        '''
+        out_list = [['d' for _ in range(ncol)] for _ in range(nrow)]
+        for x, y in view.alive | view.marks:
+            if (x >= 0 and x < ncol) and (y >= 0 and y < nrow):
+                out_list[y][x] = _states[((x, y) in view.alive,
+                                          (x, y) in view.marks)]
+        return out_list
+
+    def share_grid(self):
+        '''
+        (storage, view) for a new snapshot - the alive set stands for
+        both sets, which are always copied together
+        '''
+        return self.alive, self.get_view()
+
+    def own_grid(self):
+        '''
+        call before the sets are changed in place - sets still shared
+        with a snapshot are swapped for copies first
+        '''
+        if self._snapshots and self.is_shared(self.alive):
+            self.alive = set(self.alive)
+            self.marks = set(self.marks)
+
+    def in_bounds(self, x, y):
+        '''
+        True if x,y can hold a live cell
+        '''
+        return (not self.bounded or
+                ((x >= 0 and x < self.numX) and (y >= 0 and y < self.numY)))
+
+    def put_state(self, x, y, state):
+        '''
+        store cell state character for pos x,y
+        '''
+        self.own_grid()
+        if state == 'a' or state == 'z':
+            self.alive.add((x, y))
+        else:
+            self.alive.discard((x, y))
+        if state == 'z' or state == 'e':
+            self.marks.add((x, y))
+        else:
+            self.marks.discard((x, y))
+
+    def put_run(self, x, y, length):
+        '''
+        set cells x to x+length-1 of row y alive, skipping cells outside
+        the grid if bounded - call grid_changed once all the runs are in
+        '''
+        self.own_grid()
+        if self.bounded:
+            if y < 0 or y >= self.numY:
+                return
+            self.alive.update((nx, y) for nx in range(max(x, 0),
+                                                      min(x + length,
+                                                          self.numX)))
+        else:
+            self.alive.update((nx, y) for nx in range(x, x + length))
+
+    def put_block(self, x, y, block):
+        '''
+        set the cells of a 2-D 0 / 1 numpy array alive with its upper
+        left corner at x, y - call grid_changed once all the blocks are in
+        '''
+        ys, xs = block.nonzero()
+        self.own_grid()
+        self.alive.update(zip((xs + x).tolist(), (ys + y).tolist()))
+
+    def set_grid(self, in_list):
+        '''
+        seed grid with values from a nested list of cell states
+        '''
+        if len(in_list) == self.numY and len(in_list[0]) == self.numX:
+            self.empty_grid()
+            for y, row in enumerate(in_list):
+                for x, cell in enumerate(row):
+                    if cell != 'd':
+                        self.put_state(x, y, cell)
+            self.grid_changed()
+        else:
+            raise Exception("set_grid ERROR - incorrect list dimensions")
+
+    def clear_grid(self):
+        '''
+        clear the grid in between unit tests
+        '''
+        self.empty_grid()
+        self.grid_changed()
+
+    def get_population(self):
+        '''
+        number of live cells
+        '''
+        return len(self.alive)
+
+    def get_live_cells(self):
+        '''
+        sorted list of (x, y) of the live cells
+        '''
+        return sorted(self.alive)
+
+    def get_bounding_box(self):
+        '''
+        (x, y, width, height) of the live cells, None if there are none
+        unbounded the box can reach past the grid
+        '''
+        if not self.alive:
+            return None
+        xs = [x for x, _ in self.alive]
+        ys = [y for _, y in self.alive]
+        return (min(xs), min(ys), max(xs) - min(xs) + 1,
+                max(ys) - min(ys) + 1)
+
+    def get_cell(self, x, y):
+        '''
+        return the state of the cell for pos x,y
+        cells that are not stored are dead
+        '''
+        return _states[((x, y) in self.alive, (x, y) in self.marks)]
+
+    def neighbors(self, x, y):
+        '''
+        x,y & the cells around it - with the ghost cells past the edges
+        resolved to the cells they copy when bounded
+        '''
+        if self.bounded:
+            return [(nx, ny) for ny in self._neighbor_rows[y]
+                    for nx in self._neighbor_cols[x]]
+        return [(nx, ny) for ny in (y - 1, y, y + 1)
+                for nx in (x - 1, x, x + 1)]
+
+    def neighbor_cell_counter(self, xpos, ypos):
+        '''
+        number of live & zombie neighbors of the cell at xpos,ypos
+        '''
+        alive = self.alive
+        return (sum(cell in alive for cell in self.neighbors(xpos, ypos)) -
+                ((xpos, ypos) in alive))
+
+    def set_cell(self, x, y):
+        '''
+        change the cell state in the order e > a > z > d > e
+        '''
+        state = self.get_cell(x, y)
+        self.put_state(x, y, _next_state[state])
+        if state == 'e':
+            self.toggle_alive(x, y, True)
+        elif state == 'z':
+            self.toggle_alive(x, y, False)
+
+    def set_random_cell(self, x, y):
+        '''
+        set cell to a or d randomly
+        draws from random the same way World does so seeds match
+        '''
+        was_alive = (x, y) in self.alive
+        self.put_state(x, y, 'a' if random.random() <= 0.5 else 'd')
+        if was_alive != ((x, y) in self.alive):
+            self.toggle_alive(x, y, not was_alive)
+
+    def rehash(self):
+        '''
+        work out the grid hash & population from the live cells
+        '''
+        self._hash = 0
+        for x, y in self.alive:
+            self._hash ^= cell_key(x, y)
+        self._population = len(self.alive)
+
+    def mark_for_transition(self):
+        '''
+        first half-step - mark cell for birth/death
+        '''
+        changes = self.changes()
+        self.own_grid()
+        self.marks.update(changes)
+
+    def step_buffered(self):
+        '''
+        one pass - the cells that change are flipped straight away
+        without being stored as marks
+        '''
+        flips = self.changes()
+        self.own_grid()
+        if self.marks:
+            flips = self.marks.union(flips)
+            self.marks = set()
+        if self._hash is not None:
+            for x, y in flips:
+                self._hash ^= cell_key(x, y)
+        self._flips += len(flips)
+        self.alive.symmetric_difference_update(flips)
+        if self._population is not None:
+            self._population = len(self.alive)
+
+    def changes(self):
+        '''
+        list of the unmarked cells that change this generation
+        only live cells & their neighbors can change
+        '''
+        counts = Counter()
+        if self.bounded:
+            # ghost cells resolved by set_boundary
+            rows, cols = self._neighbor_rows, self._neighbor_cols
+            for x, y in self.alive:
+                for ny in rows[y]:
+                    for nx in cols[x]:
+                        counts[(nx, ny)] += 1
+        else:
+            for x, y in self.alive:
+                for ny in (y - 1, y, y + 1):
+                    for nx in (x - 1, x, x + 1):
+                        counts[(nx, ny)] += 1
+        for cell in self.alive:
+            # the live cell counted itself
+            counts[cell] -= 1
+        if self.rule.has_b0():
+            # dead cells away from the live ones are born too - only
+            # possible when bounded
+            for y in range(self.numY):
+                for x in range(self.numX):
+                    counts[(x, y)] += 0
+        self.cells_evaluated = len(counts)
+        change = self._change
+        marks = []
+        for cell, count in counts.items():
+            if cell in self.marks:
+                continue
+            if cell in self.alive:
+                if change[1][count]:
+                    marks.append(cell)
+            elif change[0][count] and self.in_bounds(*cell):
+                marks.append(cell)
+        return marks
+
+    def clean_up_grid(self):
+        '''
+        second half-step - kill off zombies & vivify embryo cells
+        every marked cell flips between alive & dead
+        '''
+        self.own_grid()
+        if self._hash is not None:
+            for x, y in self.marks:
+                self._hash ^= cell_key(x, y)
+        self._flips += len(self.marks)
+        self.alive ^= self.marks
+        if self._population is not None:
+            self._population = len(self.alive)
+        self.marks = set()
@@ -0,0 +1,85 @@
+'''
+
+Stats logging for Game of Life runs
+World.get_stats is written once per generation as a CSV row or a JSON
+line, from the step callback so nothing polls or copies the grid
+
+    generation,population,births,deaths,x,y,width,height,step_time
+    {"generation": 1, "population": 7, ..., "bounding_box": [2, 3, 4, 3]}
+
+Created on Oct 18, 2026
+
+'''
+
+import csv
+import json
+
+LOG_FORMATS = ('csv', 'jsonl')
+
+# CSV columns - the bounding box is split into its 4 numbers, left
+# empty when there are no live cells
+CSV_FIELDS = ['generation', 'population', 'births', 'deaths',
+              'x', 'y', 'width', 'height', 'step_time']
+
+class StatsLog:
+    '''
+    log of a World's stats, one line per generation
+    '''
+
+    def __init__(self, path, log_format=None):
+        '''
+        constructor - creates the file & writes the CSV header
+        Parameters
+        path = file to write
+        log_format = 'csv' or 'jsonl' - csv for a .csv path & jsonl
+            otherwise if None
+        '''
+        if log_format is None:
+            log_format = 'csv' if str(path).lower().endswith('.csv') \
+                    else 'jsonl'
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"unknown stats log format {log_format}")
+        self.log_format = log_format
+        self._world = None
+        self._file = open(path, 'w', newline='')
+        self._writer = None
+        if log_format == 'csv':
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(CSV_FIELDS)
+
+    def write(self, world):
+        '''
+        log the stats of world now - can be given to
+        World.set_step_callback
+        '''
+        stats = world.get_stats()
+        if self._writer is not None:
+            box = stats.bounding_box or ('',) * 4
+            self._writer.writerow([stats.generation, stats.population,
+                                   stats.births, stats.deaths, *box,
+                                   stats.step_time])
+        else:
+            self._file.write(json.dumps(stats._asdict()) + '\n')
+
+    def attach(self, world):
+        '''
+        log world's stats now & after every step until close
+        '''
+        self.write(world)
+        world.set_step_callback(self.write)
+        self._world = world
+
+    def close(self):
+        '''
+        stop logging the attached world & close the file
+        '''
+        if self._world is not None:
+            self._world.set_step_callback(None)
+            self._world = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,140 @@
+'''
+
+Background stepping for the Game of Life
+a SteppingThread owns a World & steps it at a target rate, publishing
+each finished generation as a Snapshot. The UI draws the latest snapshot
+at its own frame rate, so the simulation rate no longer depends on how
+fast frames are drawn & events are handled
+
+the world is only touched by the thread while it runs - read the grid
+through get_snapshot instead of the World
+
+Created on Oct 18, 2026
+
+'''
+
+import time
+import threading
+from collections import namedtuple
+
+class Snapshot(namedtuple('Snapshot', ['cells', 'generation', 'outcome'])):
+    '''
+    one finished generation
+        cells : World.snapshot() of the generation - copy on write, so
+            publishing a generation doesn't copy the grid
+        generation : generations stepped since the thread started
+        outcome : World.get_outcome() for the grid, None unless the
+            thread stops when settled or the world already looks for
+            cycles - asking for it turns on cycle detection
+    '''
+
+    @property
+    def grid(self):
+        '''
+        World nested list format, a new copy made from cells
+        '''
+        return self.cells.get_grid()
+
+class SteppingThread(threading.Thread):
+    '''
+    daemon thread stepping a World until stopped
+    '''
+
+    def __init__(self, world, generations_per_sec=float('inf'),
+                 stop_when_settled=False):
+        '''
+        constructor - call start() to begin stepping
+        Parameters
+        world = World to step, not to be used by anyone else while running
+        generations_per_sec = target rate, inf to step as fast as possible
+        stop_when_settled = stop stepping once the world is still,
+            oscillating or extinct
+        '''
+        super().__init__(daemon=True)
+        if generations_per_sec <= 0:
+            raise ValueError("generations_per_sec must be positive")
+        self.world = world
+        self.generations_per_sec = generations_per_sec
+        self.stop_when_settled = stop_when_settled
+        self.generation = 0
+        self._lock = threading.Lock()
+        # set while stepping is allowed, cleared to pause
+        self._running = threading.Event()
+        self._running.set()
+        self._stopped = threading.Event()
+        # front buffer - the last finished generation
+        self._front = self.take_snapshot()
+
+    def take_snapshot(self):
+        '''
+        current world state, the back buffer until published
+        the world copies the grid before changing it while the
+        snapshot is held, so the UI never sees a half stepped grid
+        '''
+        outcome = None
+        if self.stop_when_settled or self.world.detect_cycles:
+            outcome = self.world.get_outcome()
+        return Snapshot(self.world.snapshot(), self.generation, outcome)
+
+    def get_snapshot(self):
+        '''
+        latest finished generation - never a half stepped grid
+        '''
+        with self._lock:
+            return self._front
+
+    def pause(self):
+        '''
+        stop stepping after the current generation
+        '''
+        self._running.clear()
+
+    def resume(self):
+        '''
+        carry on stepping after pause
+        '''
+        self._running.set()
+
+    def is_paused(self):
+        '''
+        True if paused
+        '''
+        return not self._running.is_set()
+
+    def stop(self, timeout=None):
+        '''
+        end the thread & wait for it to finish
+        '''
+        self._stopped.set()
+        # wake the thread up if paused
+        self._running.set()
+        if self.is_alive():
+            self.join(timeout)
+
+    def run(self):
+        '''
+        step the world, publish each generation & keep to the target rate
+        '''
+        interval = 1 / self.generations_per_sec
+        next_time = time.perf_counter()
+        while not self._stopped.is_set():
+            if not self._running.is_set():
+                self._running.wait()
+                # don't catch up on the generations missed while paused
+                next_time = time.perf_counter()
+                continue
+            if self.stop_when_settled and self.world.is_settled():
+                break
+            self.world.step()
+            self.generation += 1
+            snapshot = self.take_snapshot()
+            with self._lock:
+                self._front = snapshot
+            next_time += interval
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                # returns early on stop
+                self._stopped.wait(delay)
+            elif interval:
+                # running behind - don't try to catch up
+                next_time = time.perf_counter()
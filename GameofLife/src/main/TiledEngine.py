@@ -0,0 +1,304 @@
+'''
+
+Multi-core backend for the Game of Life World
+the grid of cell codes (see NumpyEngine) lives in shared memory & is
+split into tiles that are stepped in parallel by a process pool
+
+each worker reads the one cell halo around its tile straight from
+the neighboring tiles in shared memory, or from the cells the ghost
+cells copy past the grid edges, so nothing else has to be copied
+between processes. Marking only changes the marked bit &
+the neighbor count only reads the live bit, so tiles never race
+
+a buffered step is one pass of the pool - there are 2 shared grids &
+each worker writes the next generation of its tile into the one that
+isn't the grid, then they swap. The workers also count & hash the cells
+of their tile that flip, so the grid is never scanned between passes
+
+Created on Oct 18, 2026
+
+'''
+
+import os
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from main.NumpyEngine import NumpyWorld, to_array, hash_cells
+from main.NumpyEngine import mark_for_transition, clean_up_grid
+from main.NumpyEngine import neighbor_sums, fill_ghosts, EMBRYO, ZOMBIE
+
+# shared memory blocks attached by this worker process
+# name -> SharedMemory
+_attached = {}
+
+def _attach(name, shape):
+    '''
+    array view of the shared grid in a worker process
+    '''
+    if name not in _attached:
+        # pool workers share the resource tracker of the process that
+        # created the block, so it is only unlinked once by close()
+        _attached[name] = shared_memory.SharedMemory(name=name)
+    return np.ndarray(shape, dtype=np.uint8, buffer=_attached[name].buf)
+
+def _tile_counts(grid, bounds, boundary):
+    '''
+    neighbor counts of one tile
+    the tile plus its halo, then the ghost cells past the grid edges
+    '''
+    x0, y0, x1, y1 = bounds
+    nrow, ncol = grid.shape
+    top, left = max(y0 - 1, 0), max(x0 - 1, 0)
+    bottom, right = min(y1 + 1, nrow), min(x1 + 1, ncol)
+    live = np.zeros((y1 - y0 + 2, x1 - x0 + 2), dtype=np.uint8)
+    live[top - y0 + 1:bottom - y0 + 1, left - x0 + 1:right - x0 + 1] = \
+        grid[top:bottom, left:right] & 1
+    fill_ghosts(live, grid, bounds, boundary)
+    return neighbor_sums(live)
+
+def _tile_half_step(name, shape, bounds, marking, table=None,
+                    boundary='dead', counting=False, hashing=False):
+    '''
+    do a half-step on one tile in a worker process
+    returns (seconds, births, deaths, hash of the cells that flipped)
+    births, deaths & hash are 0 unless cleaning up & counting, hashing
+    Parameters
+    name, shape = shared grid
+    bounds = (x0, y0, x1, y1) of the tile, x1 & y1 exclusive
+    marking = True for mark_for_transition, False for clean_up_grid
+    table = change_table of the rule for mark_for_transition
+    boundary = what lies past the grid edges, see BOUNDARIES
+    counting, hashing = count & hash the marked cells as they flip
+    '''
+    start = time.perf_counter()
+    grid = _attach(name, shape)
+    x0, y0, x1, y1 = bounds
+    tile = grid[y0:y1, x0:x1]
+    births = deaths = key = 0
+    if marking:
+        mark_for_transition(tile, _tile_counts(grid, bounds, boundary),
+                            table)
+    else:
+        if counting:
+            births = int(np.count_nonzero(tile == EMBRYO))
+            deaths = int(np.count_nonzero(tile == ZOMBIE))
+        if hashing:
+            key = hash_cells(tile >= EMBRYO, x0, y0)
+        clean_up_grid(tile)
+    return time.perf_counter() - start, births, deaths, key
+
+def _tile_step(names, shape, bounds, table, boundary='dead',
+               counting=False, hashing=False):
+    '''
+    one generation of one tile in a worker process, read from the
+    first shared grid & written to the second
+    returns (seconds, cells that flipped, live cells, hash of the cells
+    that flipped) - the counts & hash are 0 unless counting, hashing
+    Parameters
+    names = the 2 shared grids, (from, to)
+    shape, bounds, boundary = as _tile_half_step
+    table = next_table of the rule
+    '''
+    start = time.perf_counter()
+    grid = _attach(names[0], shape)
+    x0, y0, x1, y1 = bounds
+    tile = grid[y0:y1, x0:x1]
+    # looked up with bytearray.translate like NumpyWorld.step_buffered
+    index = bytearray(tile.size)
+    packed = np.frombuffer(index, dtype=np.uint8).reshape(tile.shape)
+    np.left_shift(tile, 4, out=packed)
+    packed |= _tile_counts(grid, bounds, boundary)
+    new_tile = np.frombuffer(index.translate(table),
+                             dtype=np.uint8).reshape(tile.shape)
+    _attach(names[1], shape)[y0:y1, x0:x1] = new_tile
+    flips = population = key = 0
+    if counting or hashing:
+        flipped = (tile & 1) != new_tile
+        flips = int(np.count_nonzero(flipped))
+        population = int(np.count_nonzero(new_tile))
+        if hashing and flips:
+            key = hash_cells(flipped, x0, y0)
+    return time.perf_counter() - start, flips, population, key
+
+def tile_bounds(ncol, nrow, tiles):
+    '''
+    split the grid into tiles
+    returns a list of (x0, y0, x1, y1)
+    Parameters
+    ncol, nrow = grid size
+    tiles = (rows, cols) of tiles - (n, 1) gives horizontal strips
+    '''
+    rows, cols = tiles
+    ys = [nrow * i // rows for i in range(rows + 1)]
+    xs = [ncol * i // cols for i in range(cols + 1)]
+    return [(xs[col], ys[row], xs[col + 1], ys[row + 1])
+            for row in range(rows) for col in range(cols)
+            if ys[row] < ys[row + 1] and xs[col] < xs[col + 1]]
+
+def _release(pool_holder, shms):
+    '''
+    shut down the pool & free the shared grids
+    '''
+    if pool_holder:
+        pool_holder.pop().shutdown()
+    for shm in shms:
+        shm.close()
+        shm.unlink()
+
+class TiledWorld(NumpyWorld):
+    '''
+    NumpyWorld stepped in parallel tiles
+    call close() (or use it as a context manager) to free the
+    process pool & shared memory when done
+    '''
+
+    # the workers step the shared memory grid, so snapshots copy it
+    copy_snapshots = True
+
+    def __init__(self, ncol, nrow, engine='tiled', tiles=None,
+                 workers=None, rule=None, boundary='dead',
+                 step_mode='buffered'):
+        '''
+        constructor
+        Parameters
+        ncol, nrow = grid size
+        tiles = (rows, cols) of tiles, defaults to 1 strip per worker
+        workers = number of worker processes, defaults to the cpu count
+        rule = B/S rule, Conway's B3/S23 if None
+        boundary = what lies past the grid edges, see BOUNDARIES
+        step_mode = see STEP_MODES
+        '''
+        self.workers = workers or os.cpu_count() or 1
+        self.tiles = tile_bounds(ncol, nrow, tiles or (self.workers, 1))
+        # the grid & the block a buffered step writes the next
+        # generation to, swapped after every buffered step
+        self._shms = [shared_memory.SharedMemory(create=True,
+                                                 size=max(ncol * nrow, 1))
+                      for _ in range(2)]
+        self._grids = [np.ndarray((nrow, ncol), dtype=np.uint8,
+                                  buffer=shm.buf) for shm in self._shms]
+        super().__init__(ncol, nrow, engine, rule, boundary, step_mode)
+        # pool is started on the first half-step
+        self._pool = []
+        # seconds per tile for the last half-steps & buffered step
+        self.tile_timings = [{'tile' : bounds, 'mark' : 0.0, 'clean' : 0.0,
+                              'step' : 0.0} for bounds in self.tiles]
+        self._finalizer = weakref.finalize(self, _release, self._pool,
+                                           self._shms)
+
+    def empty_grid(self):
+        '''
+        grid of dead cells in the shared memory block that is the grid
+        '''
+        grid = self._grids[0]
+        grid[:] = 0
+        return grid
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        '''
+        shut down the process pool & free the shared memory
+        '''
+        self.grid = np.zeros((self.numY, self.numX), dtype=np.uint8)
+        self._grids.clear()
+        self._finalizer()
+
+    def set_grid(self, in_list):
+        '''
+        seed grid with values from a nested list of cell states
+        the values are copied into the shared grid
+        '''
+        if len(in_list) == self.numY and len(in_list[0]) == self.numX:
+            self.grid[:] = to_array(in_list)
+            self.grid_changed()
+        else:
+            raise Exception("set_grid ERROR - incorrect list dimensions")
+
+    def clear_grid(self):
+        '''
+        clear the grid in between unit tests
+        '''
+        self.grid[:] = 0
+        self.grid_changed()
+
+    def get_tile_timings(self):
+        '''
+        per-tile breakdown of the last half-steps & buffered step
+        list of {'tile' : (x0, y0, x1, y1), 'mark' : s, 'clean' : s,
+                 'step' : s}
+        '''
+        return [timing.copy() for timing in self.tile_timings]
+
+    def run_tiles(self, name, function, *args):
+        '''
+        call function(*args, bounds, ...) for every tile in the process
+        pool, whether to count & hash passed last
+        the seconds each took go in tile_timings[name]
+        returns the sums of the counts & the xor of the hashes
+        '''
+        if not self._pool:
+            self._pool.append(ProcessPoolExecutor(self.workers))
+        shape = (self.numY, self.numX)
+        tracking = (self._population is not None, self._hash is not None)
+        futures = [self._pool[0].submit(function, args[0], shape, bounds,
+                                        *args[1:], *tracking)
+                   for bounds in self.tiles]
+        first = second = key = 0
+        for timing, future in zip(self.tile_timings, futures):
+            timing[name], tile_first, tile_second, tile_key = future.result()
+            first += tile_first
+            second += tile_second
+            key ^= tile_key
+        return first, second, key
+
+    def shared_name(self):
+        '''
+        name of the shared memory block that is the grid
+        '''
+        return self._shms[0 if self.grid is self._grids[0] else 1].name
+
+    def mark_for_transition(self):
+        '''
+        first half-step - mark cell for birth/death
+        '''
+        self.cells_evaluated = self.numX * self.numY
+        self.run_tiles('mark', _tile_half_step, self.shared_name(), True,
+                       self._table, self.boundary)
+
+    def clean_up_grid(self):
+        '''
+        second half-step - kill off zombies & vivify embryo cells
+        the workers count & hash the cells that flip
+        '''
+        births, deaths, key = self.run_tiles(
+            'clean', _tile_half_step, self.shared_name(), False, None,
+            self.boundary)
+        if self._population is not None:
+            if self._hash is not None:
+                self._hash ^= key
+            self._population += births - deaths
+            self._flips += births + deaths
+
+    def step_buffered(self):
+        '''
+        one pass of the pool - every tile of the next generation is
+        written into the other shared grid, which becomes the grid
+        '''
+        self.cells_evaluated = self.numX * self.numY
+        back = 1 if self.grid is self._grids[0] else 0
+        names = (self._shms[1 - back].name, self._shms[back].name)
+        flips, population, key = self.run_tiles(
+            'step', _tile_step, names, self._next_table, self.boundary)
+        if self._population is not None:
+            if self._hash is not None:
+                self._hash ^= key
+            self._population = population
+            self._flips += flips
+        self.grid = self._grids[back]
@@ -0,0 +1,107 @@
+'''
+unit tests for the batch of boards
+boards are checked against replaying their seed in a World
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from main.GameofLife import World
+from main.BatchWorld import BatchWorld
+
+class TestBatchWorld():
+
+    block = [['d','d','d','d'],['d','a','a','d'],['d','a','a','d'],
+             ['d','d','d','d']]
+    blinker = [['d','d','d','d'],['d','a','d','d'],['d','a','d','d'],
+               ['d','a','d','d']]
+    lonely = [['d','d','d','d'],['d','a','d','d'],['d','d','d','d'],
+              ['d','d','d','d']]
+
+    @mark.parametrize("ncol, nrow", [(8, 8), (11, 5)])
+    def test_boards_replay_in_world(self, ncol, nrow):
+        '''
+        every board matches a World seeded the same way, 
+        before & after stepping
+        '''
+        batch = BatchWorld(ncol, nrow, [3, 14, 15, 92])
+        worlds = []
+        for seed in batch.seeds:
+            world = World(ncol, nrow)
+            random.seed(seed)
+            world.set_random_grid()
+            worlds.append(world)
+        for _ in range(6):
+            for board, world in enumerate(worlds):
+                assert batch.get_board(board) == world.get_grid()
+            batch.step()
+            for world in worlds:
+                world.mark_for_transition()
+                world.clean_up_grid()
+
+    def test_outcomes(self):
+        '''
+        still life, oscillator & extinction are told apart
+        '''
+        batch = BatchWorld(4, 4, [0, 0, 0])
+        batch.set_board(0, self.block)
+        batch.set_board(1, self.blinker)
+        batch.set_board(2, self.lonely)
+        assert batch.run(10) < 10
+        assert batch.get_periods().tolist() == [1, 2, 1]
+        assert batch.get_first_repeat().tolist() == [1, 2, 1]
+        assert batch.get_populations().tolist() == [4, 3, 0]
+        assert batch.get_extinct().tolist() == [False, False, True]
+
+    @mark.parametrize("max_period", [64, 3])
+    def test_outcomes_match_world(self, max_period):
+        '''
+        period, first repeat & hash of each board are what World finds
+        for the same seed - extinct soups settle the generation they die
+        '''
+        batch = BatchWorld(6, 6, range(12), max_period=max_period)
+        batch.run(60, stop_when_settled=False)
+        assert batch.get_extinct()[:3].all()
+        for board, seed in enumerate(batch.seeds):
+            world = World(6, 6)
+            world.max_period = max_period
+            random.seed(seed)
+            world.set_random_grid()
+            world.set_cycle_detection()
+            world.run(60, stop_when_settled=False)
+            assert batch.get_periods()[board] == world.get_period()
+            assert batch.get_first_repeat()[board] == \
+                world.get_first_repeat()
+            assert batch.get_hashes()[board] == world.get_hash()
+
+    def test_set_board_history(self):
+        '''
+        a board set part way through finds its repeats from then on &
+        the other boards aren't disturbed
+        '''
+        batch = BatchWorld(4, 4, [0, 0])
+        batch.set_board(0, self.blinker)
+        batch.set_board(1, self.blinker)
+        batch.step()
+        batch.set_board(1, self.block)
+        batch.step()
+        assert batch.get_periods().tolist() == [2, 1]
+        assert batch.get_first_repeat().tolist() == [2, 2]
+
+    def test_run_without_stopping(self):
+        '''
+        run keeps stepping when asked not to stop on settled boards
+        '''
+        batch = BatchWorld(4, 4, [0])
+        batch.set_board(0, self.block)
+        assert batch.run(5, stop_when_settled=False) == 5
+        assert batch.generation == 5
+
+    def test_period_longer_than_history(self):
+        '''
+        a cycle longer than max_period isn't reported
+        '''
+        batch = BatchWorld(4, 4, [0], max_period=1)
+        batch.set_board(0, self.blinker)
+        batch.run(10)
+        assert batch.get_periods().tolist() == [0]
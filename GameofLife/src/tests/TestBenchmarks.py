@@ -0,0 +1,62 @@
+'''
+smoke tests for the benchmark suite
+
+Created on Oct 18, 2026
+'''
+import json
+from main.GameofLife import World
+from bench.Benchmarks import main, compare, time_world
+
+class TestBenchmarks():
+
+    def test_json_output(self, tmp_path):
+        '''
+        a tiny run writes machine readable results for every benchmark
+        '''
+        output = tmp_path / 'results.json'
+        assert main(['--engines', 'python', 'numpy', '--sizes', '16', '40',
+                     '--densities', '0.3', '--patterns', 'acorn',
+                     'gosper_gun', '--repeats', '1', '--draw',
+                     '--output', str(output)]) == 0
+        report = json.loads(output.read_text())
+        benchmarks = {record['benchmark'] for record in report['results']}
+        assert benchmarks == {'neighbor_cell_counter', 'mark_for_transition',
+                              'clean_up_grid', 'generation', 'draw_world'}
+        # gosper gun only fits the 40 x 40 grid
+        cases = {(record['ncol'], record.get('density'),
+                  record.get('pattern')) for record in report['results']}
+        assert cases == {(16, 0.3, None), (16, None, 'acorn'),
+                         (40, 0.3, None), (40, None, 'acorn'),
+                         (40, None, 'gosper_gun')}
+        assert {record['engine'] for record in report['results']} == \
+            {'python', 'numpy'}
+        assert all(record['seconds'] > 0 for record in report['results'])
+
+    def test_repeats_start_from_grid(self, monkeypatch):
+        '''
+        every timed step evaluates the whole seeded grid, not just the
+        cells the repeat before left changing
+        '''
+        evaluated = []
+        step = World.step
+
+        def counted_step(world):
+            step(world)
+            evaluated.append(world.get_cells_evaluated())
+
+        monkeypatch.setattr(World, 'step', counted_step)
+        grid = [['d'] * 20 for _ in range(20)]
+        grid[10][9:12] = ['a', 'a', 'a']
+        time_world('python', grid, 3)
+        assert evaluated == [400, 400, 400]
+
+    def test_compare(self):
+        '''
+        matching benchmarks are compared as old / new seconds
+        '''
+        old = [{'benchmark' : 'generation', 'engine' : 'python',
+                'ncol' : 64, 'nrow' : 64, 'density' : 0.5, 'seconds' : 4.0}]
+        new = [dict(old[0], seconds=2.0),
+               dict(old[0], engine='numpy', seconds=1.0)]
+        speedups = compare(old, new)
+        assert list(speedups.values()) == [2.0]
@@ -0,0 +1,118 @@
+'''
+unit tests for the bit-packed grid storage & the BitWorld backend
+results are checked against the nested list World
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from main.GameofLife import World
+from main.BitGrid import BitGrid, BitWorld, add_bits, count_equals
+
+class TestBitGrid():
+
+    init_grid = [['a','z','a','a','z'],['z','a','a','a','a'],
+                 ['a','a','z','e','a'],['a','d','z','a','d'],
+                 ['a','z','z','d','d']]
+
+    def test_nested_list_round_trip(self):
+        '''
+        converting to a BitGrid & back keeps every cell state
+        '''
+        bit_grid = BitGrid.from_nested_list(self.init_grid)
+        assert bit_grid.to_nested_list() == self.init_grid
+
+    def test_packed_size(self):
+        '''
+        each plane takes 1 bit per cell, rows padded to a whole byte
+        '''
+        bit_grid = BitGrid(17, 3)
+        assert len(bit_grid.alive) == 3 * 3
+        assert len(bit_grid.marks) == 3 * 3
+
+    @mark.parametrize("state", ['d', 'a', 'e', 'z'])
+    def test_put_get_state(self, state):
+        '''
+        put_state / get_state store all 4 cell states
+        '''
+        bit_grid = BitGrid(11, 2)
+        bit_grid.put_state(9, 1, state)
+        assert bit_grid.get_state(9, 1) == state
+        assert bit_grid.get_state(8, 1) == 'd'
+
+    @mark.parametrize("bits", [[0b1011, 0b0110, 0b1111],
+            [0b1, 0b1, 0b1, 0b1, 0b1, 0b1, 0b1, 0b1]])
+    def test_add_bits(self, bits):
+        '''
+        bit-sliced sum matches counting each bit position
+        '''
+        planes = add_bits(bits)
+        for pos in range(4):
+            count = sum((value >> pos) & 1 for value in bits)
+            assert count_equals(planes, count, 0b1111) & (1 << pos)
+
+class TestBitWorld():
+
+    init_grid = TestBitGrid.init_grid
+
+    def test_engine_picked_at_construction(self):
+        '''
+        World(..., engine='bitpacked') should give a BitWorld
+        '''
+        world = World(4, 3, engine='bitpacked')
+        assert isinstance(world, BitWorld)
+        assert world.get_grid() == [['d'] * 4 for _ in range(3)]
+
+    @mark.parametrize("xpos, ypos, exp_state", [(3,2,'a'), (0,0,'z'),
+                (2,4,'d'), (4,3,'e')], ids = ['e_to_a', 'a_to_z', 'z_to_d',
+                'd_to_e'])
+    def test_set_cell(self, xpos, ypos, exp_state):
+        '''
+        set_cell follows e > a > z > d > e
+        '''
+        world = World(5, 5, engine='bitpacked')
+        world.set_grid(self.init_grid)
+        world.set_cell(xpos, ypos)
+        assert world.get_cell(xpos, ypos) == exp_state
+
+    def test_neighbor_cell_counter(self):
+        '''
+        inherited neighbor counting works through get_cell
+        '''
+        world = World(5, 5, engine='bitpacked')
+        world.set_grid(self.init_grid)
+        assert world.neighbor_cell_counter(2, 2) == 6
+        assert world.neighbor_cell_counter(4, 4) == 1
+
+    @mark.parametrize("ncol, nrow, seed", [(5,5,1), (3,5,2), (17,11,3),
+            (1,1,4), (70,2,5)])
+    def test_generations_match(self, ncol, nrow, seed):
+        '''
+        both half steps match the python World for several generations
+        '''
+        worlds = []
+        for engine in ('python', 'bitpacked'):
+            world = World(ncol, nrow, engine=engine)
+            random.seed(seed)
+            world.set_random_grid()
+            worlds.append(world)
+        python_world, bit_world = worlds
+        for _ in range(10):
+            python_world.mark_for_transition()
+            bit_world.mark_for_transition()
+            assert bit_world.get_grid() == python_world.get_grid()
+            python_world.clean_up_grid()
+            bit_world.clean_up_grid()
+            assert bit_world.get_grid() == python_world.get_grid()
+
+    def test_mark_leaves_marked_cells(self):
+        '''
+        cells that are already 'z' or 'e' are not marked again
+        '''
+        python_world = World(5, 5)
+        python_world.set_grid(self.init_grid)
+        bit_world = World(5, 5, engine='bitpacked')
+        bit_world.set_grid(self.init_grid)
+        python_world.mark_for_transition()
+        bit_world.mark_for_transition()
+        assert bit_world.get_grid() == python_world.get_grid()
@@ -0,0 +1,191 @@
+'''
+unit tests for the dead, torus & reflect boundary modes
+every engine is checked against the nested list World with the same
+boundary, & World against neighbor counts worked out with modular or
+clamped coordinates
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from pytest import fixture
+from pytest import raises
+from main.GameofLife import World, ghost_indices, neighbor_indices
+from main.BatchWorld import BatchWorld
+
+def expected_count(grid, xpos, ypos, boundary):
+    '''
+    live neighbors of xpos,ypos - coordinates wrap on a torus & are
+    clamped to the edge when reflecting
+    '''
+    nrow, ncol = len(grid), len(grid[0])
+    total = 0
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            if dx == 0 and dy == 0:
+                continue
+            x, y = xpos + dx, ypos + dy
+            if boundary == 'torus':
+                x, y = x % ncol, y % nrow
+            elif boundary == 'reflect':
+                x, y = min(max(x, 0), ncol - 1), min(max(y, 0), nrow - 1)
+            elif not (0 <= x < ncol and 0 <= y < nrow):
+                continue
+            total += grid[y][x] in ('a', 'z')
+    return total
+
+class TestBoundaries():
+
+    glider = [['d','a','d'],['d','d','a'],['a','a','a']]
+
+    @fixture
+    def make_world(self, tmp_path):
+        '''
+        factory for worlds of any engine, closed after the test
+        '''
+        worlds = []
+
+        def _make_world(ncol, nrow, engine, boundary):
+            options = {}
+            if engine == 'tiled':
+                options = {'tiles' : (2, 2), 'workers' : 2}
+            elif engine == 'mapped':
+                options = {'path' : tmp_path / 'world.golmap'}
+            world = World(ncol, nrow, engine, boundary=boundary, **options)
+            worlds.append(world)
+            return world
+
+        yield _make_world
+
+        for world in worlds:
+            if hasattr(world, 'close'):
+                world.close()
+
+    @mark.parametrize("boundary, expected", [
+            ('dead', [None, 0, 1, 2, 3, None]),
+            ('torus', [3, 0, 1, 2, 3, 0]),
+            ('reflect', [0, 0, 1, 2, 3, 3])])
+    def test_ghost_indices(self, boundary, expected):
+        '''
+        ghost cells copy the opposite edge on a torus & the edge itself
+        when reflecting
+        '''
+        assert ghost_indices(4, boundary) == expected
+
+    def test_neighbor_indices(self):
+        '''
+        dead ghosts are left out of the neighbors
+        '''
+        assert neighbor_indices(3, 'dead') == [(0, 1), (0, 1, 2), (1, 2)]
+        assert neighbor_indices(1, 'torus') == [(0, 0, 0)]
+
+    def test_unknown_boundary(self):
+        '''
+        anything but BOUNDARIES raises ValueError
+        '''
+        with raises(ValueError):
+            World(3, 3, boundary='klein')
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    @mark.parametrize("boundary", ['dead', 'torus', 'reflect'])
+    @mark.parametrize("ncol, nrow", [(7, 5), (1, 4), (2, 2)])
+    def test_neighbor_cell_counter(self, engine, boundary, ncol, nrow):
+        '''
+        every cell, edges & corners included, counts its ghost cells
+        '''
+        world = World(ncol, nrow, engine, boundary=boundary)
+        random.seed(ncol * nrow)
+        world.set_random_grid()
+        grid = world.get_grid()
+        for y in range(nrow):
+            for x in range(ncol):
+                assert world.neighbor_cell_counter(x, y) == \
+                        expected_count(grid, x, y, boundary)
+
+    @mark.parametrize("engine", ['numpy', 'bitpacked', 'sparse', 'tiled',
+                                 'mapped'])
+    @mark.parametrize("boundary", ['dead', 'torus', 'reflect'])
+    @mark.parametrize("ncol, nrow, seed", [(17, 13, 1), (9, 1, 2),
+                                           (3, 2, 3)])
+    def test_engines_match(self, make_world, engine, boundary, ncol, nrow,
+                           seed):
+        '''
+        stepping matches the python World with the same boundary
+        '''
+        python_world = World(ncol, nrow, boundary=boundary)
+        random.seed(seed)
+        python_world.set_random_grid()
+        world = make_world(ncol, nrow, engine, boundary)
+        world.set_grid(python_world.get_grid())
+        for _ in range(10):
+            python_world.step()
+            world.step()
+            assert world.get_grid() == python_world.get_grid()
+            assert world.get_hash() == python_world.get_hash()
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked'])
+    def test_glider_wraps(self, engine):
+        '''
+        a glider across the corner of an 8x8 torus is back where it
+        started after 8 x 4 generations
+        '''
+        grid = [['d'] * 8 for _ in range(8)]
+        for y, row in enumerate(self.glider):
+            for x, cell in enumerate(row):
+                grid[(y + 6) % 8][(x + 6) % 8] = cell
+        world = World(8, 8, engine, boundary='torus')
+        world.set_grid(grid)
+        world.set_cycle_detection()
+        world.run(32, False)
+        assert world.get_grid() == grid
+        assert world.get_period() == 32
+
+    def test_set_boundary(self):
+        '''
+        changing the boundary between steps uses it from then on
+        '''
+        python_world = World(10, 10)
+        random.seed(4)
+        python_world.set_random_grid()
+        world = World(10, 10, 'numpy')
+        world.set_grid(python_world.get_grid())
+        for boundary in ('torus', 'dead', 'reflect'):
+            python_world.set_boundary(boundary)
+            world.set_boundary(boundary)
+            python_world.run(3, False)
+            world.run(3, False)
+            assert world.get_grid() == python_world.get_grid()
+
+    def test_unbounded_sparse(self):
+        '''
+        an infinite plane has no edges to wrap or reflect
+        '''
+        with raises(ValueError):
+            World(5, 5, 'sparse', bounded=False, boundary='torus')
+
+    @mark.parametrize("boundary", ['torus', 'reflect'])
+    def test_batch_matches_world(self, boundary):
+        '''
+        every board of a batch steps like a World with the same boundary
+        '''
+        batch = BatchWorld(8, 6, [5, 6], boundary=boundary)
+        worlds = []
+        for board in range(batch.get_size()):
+            world = World(8, 6, boundary=boundary)
+            world.set_grid(batch.get_board(board))
+            worlds.append(world)
+        batch.run(8, False)
+        for board, world in enumerate(worlds):
+            world.run(8, False)
+            assert batch.get_board(board) == world.get_grid()
+
+    def test_mapped_boundary_resumes(self, tmp_path):
+        '''
+        the boundary is saved in the mapped world header
+        '''
+        from main.MappedWorld import resume_world
+        path = tmp_path / 'torus.golmap'
+        with World(8, 8, 'mapped', path=path, boundary='torus') as world:
+            world.checkpoint()
+        with resume_world(path) as resumed:
+            assert resumed.boundary == 'torus'
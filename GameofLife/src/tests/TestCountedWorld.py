@@ -0,0 +1,114 @@
+'''
+unit tests for the neighbor count cache backend
+the cached counts are checked against World.neighbor_cell_counter
+summing the same grid, & stepping against the nested list World
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from main.GameofLife import World
+from main.CountedWorld import CountedWorld
+
+def check_counts(world):
+    '''
+    every cached count matches the sum of the cell's neighbors
+    '''
+    for y in range(world.numY):
+        for x in range(world.numX):
+            assert world.neighbor_cell_counter(x, y) == \
+                    World.neighbor_cell_counter(world, x, y)
+
+class TestCountedWorld():
+
+    def test_engine_picked_at_construction(self):
+        '''
+        World(..., engine='counted') should give a CountedWorld
+        '''
+        assert isinstance(World(4, 3, 'counted'), CountedWorld)
+
+    @mark.parametrize("boundary", ['dead', 'torus', 'reflect'])
+    @mark.parametrize("step_mode", ['buffered', 'halfsteps'])
+    @mark.parametrize("ncol, nrow, seed", [(17, 11, 1), (1, 3, 2),
+                                           (2, 2, 3), (30, 30, 4)])
+    def test_counts_match(self, boundary, step_mode, ncol, nrow, seed):
+        '''
+        the cache stays right generation after generation & stepping
+        matches World
+        '''
+        python_world = World(ncol, nrow, boundary=boundary)
+        random.seed(seed)
+        python_world.set_random_grid()
+        world = World(ncol, nrow, 'counted', boundary=boundary,
+                      step_mode=step_mode)
+        world.set_grid(python_world.get_grid())
+        check_counts(world)
+        for _ in range(12):
+            python_world.step()
+            world.step()
+            assert world.get_grid() == python_world.get_grid()
+            assert world.get_hash() == python_world.get_hash()
+            check_counts(world)
+
+    def test_set_cell(self):
+        '''
+        cells flipped by hand update their neighbors' counts
+        '''
+        world = World(6, 5, 'counted', boundary='torus')
+        random.seed(5)
+        world.set_random_grid()
+        world.step()
+        for x, y in ((0, 0), (5, 4), (2, 3)):
+            # d > e > a or a > z > d
+            world.set_cell(x, y)
+            check_counts(world)
+            world.set_cell(x, y)
+            check_counts(world)
+        world.step()
+        check_counts(world)
+
+    def test_rebuilt(self):
+        '''
+        the counts are built again after the grid or boundary changes
+        '''
+        world = World(8, 8, 'counted')
+        random.seed(6)
+        world.set_random_grid()
+        world.run(3, False)
+        world.seed_random(0.4, 7)
+        assert world.counts is None
+        check_counts(world)
+        world.set_boundary('reflect')
+        assert world.counts is None
+        check_counts(world)
+
+    def test_only_changes_evaluated(self):
+        '''
+        a blinker only makes the cells around it active
+        '''
+        grid = [['d'] * 20 for _ in range(20)]
+        grid[10][9:12] = ['a', 'a', 'a']
+        world = World(20, 20, 'counted')
+        world.set_grid(grid)
+        world.step()
+        assert world.get_cells_evaluated() == 400
+        world.step()
+        assert world.get_cells_evaluated() <= 25
+        world.run(6, False)
+        assert world.get_grid() == grid
+
+    @mark.parametrize("rule", ['highlife', 'seeds', 'B0/S8'])
+    def test_rules(self, rule):
+        '''
+        the count is looked up in the rule's table
+        '''
+        python_world = World(15, 12, rule=rule)
+        random.seed(8)
+        python_world.set_random_grid()
+        world = World(15, 12, 'counted', rule=rule)
+        world.set_grid(python_world.get_grid())
+        for _ in range(10):
+            python_world.step()
+            world.step()
+            assert world.get_grid() == python_world.get_grid()
+        check_counts(world)
@@ -10,10 +10,13 @@ W |    | E
     S
 @author: Paul Taniguchi
 '''
+import time
+import random
 import pygame
 from pytest import mark
 from pytest import fixture
-from main.GameofLife import World, DisplayWorld
+from pytest import raises
+from main.GameofLife import World, DisplayWorld, cell_key, centered_region
 
 class TestGridMethods():
 
@@ -201,15 +204,17 @@ class TestDisplayMethods():
         factory for initializing the display world
         '''
         
-        def _init_display_world(grid_type):
+        def _init_display_world(grid_type, render_mode='rects'):
             '''
             grid_type - 'symm' for the symmetric 5x5 world
                         'asymm' for the asymmetric 3x5 world
+            render_mode - 'rects' or 'blit'
             '''
 
             grid = self.get_display_world_grid(grid_type)
             
-            display_world = DisplayWorld(len(grid[0]), len(grid),'t', grid)
+            display_world = DisplayWorld(len(grid[0]), len(grid),'t', grid,
+                                         render_mode=render_mode)
             return display_world
         
         yield _init_display_world
@@ -241,6 +246,169 @@ class TestDisplayMethods():
         assert test_display_world.get_display_world() == \
                 self.get_display_world_grid(grid_type)         
 
+    @mark.parametrize("grid_type", [('symm'), ('asymm')])
+    def test_draw_only_changed_cells(self, init_display_world, grid_type):
+        '''
+        after the first frame only the cells that changed are drawn
+        and the rendered grid still matches the world
+        '''
+        test_display_world = init_display_world(grid_type)
+        grid = self.get_display_world_grid(grid_type)
+        test_display_world.draw_world()
+        assert test_display_world.get_cells_drawn() == \
+                len(grid) * len(grid[0])
+        test_display_world.game_world.step()
+        new_grid = test_display_world.game_world.get_grid()
+        changed = sum(old != new for old_row, new_row in zip(grid, new_grid)
+                      for old, new in zip(old_row, new_row))
+        rects = test_display_world.draw_world()
+        assert test_display_world.get_cells_drawn() == changed
+        assert 0 < len(rects) <= len(grid)
+        assert test_display_world.get_frame_time() > 0
+        assert test_display_world.get_display_world() == new_grid
+    
+    @mark.parametrize("engine", ['python', 'counted', 'numpy', 'sparse'])
+    def test_draw_from_view(self, engine):
+        '''
+        the rects are drawn from the world's view - the nested list
+        engines' grids aren't copied with get_grid
+        '''
+        random.seed(3)
+        test_display_world = DisplayWorld(12, 9, 'r', engine=engine)
+        try:
+            world = test_display_world.game_world
+            expected = World(12, 9)
+            expected.set_grid(world.get_grid())
+            if engine in ('python', 'counted'):
+                world.get_grid = None
+            for _ in range(3):
+                test_display_world.draw_world()
+                assert test_display_world.get_display_world() == \
+                        expected.get_grid()
+                world.step()
+                expected.step()
+        finally:
+            pygame.quit()
+    
+    @mark.parametrize("grid_type", [('symm'), ('asymm')])
+    def test_display_readbacks_agree(self, init_display_world, grid_type):
+        '''
+        the bulk readback, its array form & the per pixel readback agree
+        '''
+        test_display_world = init_display_world(grid_type)
+        test_display_world.draw_world()
+        displayed = test_display_world.get_display_world(as_array=True)
+        grid = self.get_display_world_grid(grid_type)
+        assert displayed.shape == (len(grid), len(grid[0]))
+        assert displayed.tolist() == [[int(cell == 'a') for cell in row]
+                                      for row in grid]
+        assert test_display_world.get_display_world() == \
+                test_display_world.get_display_world_by_cell()
+    
+    def test_display_large_world(self):
+        '''
+        bulk readback of a random grid with 1 pixel cells
+        '''
+        random.seed(7)
+        test_display_world = DisplayWorld(600, 400, 'r', render_mode='blit')
+        try:
+            assert test_display_world.get_cell_size() == 1
+            test_display_world.draw_world()
+            assert test_display_world.get_display_world() == \
+                    test_display_world.game_world.get_grid()
+        finally:
+            pygame.quit()
+    
+    @mark.parametrize("grid_type", [('symm'), ('asymm')])
+    def test_blit_display_correctly(self, init_display_world, grid_type):
+        '''
+        the blit render mode draws the same grid, before & after a step
+        '''
+        test_display_world = init_display_world(grid_type, 'blit')
+        test_display_world.draw_world()
+        assert test_display_world.get_display_world() == \
+                self.get_display_world_grid(grid_type)
+        test_display_world.game_world.step()
+        rects = test_display_world.draw_world()
+        assert test_display_world.get_display_world() == \
+                test_display_world.game_world.get_grid()
+        assert rects == [pygame.Rect(test_display_world.get_ulc_x(),
+                test_display_world.get_ulc_y(),
+                test_display_world.get_container_width(),
+                test_display_world.get_container_height())]
+    
+    @mark.parametrize("grid_type", [('symm'), ('asymm')])
+    def test_blit_matches_rects(self, init_display_world, grid_type):
+        '''
+        both render modes put the same pixels on the screen
+        '''
+        test_display_world = init_display_world(grid_type)
+        test_display_world.draw_world()
+        rects_image = pygame.image.tobytes(test_display_world.scr, 'RGB')
+        test_display_world.scr.fill(test_display_world._beige)
+        test_display_world.render_mode = 'blit'
+        test_display_world.draw_world()
+        assert pygame.image.tobytes(test_display_world.scr, 'RGB') == \
+                rects_image
+    
+    @mark.parametrize("render_mode", ['rects', 'blit'])
+    def test_background_stepping(self, render_mode):
+        '''
+        with generations_per_sec the frames show the latest generation
+        stepped by the background thread & p / r pause & resume it
+        '''
+        grid = self.get_display_world_grid('symm')
+        test_display_world = DisplayWorld(5, 5, 't', grid,
+                render_mode=render_mode, generations_per_sec=200,
+                frames_per_sec=100)
+        try:
+            for _ in range(100):
+                test_display_world.world_loop()
+                if test_display_world.get_time_step() > 0:
+                    break
+            stepper = test_display_world.stepper
+            assert test_display_world.get_time_step() > 0
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN,
+                                                 key=pygame.K_p))
+            test_display_world.world_loop()
+            assert stepper.is_paused()
+            # let the generation being stepped finish & get drawn
+            time.sleep(0.05)
+            test_display_world.world_loop()
+            snapshot = stepper.get_snapshot()
+            assert test_display_world.get_time_step() == snapshot.generation
+            assert test_display_world.get_display_world() == snapshot.grid
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN,
+                                                 key=pygame.K_r))
+            test_display_world.world_loop()
+            assert not stepper.is_paused()
+        finally:
+            test_display_world.stop_stepping()
+            pygame.quit()
+        assert test_display_world.stepper is None
+        assert test_display_world.game_world.get_generation() >= \
+                snapshot.generation
+    
+    def test_incorrect_render_mode(self):
+        '''
+        an unknown render mode raises ValueError
+        '''
+        with raises(ValueError):
+            DisplayWorld(5, 5, 'r', render_mode='pixels')
+        pygame.quit()
+    
+    def test_redraw_world(self, init_display_world):
+        '''
+        redraw_world makes the next frame draw every cell
+        '''
+        test_display_world = init_display_world('symm')
+        test_display_world.draw_world()
+        test_display_world.draw_world()
+        assert test_display_world.get_cells_drawn() == 0
+        test_display_world.redraw_world()
+        test_display_world.draw_world()
+        assert test_display_world.get_cells_drawn() == 25
+
     def test_get_window_width(self, init_display_world):
         '''
         test getter for window width
@@ -335,3 +503,262 @@ class TestDisplayMethods():
         '''
         test_display_world = init_display_world('symm')
         assert test_display_world.get_margin() == 100
+
+class TestActiveCells():
+
+    def test_still_life_settles(self):
+        '''
+        a block never changes so after the first generation 
+        no cells need to be evaluated
+        '''
+        world = World(6,6)
+        world.set_grid([['d','d','d','d','d','d'],['d','a','a','d','d','d'],
+                ['d','a','a','d','d','d'],['d','d','d','d','d','d'],
+                ['d','d','d','d','d','d'],['d','d','d','d','d','d']])
+        world.mark_for_transition()
+        world.clean_up_grid()
+        assert world.get_cells_evaluated() == 36
+        world.mark_for_transition()
+        world.clean_up_grid()
+        assert world.get_cells_evaluated() == 0
+        
+    def test_blinker_only_evaluates_neighborhood(self):
+        '''
+        a blinker in the middle of the grid only touches the 
+        cells around it
+        '''
+        world = World(9,9)
+        grid = [['d' for _ in range(9)] for _ in range(9)]
+        for x in range(3,6):
+            grid[4][x] = 'a'
+        world.set_grid(grid)
+        for _ in range(3):
+            world.mark_for_transition()
+            world.clean_up_grid()
+        assert 0 < world.get_cells_evaluated() <= 25
+    
+    @mark.parametrize("seed", [1, 2, 3])
+    def test_matches_full_evaluation(self, seed):
+        '''
+        skipping quiescent cells gives the same grid as evaluating 
+        every cell each generation
+        '''
+        tracked = World(20,15)
+        random.seed(seed)
+        tracked.set_random_grid()
+        full = World(20,15)
+        full.set_grid(tracked.get_grid())
+        for _ in range(15):
+            tracked.mark_for_transition()
+            tracked.clean_up_grid()
+            # set_grid forgets the tracked cells
+            full.set_grid(full.get_grid())
+            full.mark_for_transition()
+            full.clean_up_grid()
+            assert tracked.get_grid() == full.get_grid()
+        assert tracked.get_cells_evaluated() < 20*15
+    
+    @mark.parametrize("engine", ['python', 'counted', 'numpy', 'sparse'])
+    @mark.parametrize("state, exp_state", [('z', 'd'), ('e', 'a')])
+    def test_clean_up_loaded_marks(self, engine, state, exp_state):
+        '''
+        an isolated 'z' or 'e' cell from set_grid is cleaned up by the 
+        half steps though marking never touches it
+        '''
+        world = World(5,5,engine)
+        grid = [['d' for _ in range(5)] for _ in range(5)]
+        grid[2][2] = state
+        world.set_grid(grid)
+        world.mark_for_transition()
+        world.clean_up_grid()
+        assert world.get_cell(2, 2) == exp_state
+    
+    @mark.parametrize("engine", ['python', 'counted'])
+    def test_clean_up_set_cell_marks(self, engine):
+        '''
+        a cell marked with set_cell is cleaned up by a halfsteps step
+        '''
+        world = World(1,1,engine,step_mode='halfsteps')
+        world.set_cell(0, 0)
+        assert world.get_grid() == [['e']]
+        world.step()
+        assert world.get_grid() == [['a']]
+
+class TestCycleDetection():
+    
+    block = [['d','d','d','d'],['d','a','a','d'],['d','a','a','d'],
+             ['d','d','d','d']]
+    blinker = [['d','d','d','d','d'],['d','d','a','d','d'],
+               ['d','d','a','d','d'],['d','d','a','d','d'],
+               ['d','d','d','d','d']]
+    lonely = [['d','d','d'],['d','a','d'],['d','d','d']]
+    
+    @fixture
+    def initialize_world(self):
+        '''
+        factory for a world of the given engine seeded with init_grid
+        '''
+        
+        def _initialize_world(init_grid, engine='python'):
+            testworld = World(len(init_grid[0]), len(init_grid), engine)
+            testworld.set_grid(init_grid)
+            return testworld
+        
+        return _initialize_world
+    
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_hash_kept_up_to_date(self, initialize_world, engine):
+        '''
+        the incremental hash & population match a hash worked out
+        from scratch after every generation
+        '''
+        random.seed(5)
+        world = World(12, 9, engine)
+        world.set_random_grid()
+        world.get_hash()
+        for _ in range(10):
+            world.step()
+            grid = world.get_grid()
+            live = [(x, y) for y in range(9) for x in range(12) 
+                    if grid[y][x] == 'a']
+            exp_hash = 0
+            for x, y in live:
+                exp_hash ^= cell_key(x, y)
+            assert world.get_hash() == exp_hash
+            assert world.get_population() == len(live)
+    
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    @mark.parametrize("grid_name, exp_outcome, exp_period, exp_repeat", 
+            [('block', 'still', 1, 1), ('blinker', 'oscillating', 2, 2),
+             ('lonely', 'extinct', 1, 1)])
+    def test_outcome(self, initialize_world, engine, grid_name, 
+            exp_outcome, exp_period, exp_repeat):
+        '''
+        still life, oscillator & extinction are told apart and
+        run stops as soon as the outcome is known
+        '''
+        world = initialize_world(getattr(self, grid_name), engine)
+        assert world.get_outcome() == 'running'
+        assert world.run(100) == exp_repeat
+        assert world.get_outcome() == exp_outcome
+        assert world.get_period() == exp_period
+        assert world.get_first_repeat() == exp_repeat
+        assert world.is_settled() is True
+    
+    def test_history_is_bounded(self, initialize_world):
+        '''
+        a period longer than max_period isn't found
+        '''
+        world = initialize_world(self.blinker)
+        world.max_period = 1
+        assert world.run(10) == 10
+        assert world.get_period() == 0
+    
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse',
+                                 'counted', 'jit'])
+    def test_no_hash_unless_needed(self, initialize_world, engine):
+        '''
+        stepping without cycle detection keeps no hash, only the
+        population
+        '''
+        world = initialize_world(self.blinker, engine)
+        assert world.run(6, False) == 6
+        assert world.detect_cycles is False
+        assert world._hash is None
+        assert world.get_population() == 3
+        assert world.get_births() == 2 and world.get_deaths() == 2
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_detection_turned_on(self, initialize_world, engine):
+        '''
+        the outcome getters & set_cycle_detection start looking for a
+        repeat from the generation they are called on, & it can be
+        turned off again
+        '''
+        world = initialize_world(self.blinker, engine)
+        world.run(5, False)
+        assert world.get_period() == 0
+        assert world.detect_cycles is True
+        world.run(2, False)
+        assert world.get_outcome() == 'oscillating'
+        assert world.get_first_repeat() == 7
+        world.set_cycle_detection(False)
+        world.run(3, False)
+        assert world._hash is None
+        world = initialize_world(self.block, engine)
+        world.run(3, False)
+        world.set_cycle_detection()
+        assert world.run(10) == 1
+        assert world.get_outcome() == 'still'
+
+    def test_set_grid_resets_history(self, initialize_world):
+        '''
+        a new grid starts a new run
+        '''
+        world = initialize_world(self.block)
+        world.run(5)
+        world.set_grid([['d','a','d','d'],['d','a','d','d'],
+                ['d','a','d','d'],['d','d','d','d']])
+        assert world.get_generation() == 0
+        assert world.get_outcome() == 'running'
+
+class TestSeeding():
+    
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_same_seed_same_grid(self, engine):
+        '''
+        every engine seeds the same grid from the same seed
+        '''
+        world = World(37, 23, engine)
+        world.seed_random(0.4, 5)
+        python_world = World(37, 23)
+        python_world.seed_random(0.4, 5)
+        assert world.get_grid() == python_world.get_grid()
+        assert world.get_population() == python_world.get_population()
+        python_world.seed_random(0.4, 6)
+        assert world.get_grid() != python_world.get_grid()
+    
+    @mark.parametrize("density", [0.0, 0.2, 0.5, 1.0])
+    def test_density(self, density):
+        '''
+        about density of the cells are alive
+        '''
+        world = World(200, 100, 'numpy')
+        world.seed_random(density, 1)
+        assert abs(world.get_population() / 20000 - density) < 0.02
+    
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_centered_square(self, engine):
+        '''
+        only the centered square is seeded & old cells are killed
+        '''
+        world = World(30, 20, engine)
+        world.set_random_grid()
+        region = centered_region(30, 20, 8)
+        assert region == (11, 6, 8, 8)
+        world.seed_random(1.0, 2, region)
+        assert world.get_grid() == [['a' if 11 <= x < 19 and 6 <= y < 14 
+                                     else 'd' for x in range(30)]
+                                    for y in range(20)]
+    
+    def test_seeded_world_steps(self):
+        '''
+        the seeded grid is stepped from scratch like set_grid
+        '''
+        world = World(25, 25, 'numpy')
+        world.seed_random(0.3, 3)
+        python_world = World(25, 25)
+        python_world.set_grid(world.get_grid())
+        world.run(5, False)
+        python_world.run(5, False)
+        assert world.get_grid() == python_world.get_grid()
+    
+    @mark.parametrize("density, region", [(1.5, None), (-0.1, None),
+            (0.5, (0, 0, 31, 5)), (0.5, (-1, 0, 5, 5))])
+    def test_bad_arguments(self, density, region):
+        '''
+        densities outside 0 to 1 & regions outside the grid raise
+        ValueError
+        '''
+        with raises(ValueError):
+            World(30, 20).seed_random(density, 1, region)
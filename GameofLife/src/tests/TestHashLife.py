@@ -0,0 +1,137 @@
+'''
+unit tests for the HashLife engine
+results are checked against stepping a World one generation at a time
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from main.GameofLife import World
+from main.HashLife import HashLife
+
+def step_world(world, generations):
+    '''
+    step world one generation at a time
+    '''
+    for _ in range(generations):
+        world.mark_for_transition()
+        world.clean_up_grid()
+
+def soup_grid(ncol, nrow, size, seed):
+    '''
+    ncol x nrow grid with a random size x size soup in the middle
+    '''
+    rand = random.Random(seed)
+    grid = [['d' for _ in range(ncol)] for _ in range(nrow)]
+    for y in range((nrow - size) // 2, (nrow + size) // 2):
+        for x in range((ncol - size) // 2, (ncol + size) // 2):
+            grid[y][x] = 'a' if rand.random() <= 0.5 else 'd'
+    return grid
+
+class PeakHashLife(HashLife):
+    '''
+    HashLife that keeps the most nodes & futures cached on top of the
+    live pattern at any time
+    '''
+
+    peak = 0
+
+    def trim(self):
+        super().trim()
+        self.peak = max(self.peak, len(self._nodes) + len(self._results) -
+                        self._kept)
+
+class TestHashLife():
+
+    glider = [['d','a','d'],['d','d','a'],['a','a','a']]
+
+    def test_grid_round_trip(self):
+        '''
+        set_grid & get_grid give back the same live cells
+        '''
+        grid = soup_grid(13, 9, 6, 1)
+        life = HashLife()
+        life.set_grid(grid)
+        assert life.get_grid(13, 9) == grid
+
+    @mark.parametrize("generations", [1, 2, 3, 7, 12, 25])
+    @mark.parametrize("seed", [1, 2, 3])
+    def test_matches_world(self, seed, generations):
+        '''
+        advance matches World stepping for a soup that stays 
+        away from the World border
+        '''
+        grid = soup_grid(64, 64, 8, seed)
+        world = World(64, 64)
+        world.set_grid(grid)
+        step_world(world, generations)
+        life = HashLife()
+        life.set_grid(grid)
+        life.advance(generations)
+        assert life.get_grid(64, 64) == world.get_grid()
+        assert life.get_generation() == generations
+
+    def test_glider_jump(self):
+        '''
+        a glider moves 1 cell diagonally every 4 generations
+        so 2^20 generations moves it 2^18 cells
+        '''
+        life = HashLife()
+        life.set_grid(self.glider, 5, 5)
+        life.advance(1 << 20)
+        shift = 1 << 18
+        assert life.get_population() == 5
+        assert life.get_grid(3, 3, 5 + shift, 5 + shift) == self.glider
+
+    def test_cache_eviction(self):
+        '''
+        trimming the caches keeps the results correct
+        '''
+        grid = soup_grid(64, 64, 8, 4)
+        world = World(64, 64)
+        world.set_grid(grid)
+        step_world(world, 20)
+        life = HashLife(max_nodes=50)
+        life.set_grid(grid)
+        for _ in range(20):
+            life.advance(1)
+        assert life.get_cache_size() < 5000
+        assert life.get_grid(64, 64) == world.get_grid()
+
+    def test_cap_inside_jump(self):
+        '''
+        one deep jump never caches more than max_nodes nodes & futures
+        past the live pattern & gives the same plane as without a cap
+        '''
+        grid = soup_grid(16, 16, 8, 5)
+        life = PeakHashLife(max_nodes=300)
+        life.set_grid(grid)
+        life.advance(1 << 10)
+        uncapped = HashLife()
+        uncapped.set_grid(grid)
+        uncapped.advance(1 << 10)
+        assert life.peak <= 300
+        assert uncapped.get_cache_size() + len(uncapped._results) > 600
+        assert life.get_population() == uncapped.get_population()
+        assert life.get_grid(400, 400, -200, -200) == \
+                uncapped.get_grid(400, 400, -200, -200)
+
+    def test_small_cap_collections(self):
+        '''
+        a cap far below the working set splits the jump instead of
+        collecting on nearly every miss, & the plane still matches
+        '''
+        acorn = [['d', 'a', 'd', 'd', 'd', 'd', 'd'],
+                 ['d', 'd', 'd', 'a', 'd', 'd', 'd'],
+                 ['a', 'a', 'd', 'd', 'a', 'a', 'a']]
+        life = HashLife(max_nodes=1000)
+        life.set_grid(acorn)
+        life.advance(128)
+        uncapped = HashLife()
+        uncapped.set_grid(acorn)
+        uncapped.advance(128)
+        assert uncapped.get_cache_size() + len(uncapped._results) > 10000
+        assert life.get_collects() < 150
+        assert life.get_population() == uncapped.get_population()
+        assert life.get_grid(200, 200, -100, -100) == \
+                uncapped.get_grid(200, 200, -100, -100)
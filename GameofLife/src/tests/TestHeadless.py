@@ -0,0 +1,154 @@
+'''
+unit tests for the headless runner
+
+Created on Oct 18, 2026
+'''
+import sys
+import json
+import random
+import subprocess
+from pytest import mark
+from main.GameofLife import World
+from main.Headless import main
+from main.Recorder import RecordingReader
+
+class TestHeadless():
+
+    def test_no_pygame_at_import(self):
+        '''
+        importing the runner & World doesn't import pygame
+        '''
+        result = subprocess.run([sys.executable, '-c',
+            "import sys, main.Headless; print('pygame' in sys.modules)"],
+            capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == 'False'
+
+    @mark.parametrize("engine", ['python', 'numpy'])
+    def test_run(self, engine, tmp_path, capsys):
+        '''
+        the runner prints the throughput & writes the final grid
+        '''
+        output = tmp_path / 'final.txt'
+        assert main(['--ncol', '12', '--nrow', '7', '--seed', '3',
+                     '--generations', '4', '--engine', engine,
+                     '--output', str(output)]) == 0
+        printed = capsys.readouterr().out
+        assert 'generations/sec' in printed
+        assert 'cells/sec' in printed
+        rows = output.read_text().splitlines()
+        assert len(rows) == 7
+        assert all(len(row) == 12 and set(row) <= {'a', 'd'}
+                   for row in rows)
+
+    def test_same_seed_same_grid(self, tmp_path):
+        '''
+        engines agree when given the same seed
+        '''
+        grids = []
+        for engine in ('python', 'bitpacked'):
+            output = tmp_path / f'{engine}.txt'
+            main(['--ncol', '9', '--nrow', '9', '--seed', '8',
+                  '--generations', '6', '--engine', engine,
+                  '--output', str(output)])
+            grids.append(output.read_text())
+        assert grids[0] == grids[1]
+
+    def test_stop_when_settled(self, capsys):
+        '''
+        an extinct world stops straight away
+        '''
+        main(['--ncol', '1', '--nrow', '1', '--seed', '1',
+              '--generations', '50', '--stop-when-settled'])
+        printed = capsys.readouterr().out
+        assert 'extinct' in printed
+        assert '50 generations' not in printed
+
+    def test_rule(self, tmp_path):
+        '''
+        --rule steps with that rule - every Seeds cell dies each step
+        '''
+        output = tmp_path / 'final.txt'
+        main(['--ncol', '5', '--nrow', '5', '--seed', '2',
+              '--generations', '1', '--rule', 'B2/S',
+              '--output', str(output)])
+        world = World(5, 5, rule='B2/S')
+        random.seed(2)
+        world.set_random_grid()
+        world.step()
+        assert output.read_text() == ''.join(''.join(row) + '\n'
+                                             for row in world.get_grid())
+
+    def test_pattern(self, tmp_path, capsys):
+        '''
+        --pattern starts from a pattern file instead of a random grid
+        '''
+        pattern = tmp_path / 'blinker.cells'
+        pattern.write_text('OOO\n')
+        output = tmp_path / 'final.txt'
+        main(['--ncol', '5', '--nrow', '5', '--generations', '1',
+              '--pattern', str(pattern), '--output', str(output)])
+        assert output.read_text().splitlines() == ['ddddd', 'ddadd',
+                                                   'ddadd', 'ddadd',
+                                                   'ddddd']
+
+    def test_resume(self, tmp_path, capsys):
+        '''
+        a run resumed from its checkpoints ends on the same grid as a
+        run that wasn't stopped
+        '''
+        map_file = tmp_path / 'world.golmap'
+        outputs = [tmp_path / 'straight.txt', tmp_path / 'resumed.txt']
+        main(['--ncol', '12', '--nrow', '10', '--seed', '4',
+              '--generations', '9', '--output', str(outputs[0])])
+        main(['--ncol', '12', '--nrow', '10', '--seed', '4',
+              '--generations', '6', '--map-file', str(map_file),
+              '--checkpoint-interval', '3'])
+        main(['--generations', '3', '--map-file', str(map_file),
+              '--resume', '--output', str(outputs[1])])
+        assert 'mapped - 12 x 10' in capsys.readouterr().out
+        assert outputs[0].read_text() == outputs[1].read_text()
+
+    def test_soup(self, tmp_path, capsys):
+        '''
+        --density & --soup-size seed a centered soup
+        '''
+        output = tmp_path / 'final.txt'
+        main(['--ncol', '9', '--nrow', '7', '--seed', '1',
+              '--generations', '0', '--density', '1', '--soup-size', '3',
+              '--output', str(output)])
+        assert output.read_text().splitlines() == (
+            ['ddddddddd'] * 2 + ['dddaaaddd'] * 3 + ['ddddddddd'] * 2)
+
+    def test_record(self, tmp_path, capsys):
+        '''
+        --record writes every generation & the last one is the output
+        '''
+        output = tmp_path / 'final.txt'
+        recording = tmp_path / 'run.golrec'
+        main(['--ncol', '10', '--nrow', '6', '--seed', '2',
+              '--generations', '5', '--output', str(output),
+              '--record', str(recording)])
+        with RecordingReader(recording) as reader:
+            assert reader.get_generations() == list(range(6))
+            assert [''.join(row) for row in reader.get_grid(5)] == \
+                    output.read_text().splitlines()
+
+    @mark.parametrize("name, log_format", [('stats.csv', None),
+                                           ('stats.txt', 'jsonl')])
+    def test_stats_log(self, name, log_format, tmp_path, capsys):
+        '''
+        --stats-log writes a line for every generation
+        '''
+        path = tmp_path / name
+        args = ['--ncol', '10', '--nrow', '8', '--seed', '4',
+                '--generations', '5', '--stats-log', str(path)]
+        if log_format:
+            args += ['--stats-format', log_format]
+        main(args)
+        lines = path.read_text().splitlines()
+        if log_format:
+            assert [json.loads(line)['generation'] for line in lines] == \
+                    list(range(6))
+        else:
+            assert lines[0].startswith('generation,population')
+            assert len(lines) == 7
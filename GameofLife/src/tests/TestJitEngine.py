@@ -0,0 +1,129 @@
+'''
+unit tests for the JIT compiled backend
+the fused loop is run uncompiled where Numba isn't installed & stepping
+is checked against the nested list World either way
+
+Created on Oct 18, 2026
+'''
+import random
+import numpy as np
+from pytest import mark
+from pytest import importorskip
+from main.GameofLife import World
+from main.NumpyEngine import hash_cells
+from main.JitEngine import JitWorld, fused_step, compiled_step, numba
+
+def check_steps(world, ncol, nrow, seed, boundary='dead', rule=None,
+                steps=12):
+    '''
+    world steps like a World with the same random grid
+    '''
+    python_world = World(ncol, nrow, boundary=boundary, rule=rule)
+    random.seed(seed)
+    python_world.set_random_grid()
+    world.set_grid(python_world.get_grid())
+    for _ in range(steps):
+        python_world.step()
+        world.step()
+        assert world.get_grid() == python_world.get_grid()
+        assert world.get_hash() == python_world.get_hash()
+        assert world.get_population() == python_world.get_population()
+        assert (world.get_births(), world.get_deaths()) == \
+                (python_world.get_births(), python_world.get_deaths())
+
+class TestJitEngine():
+
+    def test_engine_picked_at_construction(self):
+        '''
+        World(..., engine='jit') should give a JitWorld
+        '''
+        assert isinstance(World(4, 3, 'jit'), JitWorld)
+
+    def test_kernel_compiled_if_available(self):
+        '''
+        the kernel is the compiled loop with Numba & None without it
+        '''
+        assert World(4, 3, 'jit').kernel is compiled_step
+        assert (compiled_step is None) == (numba is None)
+
+    @mark.parametrize("boundary", ['dead', 'torus', 'reflect'])
+    @mark.parametrize("ncol, nrow, seed", [(17, 11, 1), (1, 3, 2),
+                                           (2, 2, 3)])
+    def test_fused_step(self, boundary, ncol, nrow, seed):
+        '''
+        the uncompiled fused loop steps like World
+        '''
+        world = World(ncol, nrow, 'jit', boundary=boundary)
+        world.kernel = fused_step
+        check_steps(world, ncol, nrow, seed, boundary)
+
+    @mark.parametrize("hashing", [True, False])
+    def test_kernel_totals(self, hashing):
+        '''
+        the loop counts & hashes the cells that flip as it steps them
+        '''
+        world = World(40, 30, 'jit')
+        world.kernel = fused_step
+        world.seed_random(0.5, 9)
+        grid = world.grid
+        back = np.empty_like(grid)
+        with np.errstate(over='ignore'):
+            flips, population, key = fused_step(
+                grid, back, world._kernel_table, world._ghost_rows,
+                world._ghost_cols, hashing)
+        flipped = (grid & 1) != back
+        assert flips == np.count_nonzero(flipped)
+        assert population == np.count_nonzero(back) > 255
+        assert int(key) == (hash_cells(flipped) if hashing else 0)
+
+    @mark.parametrize("boundary", ['dead', 'torus', 'reflect'])
+    def test_fallback(self, boundary):
+        '''
+        without a kernel the world takes the numpy half steps
+        '''
+        world = World(17, 11, 'jit', boundary=boundary)
+        world.kernel = None
+        check_steps(world, 17, 11, 4, boundary)
+
+    @mark.parametrize("rule", ['highlife', 'seeds', 'B0/S8'])
+    def test_rules(self, rule):
+        '''
+        the count is looked up in the rule's next_table
+        '''
+        world = World(15, 12, 'jit', rule=rule)
+        world.kernel = fused_step
+        check_steps(world, 15, 12, 5, rule=rule, steps=8)
+
+    def test_set_rule_and_boundary(self):
+        '''
+        the kernel's table & ghost indices follow the world's
+        '''
+        world = World(9, 7, 'jit')
+        world.kernel = fused_step
+        world.set_rule('highlife')
+        world.set_boundary('torus')
+        check_steps(world, 9, 7, 6, 'torus', 'highlife', steps=6)
+
+    def test_snapshot_keeps_back_buffer(self):
+        '''
+        a snapshot of the last generation isn't written over by the
+        generation after next
+        '''
+        world = World(12, 10, 'jit')
+        world.kernel = fused_step
+        random.seed(7)
+        world.set_random_grid()
+        world.step()
+        snapshot = world.snapshot()
+        grid = world.get_grid()
+        world.run(2, False)
+        assert snapshot.get_grid() == grid
+
+    @mark.parametrize("boundary", ['dead', 'torus', 'reflect'])
+    def test_compiled(self, boundary):
+        '''
+        the Numba kernel steps like World
+        '''
+        importorskip('numba')
+        world = World(40, 30, 'jit', boundary=boundary)
+        check_steps(world, 40, 30, 8, boundary, steps=20)
@@ -0,0 +1,156 @@
+'''
+unit tests for the memory mapped World backend
+results are checked against the nested list World
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from pytest import fixture
+from pytest import raises
+from main.GameofLife import World
+from main.MappedWorld import MappedWorld, resume_world, read_header
+from main.MappedWorld import HEADER_SIZE
+
+class TestMappedWorld():
+
+    @fixture
+    def make_worlds(self, tmp_path):
+        '''
+        factory for a python World & a mapped World seeded the same way
+        the mapped worlds are closed after the test
+        '''
+        mapped = []
+
+        def _make_worlds(ncol, nrow, seed, **options):
+            python_world = World(ncol, nrow)
+            random.seed(seed)
+            python_world.set_random_grid()
+            mapped_world = World(ncol, nrow, 'mapped',
+                                 path=tmp_path / 'world.golmap', **options)
+            mapped_world.set_grid(python_world.get_grid())
+            mapped.append(mapped_world)
+            return python_world, mapped_world
+
+        yield _make_worlds
+
+        for world in mapped:
+            world.close()
+
+    def test_engine_picked_at_construction(self, make_worlds):
+        '''
+        World(..., engine='mapped') should give a MappedWorld
+        '''
+        _, mapped_world = make_worlds(4, 3, 1)
+        assert isinstance(mapped_world, MappedWorld)
+
+    def test_needs_path(self):
+        '''
+        there is no file to map without a path
+        '''
+        with raises(ValueError):
+            World(4, 4, 'mapped')
+
+    @mark.parametrize("ncol, nrow, seed", [(5,5,1), (17,11,2), (1,1,3),
+            (40,3,4)])
+    def test_generations_match(self, make_worlds, ncol, nrow, seed):
+        '''
+        stepping in the file matches the python World
+        '''
+        python_world, mapped_world = make_worlds(ncol, nrow, seed)
+        for _ in range(10):
+            python_world.step()
+            mapped_world.step()
+            assert mapped_world.get_grid() == python_world.get_grid()
+            assert mapped_world.get_hash() == python_world.get_hash()
+
+    def test_file_layout(self, make_worlds, tmp_path):
+        '''
+        the header & checkpoint slots are where the format says, the
+        checkpoints taking turns between the slots
+        '''
+        _, mapped_world = make_worlds(10, 3, 5)
+        path = tmp_path / 'world.golmap'
+        assert read_header(path)[6] == 0
+        mapped_world.run(4, False)
+        mapped_world.checkpoint()
+        assert read_header(path)[0:3] == (10, 3, 4)
+        assert read_header(path)[4:] == ('B3/S23', 'dead', 1)
+        data = path.read_bytes()
+        assert len(data) == HEADER_SIZE + 4 * 2 * 3
+        assert data[HEADER_SIZE + 6:HEADER_SIZE + 12] == \
+                bytes(mapped_world.grid.alive)
+        mapped_world.step()
+        mapped_world.checkpoint()
+        assert read_header(path)[2] == 5
+        assert read_header(path)[6] == 0
+        assert path.read_bytes()[HEADER_SIZE:HEADER_SIZE + 6] == \
+                bytes(mapped_world.grid.alive)
+
+    def test_resume_from_checkpoint(self, make_worlds, tmp_path):
+        '''
+        a resumed world carries on from the last checkpoint, not from
+        the generations stepped after it
+        '''
+        python_world, mapped_world = make_worlds(20, 20, 6,
+                                                 checkpoint_interval=5)
+        python_world.run(5, False)
+        checkpoint_grid = python_world.get_grid()
+        mapped_world.run(7, False)
+        # crash - the file is left as it is
+        mapped_world.close()
+        with resume_world(tmp_path / 'world.golmap') as resumed:
+            assert resumed.get_generation() == 5
+            assert resumed.get_grid() == checkpoint_grid
+            resumed.run(3, False)
+            python_world.run(3, False)
+            assert resumed.get_grid() == python_world.get_grid()
+
+    def test_damaged_checkpoint(self, make_worlds, tmp_path):
+        '''
+        a damaged last checkpoint falls back to the one before it &
+        resuming fails if neither matches its checksum
+        '''
+        python_world, mapped_world = make_worlds(16, 4, 7)
+        grid = python_world.get_grid()
+        mapped_world.checkpoint()
+        mapped_world.run(2, False)
+        mapped_world.checkpoint()
+        mapped_world.close()
+        path = tmp_path / 'world.golmap'
+        data = bytearray(path.read_bytes())
+        data[HEADER_SIZE] ^= 0xff
+        path.write_bytes(bytes(data))
+        with resume_world(path) as resumed:
+            assert resumed.get_generation() == 0
+            assert resumed.get_grid() == grid
+        data[HEADER_SIZE + 8] ^= 0xff
+        path.write_bytes(bytes(data))
+        with raises(ValueError):
+            resume_world(path)
+
+    def test_crash_during_checkpoint(self, make_worlds, tmp_path):
+        '''
+        a plane written without its header resumes the checkpoint before
+        '''
+        python_world, mapped_world = make_worlds(12, 12, 8,
+                                                 checkpoint_interval=3)
+        python_world.run(3, False)
+        grid = python_world.get_grid()
+        mapped_world.run(4, False)
+        # crash after the plane is written but before the header
+        start, end = mapped_world.slot_range(1 - mapped_world.slot)
+        mapped_world._map[start:end] = bytes(mapped_world.grid.alive)
+        mapped_world.close()
+        with resume_world(tmp_path / 'world.golmap') as resumed:
+            assert resumed.get_generation() == 3
+            assert resumed.get_grid() == grid
+
+    def test_not_a_mapped_world(self, tmp_path):
+        '''
+        other files raise ValueError
+        '''
+        path = tmp_path / 'other.txt'
+        path.write_bytes(b'some text')
+        with raises(ValueError):
+            resume_world(path)
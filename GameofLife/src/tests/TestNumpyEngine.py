@@ -0,0 +1,111 @@
+'''
+unit tests for the NumPy World backend
+results are checked against the nested list World
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from pytest import fixture
+from pytest import raises
+from main.GameofLife import World
+from main.NumpyEngine import NumpyWorld, alive_array
+
+class TestNumpyWorld():
+
+    init_grid = [['a','z','a','a','z'],['z','a','a','a','a'],
+                 ['a','a','z','e','a'],['a','d','z','a','d'],
+                 ['a','z','z','d','d']]
+
+    @fixture
+    def make_worlds(self):
+        '''
+        factory for a python World & a numpy World seeded the same way
+        '''
+
+        def _make_worlds(ncol, nrow, seed):
+            worlds = []
+            for engine in ('python', 'numpy'):
+                world = World(ncol, nrow, engine=engine)
+                random.seed(seed)
+                world.set_random_grid()
+                worlds.append(world)
+            return worlds
+
+        return _make_worlds
+
+    def test_engine_picked_at_construction(self):
+        '''
+        World(..., engine='numpy') should give a NumpyWorld
+        '''
+        world = World(4, 3, engine='numpy')
+        assert isinstance(world, NumpyWorld)
+        assert world.get_grid() == [['d'] * 4 for _ in range(3)]
+
+    def test_unknown_engine(self):
+        '''
+        asking for an engine that doesn't exist should fail
+        '''
+        with raises(ValueError):
+            World(4, 3, engine='abacus')
+
+    def test_grid_round_trip(self):
+        '''
+        set_grid / get_grid / get_cell keep the cell states
+        '''
+        world = World(5, 5, engine='numpy')
+        world.set_grid(self.init_grid)
+        assert world.get_grid() == self.init_grid
+        assert world.get_cell(3, 2) == 'e'
+        assert world.get_cell(-1, -1) == 'd'
+
+    @mark.parametrize("xpos, ypos, exp_state", [(3,2,'a'), (0,0,'z'),
+                (2,4,'d'), (4,3,'e')], ids = ['e_to_a', 'a_to_z', 'z_to_d',
+                'd_to_e'])
+    def test_set_cell(self, xpos, ypos, exp_state):
+        '''
+        set_cell follows e > a > z > d > e
+        '''
+        world = World(5, 5, engine='numpy')
+        world.set_grid(self.init_grid)
+        world.set_cell(xpos, ypos)
+        assert world.get_cell(xpos, ypos) == exp_state
+
+    def test_clean_up_grid(self):
+        '''
+        second half step matches the python World
+        '''
+        numpy_world = World(5, 5, engine='numpy')
+        numpy_world.set_grid(self.init_grid)
+        python_world = World(5, 5)
+        python_world.set_grid(self.init_grid)
+        numpy_world.clean_up_grid()
+        python_world.clean_up_grid()
+        assert numpy_world.get_grid() == python_world.get_grid()
+
+    @mark.parametrize("ncol, nrow, seed", [(5,5,1), (3,5,2), (17,11,3),
+            (1,1,4), (40,1,5)])
+    def test_generations_match(self, make_worlds, ncol, nrow, seed):
+        '''
+        both half steps match the python World for several generations
+        including the cells on the edges of the grid
+        '''
+        python_world, numpy_world = make_worlds(ncol, nrow, seed)
+        assert numpy_world.get_grid() == python_world.get_grid()
+        for _ in range(10):
+            python_world.mark_for_transition()
+            numpy_world.mark_for_transition()
+            assert numpy_world.get_grid() == python_world.get_grid()
+            python_world.clean_up_grid()
+            numpy_world.clean_up_grid()
+            assert numpy_world.get_grid() == python_world.get_grid()
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_alive_array(self, engine):
+        '''
+        alive_array is 1 for 'a' & 'z' cells of any engine
+        '''
+        world = World(5, 5, engine=engine)
+        world.set_grid(self.init_grid)
+        assert alive_array(world).tolist() == [
+            [cell in 'az' for cell in row] for row in self.init_grid]
@@ -0,0 +1,225 @@
+'''
+unit tests for the standard patterns
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from pytest import raises
+from main.GameofLife import World
+from main.Patterns import pattern_rows, pattern_grid, PATTERNS
+from main.Patterns import load_pattern, save_rle, save_cells, rle_runs
+from main.Patterns import pattern_runs, rle_arrays, cells_arrays, cells_runs
+
+class TestPatterns():
+
+    @mark.parametrize("name, exp_width, exp_height, exp_population", [
+            ('glider', 3, 3, 5), ('r_pentomino', 3, 3, 5),
+            ('acorn', 7, 3, 7), ('gosper_gun', 36, 9, 36)])
+    def test_pattern_rows(self, name, exp_width, exp_height, exp_population):
+        '''
+        patterns have the right size & number of live cells
+        '''
+        rows = pattern_rows(name)
+        assert len(rows) == exp_height
+        assert max(len(row) for row in rows) == exp_width
+        assert sum(row.count('O') for row in rows) == exp_population
+
+    def test_pattern_grid_centered(self):
+        '''
+        patterns are centered by default
+        '''
+        grid = pattern_grid('r_pentomino', 5, 5)
+        assert grid == [['d','d','d','d','d'],['d','d','a','a','d'],
+                        ['d','a','a','d','d'],['d','d','a','d','d'],
+                        ['d','d','d','d','d']]
+
+    def test_pattern_grid_placed(self):
+        '''
+        patterns can be put at a given upper left corner
+        '''
+        grid = pattern_grid('glider', 4, 4, 1, 0)
+        assert grid[0] == ['d','d','a','d']
+        assert grid[2] == ['d','a','a','a']
+
+    @mark.parametrize("name, ncol, nrow", [('gosper_gun', 20, 20),
+            ('nothing', 10, 10)], ids=['too_big', 'unknown'])
+    def test_bad_pattern(self, name, ncol, nrow):
+        '''
+        patterns that don't fit or don't exist raise ValueError
+        '''
+        with raises(ValueError):
+            pattern_grid(name, ncol, nrow)
+
+class TestPatternFiles():
+
+    # Gosper glider gun from the LifeWiki
+    gosper_gun_rle = """#N Gosper glider gun
+#C a comment
+x = 36, y = 9, rule = B3/S23
+24bo$22bobo$12b2o6b2o12b2o$11bo3bo4b2o12b2o$2o8bo5bo3b2o$2o8bo3bob2o4b
+obo$10bo5bo7bo$11bo3bo$12b2o!
+"""
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_load_rle(self, engine, tmp_path):
+        '''
+        an RLE file loads the same as the .cells pattern
+        including a run count split over 2 lines
+        '''
+        path = tmp_path / 'gun.rle'
+        path.write_text(self.gosper_gun_rle)
+        world = World(40, 12, engine)
+        assert load_pattern(world, path, 1, 2) == (36, 9)
+        assert world.get_grid() == pattern_grid('gosper_gun', 40, 12, 1, 2)
+        assert world.get_population() == 36
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_load_cells_centered(self, engine, tmp_path):
+        '''
+        a .cells file is centered by default & replaces the old cells
+        '''
+        path = tmp_path / 'acorn.cells'
+        path.write_text('!Name: acorn\n' + PATTERNS['acorn'].strip() + '\n')
+        world = World(11, 7, engine)
+        random.seed(1)
+        world.set_random_grid()
+        load_pattern(world, path)
+        assert world.get_grid() == pattern_grid('acorn', 11, 7)
+
+    def test_load_without_clear(self, tmp_path):
+        '''
+        clear=False adds the pattern to the cells already there
+        '''
+        path = tmp_path / 'glider.cells'
+        path.write_text(PATTERNS['glider'].lstrip())
+        world = World(12, 12)
+        load_pattern(world, path, 0, 0)
+        load_pattern(world, path, 5, 5, clear=False)
+        assert world.get_population() == 10
+        world.step()
+        assert world.get_population() == 10
+
+    def test_load_unbounded(self, tmp_path):
+        '''
+        an unbounded sparse world takes patterns outside its window
+        '''
+        path = tmp_path / 'glider.cells'
+        path.write_text(PATTERNS['glider'].lstrip())
+        world = World(4, 4, 'sparse', bounded=False)
+        load_pattern(world, path, -10, 20)
+        assert world.get_live_cells() == [(-10, 22), (-9, 20), (-9, 22),
+                                          (-8, 21), (-8, 22)]
+
+    @mark.parametrize("text", ['x = 3\n3o!', 'just text\n', ''])
+    def test_bad_rle_header(self, text, tmp_path):
+        '''
+        RLE files without an x = , y = header raise ValueError
+        '''
+        path = tmp_path / 'bad.rle'
+        path.write_text(text)
+        with raises(ValueError):
+            load_pattern(World(5, 5), path)
+
+    def test_pattern_too_big(self, tmp_path):
+        '''
+        patterns that don't fit raise ValueError
+        '''
+        path = tmp_path / 'gun.rle'
+        path.write_text(self.gosper_gun_rle)
+        with raises(ValueError):
+            load_pattern(World(20, 20), path)
+
+    def test_rle_runs(self):
+        '''
+        runs, empty rows & the end of the pattern
+        '''
+        assert list(rle_runs(['2o3$b3o!', '5o'])) == [(0, 0, 2),
+                                                   (1, 3, 3)]
+
+    def runs_from_arrays(self, chunks):
+        '''
+        (x, y, length) runs from chunks of run arrays
+        '''
+        return [(int(x), int(y), int(length)) for xs, ys, lengths in chunks
+                for x, y, length in zip(xs, ys, lengths)]
+
+    @mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+    def test_rle_arrays_match_runs(self, chunk_size):
+        '''
+        the array parser gives the same runs as rle_runs whatever the
+        chunk size
+        '''
+        lines = self.gosper_gun_rle.splitlines()[3:]
+        lines[-1] += '12o'
+        assert self.runs_from_arrays(rle_arrays(lines, chunk_size)) == \
+                list(rle_runs(lines))
+
+    @mark.parametrize("chunk_size", [1, 7, 1 << 20])
+    def test_rle_whitespace(self, chunk_size):
+        '''
+        spaces & line breaks between items are skipped by both parsers
+        '''
+        lines = ['bo$2bo $3o!']
+        assert list(rle_runs(lines)) == [(1, 0, 1), (2, 1, 1), (0, 2, 3)]
+        assert self.runs_from_arrays(rle_arrays(lines, chunk_size)) == \
+                list(rle_runs(lines))
+        lines = ['2o 3b\t$ b', ' 3o 2$', '12', 'o !']
+        assert self.runs_from_arrays(rle_arrays(lines, chunk_size)) == \
+                list(rle_runs(lines))
+
+    @mark.parametrize("chunk_size", [1, 7, 1 << 20])
+    def test_rle_count_wrapped(self, chunk_size):
+        '''
+        a run count keeps its tag across a line break or a space
+        '''
+        lines = ['b2\n', 'o$3 o$1', '2\n', ' b4 \n', 'o!\n']
+        expected = [(1, 0, 2), (0, 1, 3), (12, 2, 4)]
+        assert list(rle_runs(lines)) == expected
+        assert self.runs_from_arrays(rle_arrays(lines, chunk_size)) == \
+                expected
+
+    def test_cells_arrays_match_runs(self):
+        '''
+        the array parser gives a run of 1 for each cell of cells_runs
+        '''
+        lines = ['!Name: test', '.OO..O', '', '*.O', '!more', '..OOO']
+        cells = [(x + i, y, 1) for x, y, length in cells_runs(lines)
+                 for i in range(length)]
+        assert self.runs_from_arrays(cells_arrays(lines, 2)) == cells
+
+    @mark.parametrize("suffix", ['.rle', '.cells'])
+    def test_pattern_runs_without_numpy(self, suffix, tmp_path):
+        '''
+        the pure python runs put the same cells in a world
+        '''
+        world = World(30, 30)
+        random.seed(3)
+        world.set_random_grid()
+        path = tmp_path / ('world' + suffix)
+        (save_rle if suffix == '.rle' else save_cells)(world, path)
+        loaded = World(30, 30)
+        for x, y, length in pattern_runs(path):
+            loaded.put_run(x, y, length)
+        assert loaded.get_grid() == world.get_grid()
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked'])
+    @mark.parametrize("save, suffix", [(save_rle, '.rle'),
+            (save_cells, '.cells')])
+    def test_round_trip(self, engine, save, suffix, tmp_path):
+        '''
+        a saved random world loads back the same
+        '''
+        world = World(83, 17, engine)
+        random.seed(2)
+        world.set_random_grid()
+        # some empty rows
+        world.step()
+        path = tmp_path / ('world' + suffix)
+        save(world, path, 'random')
+        loaded = World(83, 17, engine)
+        load_pattern(loaded, path, 0, 0)
+        assert loaded.get_grid() == world.get_grid()
+        if suffix == '.rle':
+            assert max(len(line) for line in
+                       path.read_text().splitlines()) <= 70
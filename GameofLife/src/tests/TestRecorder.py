@@ -0,0 +1,152 @@
+'''
+unit tests for recording runs & reading generations back
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from pytest import fixture
+from pytest import raises
+from main.GameofLife import World
+from main.BitGrid import BitGrid, pack_alive
+from main.Recorder import Recorder, RecordingReader
+from main.Recorder import encode_spans, apply_spans
+
+class TestRecorder():
+
+    @fixture
+    def record_run(self, tmp_path):
+        '''
+        factory recording a random run, returns the path & the grids
+        '''
+
+        def _record_run(engine, ncol, nrow, generations, seed,
+                        keyframe_interval=8):
+            path = tmp_path / 'run.golrec'
+            world = World(ncol, nrow, engine)
+            random.seed(seed)
+            world.set_random_grid()
+            grids = [world.get_grid()]
+            with Recorder(path, ncol, nrow, keyframe_interval) as recorder:
+                recorder.record(world)
+                for _ in range(generations):
+                    world.step()
+                    recorder.record(world)
+                    grids.append(world.get_grid())
+            if hasattr(world, 'close'):
+                world.close()
+            return path, grids
+
+        return _record_run
+
+    @mark.parametrize("data", [b'', b'\x00\x00', b'\x01', b'\x00\x05\x00',
+            b'\xff' * 20 + b'\x00' * 3 + b'\x01' + b'\x00' * 40 + b'\x80'])
+    def test_spans_round_trip(self, data):
+        '''
+        applying the spans of data to zeros gives data back
+        '''
+        packed = bytearray(len(data))
+        apply_spans(packed, encode_spans(data))
+        assert packed == data
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_pack_alive(self, engine):
+        '''
+        every engine packs its live cells the same way
+        '''
+        world = World(13, 7, engine)
+        random.seed(1)
+        world.set_random_grid()
+        python_world = World(13, 7)
+        random.seed(1)
+        python_world.set_random_grid()
+        assert pack_alive(world) == pack_alive(python_world)
+
+    @mark.parametrize("engine", ['python', 'counted'])
+    def test_pack_nested_list_view(self, engine):
+        '''
+        the nested list engines pack from the view, not a get_grid copy,
+        & count 'z' cells as alive but not 'e' cells
+        '''
+        grid = [['a', 'z', 'e', 'd', 'a', 'd', 'd', 'd', 'z'],
+                ['d', 'e', 'd', 'd', 'd', 'd', 'd', 'd', 'd'],
+                ['z', 'd', 'a', 'a', 'e', 'd', 'd', 'a', 'a']]
+        world = World(9, 3, engine)
+        world.set_grid(grid)
+        world.get_grid = None
+        assert pack_alive(world) == \
+                bytes(BitGrid.from_nested_list(grid).alive)
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked'])
+    def test_read_every_generation(self, record_run, engine):
+        '''
+        every recorded generation reads back in order
+        '''
+        path, grids = record_run(engine, 21, 13, 30, 2)
+        with RecordingReader(path) as reader:
+            assert reader.get_generations() == list(range(31))
+            for generation, grid in enumerate(grids):
+                assert reader.get_grid(generation) == grid
+
+    def test_seek(self, record_run):
+        '''
+        generations read back in any order
+        '''
+        path, grids = record_run('numpy', 30, 20, 40, 3)
+        order = list(range(41))
+        random.Random(4).shuffle(order)
+        with RecordingReader(path) as reader:
+            for generation in order:
+                assert reader.get_grid(generation) == grids[generation]
+
+    def test_load(self, record_run):
+        '''
+        load puts a generation into a World to carry on stepping
+        '''
+        path, grids = record_run('python', 10, 10, 12, 5)
+        world = World(10, 10)
+        with RecordingReader(path) as reader:
+            reader.load(world, 11)
+        world.step()
+        assert world.get_grid() == grids[12]
+
+    def test_deltas_are_small(self, tmp_path):
+        '''
+        a still life costs a frame header per generation
+        '''
+        world = World(64, 64)
+        world.set_grid([['a' if 30 <= x <= 31 and 30 <= y <= 31 else 'd'
+                         for x in range(64)] for y in range(64)])
+        path = tmp_path / 'block.golrec'
+        with Recorder(path, 64, 64, keyframe_interval=100) as recorder:
+            for _ in range(50):
+                world.step()
+                recorder.record(world)
+        assert path.stat().st_size < 50 * 20 + 100
+
+    def test_truncated_recording(self, record_run):
+        '''
+        a recording cut short is read up to its last whole frame
+        '''
+        path, grids = record_run('python', 10, 10, 5, 6)
+        data = path.read_bytes()
+        path.write_bytes(data[:-3])
+        with RecordingReader(path) as reader:
+            assert reader.get_generations() == list(range(5))
+            assert reader.get_grid(4) == grids[4]
+
+    def test_errors(self, record_run, tmp_path):
+        '''
+        unrecorded generations, other files & other grid sizes
+        '''
+        path, _ = record_run('python', 10, 10, 3, 7)
+        with RecordingReader(path) as reader:
+            with raises(KeyError):
+                reader.get_grid(4)
+        other = tmp_path / 'other.txt'
+        other.write_bytes(b'not a recording at all')
+        with raises(ValueError):
+            RecordingReader(other)
+        with Recorder(tmp_path / 'small.golrec', 5, 5) as recorder:
+            with raises(ValueError):
+                recorder.record(World(6, 5))
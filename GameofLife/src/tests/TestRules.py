@@ -0,0 +1,228 @@
+'''
+unit tests for B/S rules
+every engine is checked against the nested list World stepped with
+the same rule
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from pytest import fixture
+from pytest import raises
+from main.GameofLife import World
+from main.Rules import CONWAY, RULES, parse_rule, get_rule
+from main.HashLife import HashLife
+from main.BatchWorld import BatchWorld
+from main.Patterns import load_pattern, save_rle, pattern_size
+
+class TestRules():
+
+    @fixture
+    def make_world(self, tmp_path):
+        '''
+        factory for worlds of any engine, closed after the test
+        '''
+        worlds = []
+
+        def _make_world(ncol, nrow, engine, rule):
+            options = {}
+            if engine == 'tiled':
+                options = {'tiles' : (2, 2), 'workers' : 2}
+            elif engine == 'mapped':
+                options = {'path' : tmp_path / 'world.golmap'}
+            world = World(ncol, nrow, engine, rule=rule, **options)
+            worlds.append(world)
+            return world
+
+        yield _make_world
+
+        for world in worlds:
+            if hasattr(world, 'close'):
+                world.close()
+
+    @mark.parametrize("text, birth, survival", [
+            ('B3/S23', {3}, {2, 3}),
+            ('b36/s23', {3, 6}, {2, 3}),
+            ('B3678/S34678', {3, 6, 7, 8}, {3, 4, 6, 7, 8}),
+            ('B2/S', {2}, set()),
+            ('23/36', {3, 6}, {2, 3}),
+            ('/2', {2}, set())])
+    def test_parse_rule(self, text, birth, survival):
+        '''
+        B/S & S/B notation give the same birth & survival counts
+        '''
+        rule = parse_rule(text)
+        assert rule.birth == birth
+        assert rule.survival == survival
+
+    @mark.parametrize("text", ['B9/S23', 'B3/S2x', 'Life', '', 'S23/B3'])
+    def test_incorrect_rule(self, text):
+        '''
+        anything that isn't a B/S rule raises ValueError
+        '''
+        with raises(ValueError):
+            parse_rule(text)
+
+    def test_rule_names(self):
+        '''
+        names, strings, Rules & None all give a Rule
+        '''
+        assert get_rule(None) is CONWAY
+        assert get_rule('HighLife') == parse_rule('B36/S23')
+        assert get_rule(RULES['seeds']) is RULES['seeds']
+        assert str(get_rule('23/3')) == 'B3/S23'
+        assert World(3, 3).rule == CONWAY
+
+    def test_tables(self):
+        '''
+        the tables agree with the birth & survival counts
+        '''
+        rule = parse_rule('B36/S23')
+        for count in range(9):
+            assert rule.next_state[0][count] == (count in (3, 6))
+            assert rule.next_state[1][count] == (count in (2, 3))
+            assert rule.change[0][count] == rule.next_state[0][count]
+            assert rule.change[1][count] == 1 - rule.next_state[1][count]
+        # a dead cell with 6 neighbors & a live one with 2
+        assert rule.neighborhood[0b111000111] == 1
+        assert rule.neighborhood[0b000010011] == 1
+        assert rule.neighborhood[0b000010001] == 0
+
+    @mark.parametrize("engine", ['numpy', 'bitpacked', 'sparse', 'tiled',
+                                 'mapped'])
+    @mark.parametrize("rule", ['highlife', 'day_and_night', 'seeds',
+                               'B0/S8', 'B01245678/S'])
+    def test_engines_match(self, make_world, engine, rule):
+        '''
+        stepping with the rule table matches the python World
+        '''
+        python_world = World(17, 13, rule=rule)
+        random.seed(8)
+        python_world.set_random_grid()
+        world = make_world(17, 13, engine, rule)
+        world.set_grid(python_world.get_grid())
+        for _ in range(12):
+            python_world.step()
+            world.step()
+            assert world.get_grid() == python_world.get_grid()
+            assert world.get_population() == python_world.get_population()
+
+    def test_highlife_replicator(self):
+        '''
+        the HighLife replicator grows where Conway's Life lets it die
+        '''
+        replicator = ['..aaa', '.a..a', 'a...a', 'a..a.', 'aaa..']
+        grid = [['d'] * 40 for _ in range(40)]
+        for y, row in enumerate(replicator):
+            for x, cell in enumerate(row):
+                if cell == 'a':
+                    grid[17 + y][17 + x] = 'a'
+        highlife = World(40, 40, 'numpy', rule='highlife')
+        highlife.set_grid(grid)
+        highlife.run(12, False)
+        assert highlife.get_population() == 24
+        conway = World(40, 40, 'numpy')
+        conway.set_grid(grid)
+        conway.run(12, False)
+        assert conway.get_population() != highlife.get_population()
+
+    def test_set_rule(self):
+        '''
+        changing the rule between steps uses the new rule from then on
+        '''
+        python_world = World(12, 12)
+        random.seed(9)
+        python_world.set_random_grid()
+        world = World(12, 12, 'bitpacked')
+        world.set_grid(python_world.get_grid())
+        for rule in (None, 'seeds', 'B36/S23'):
+            python_world.set_rule(rule)
+            world.set_rule(rule)
+            python_world.run(3, False)
+            world.run(3, False)
+            assert world.get_grid() == python_world.get_grid()
+
+    def test_b0_needs_edges(self):
+        '''
+        B0 rules would fill an infinite plane
+        '''
+        with raises(ValueError):
+            World(5, 5, 'sparse', bounded=False, rule='B0/S8')
+        with raises(ValueError):
+            HashLife(rule='B0/S8')
+
+    @mark.parametrize("generations", [1, 5, 16])
+    def test_hashlife_matches_world(self, generations):
+        '''
+        HashLife's 512 entry table matches World stepping
+        '''
+        rand = random.Random(10)
+        grid = [['a' if 28 <= x < 36 and 28 <= y < 36 and
+                 rand.random() <= 0.5 else 'd' for x in range(64)]
+                for y in range(64)]
+        world = World(64, 64, 'numpy', rule='B36/S23')
+        world.set_grid(grid)
+        world.run(generations, False)
+        life = HashLife(rule='B36/S23')
+        life.set_grid(grid)
+        life.advance(generations)
+        assert life.get_grid(64, 64) == world.get_grid()
+
+    def test_batch_matches_world(self):
+        '''
+        every board of a batch steps like a World with the same rule
+        '''
+        batch = BatchWorld(9, 7, [1, 2, 3], rule='day_and_night')
+        worlds = []
+        for board in range(batch.get_size()):
+            world = World(9, 7, rule='day_and_night')
+            world.set_grid(batch.get_board(board))
+            worlds.append(world)
+        batch.run(10, False)
+        for board, world in enumerate(worlds):
+            world.run(10, False)
+            assert batch.get_board(board) == world.get_grid()
+
+    def test_rle_rule_round_trip(self, tmp_path):
+        '''
+        save_rle writes the world's rule & load_pattern switches to it
+        '''
+        world = World(10, 8, 'numpy', rule='B36/S23')
+        random.seed(11)
+        world.set_random_grid()
+        path = tmp_path / 'highlife.rle'
+        save_rle(world, path)
+        assert pattern_size(path)[2] == 'B36/S23'
+        loaded = World(10, 8)
+        load_pattern(loaded, path)
+        assert loaded.rule == world.rule
+        assert loaded.get_grid() == world.get_grid()
+        conway = World(10, 8)
+        load_pattern(conway, path, use_rule=False)
+        assert conway.rule == CONWAY
+
+    def test_mapped_rule_resumes(self, tmp_path):
+        '''
+        the rule is saved in the mapped world header
+        '''
+        from main.MappedWorld import resume_world
+        path = tmp_path / 'seeds.golmap'
+        with World(8, 8, 'mapped', path=path, rule='seeds') as world:
+            world.checkpoint()
+        with resume_world(path) as resumed:
+            assert resumed.rule == RULES['seeds']
+
+    @mark.parametrize("rule", ['B0123478/S01234678',
+                               'B012345678/S012345678'])
+    def test_mapped_long_rule_resumes(self, rule, tmp_path):
+        '''
+        the longest rule strings fit in the header whole
+        '''
+        from main.MappedWorld import resume_world
+        path = tmp_path / 'long.golmap'
+        with World(8, 8, 'mapped', path=path, rule=rule) as world:
+            world.run(2, False)
+            world.checkpoint()
+        with resume_world(path) as resumed:
+            assert str(resumed.rule) == rule
+            assert resumed.get_generation() == 2
@@ -0,0 +1,105 @@
+'''
+unit tests for the sparse World backend
+bounded results are checked against the nested list World
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from main.GameofLife import World
+from main.SparseWorld import SparseWorld
+
+class TestSparseWorld():
+
+    init_grid = [['a','z','a','a','z'],['z','a','a','a','a'],
+                 ['a','a','z','e','a'],['a','d','z','a','d'],
+                 ['a','z','z','d','d']]
+    glider = [['d','a','d'],['d','d','a'],['a','a','a']]
+
+    def test_engine_picked_at_construction(self):
+        '''
+        World(..., engine='sparse') should give a bounded SparseWorld
+        '''
+        world = World(4, 3, engine='sparse')
+        assert isinstance(world, SparseWorld)
+        assert world.bounded is True
+        assert world.get_grid() == [['d'] * 4 for _ in range(3)]
+
+    def test_grid_round_trip(self):
+        '''
+        set_grid / get_grid keep all 4 cell states
+        '''
+        world = World(5, 5, engine='sparse')
+        world.set_grid(self.init_grid)
+        assert world.get_grid() == self.init_grid
+        assert world.get_population() == 20
+
+    @mark.parametrize("xpos, ypos, exp_state", [(3,2,'a'), (0,0,'z'),
+                (2,4,'d'), (4,3,'e')], ids = ['e_to_a', 'a_to_z', 'z_to_d',
+                'd_to_e'])
+    def test_set_cell(self, xpos, ypos, exp_state):
+        '''
+        set_cell follows e > a > z > d > e
+        '''
+        world = World(5, 5, engine='sparse')
+        world.set_grid(self.init_grid)
+        world.set_cell(xpos, ypos)
+        assert world.get_cell(xpos, ypos) == exp_state
+
+    @mark.parametrize("ncol, nrow, seed", [(5,5,1), (3,5,2), (17,11,3),
+            (1,1,4), (40,1,5)])
+    def test_bounded_matches_world(self, ncol, nrow, seed):
+        '''
+        bounded mode matches the python World including the edges
+        '''
+        worlds = []
+        for engine in ('python', 'sparse'):
+            world = World(ncol, nrow, engine=engine)
+            random.seed(seed)
+            world.set_random_grid()
+            worlds.append(world)
+        python_world, sparse_world = worlds
+        for _ in range(10):
+            python_world.mark_for_transition()
+            sparse_world.mark_for_transition()
+            assert sparse_world.get_grid() == python_world.get_grid()
+            python_world.clean_up_grid()
+            sparse_world.clean_up_grid()
+            assert sparse_world.get_grid() == python_world.get_grid()
+
+    def test_glider_dies_at_bounded_wall(self):
+        '''
+        bounded mode keeps the dead border so the glider turns into a block
+        '''
+        world = World(5, 5, engine='sparse')
+        world.set_grid([row + ['d', 'd'] for row in self.glider] +
+                       [['d'] * 5 for _ in range(2)])
+        for _ in range(40):
+            world.mark_for_transition()
+            world.clean_up_grid()
+        assert world.get_population() == 4
+
+    def test_glider_leaves_unbounded_window(self):
+        '''
+        unbounded mode lets the glider fly past the window edge
+        it moves 1 cell diagonally every 4 generations
+        '''
+        world = World(3, 3, engine='sparse', bounded=False)
+        world.set_grid(self.glider)
+        start = world.get_live_cells()
+        for _ in range(40):
+            world.mark_for_transition()
+            world.clean_up_grid()
+        assert world.get_live_cells() == [(x + 10, y + 10)
+                                          for x, y in start]
+        assert world.get_grid() == [['d'] * 3 for _ in range(3)]
+
+    def test_work_scales_with_population(self):
+        '''
+        an empty corner of a huge board costs nothing to step
+        '''
+        world = World(100000, 100000, engine='sparse')
+        world.set_cell(5, 5)
+        world.set_cell(5, 5)
+        world.mark_for_transition()
+        assert world.get_cells_evaluated() == 9
@@ -0,0 +1,177 @@
+'''
+unit tests for the live counts kept while stepping & the stats log
+births, deaths & bounding boxes are checked against the grids before
+& after each step
+
+Created on Oct 18, 2026
+'''
+import csv
+import json
+import random
+from pytest import mark
+from pytest import raises
+from main.GameofLife import World, Stats
+from main.StatsLog import StatsLog, CSV_FIELDS
+
+def count_changes(before, after):
+    '''
+    cells born & died between 2 nested list grids
+    '''
+    births = deaths = 0
+    for old_row, new_row in zip(before, after):
+        for old, new in zip(old_row, new_row):
+            births += old == 'd' and new == 'a'
+            deaths += old == 'a' and new == 'd'
+    return births, deaths
+
+def bounding_box(grid):
+    '''
+    (x, y, width, height) of the live cells of a nested list grid
+    '''
+    cells = [(x, y) for y, row in enumerate(grid)
+             for x, cell in enumerate(row) if cell == 'a']
+    if not cells:
+        return None
+    xs = [x for x, _ in cells]
+    ys = [y for _, y in cells]
+    return (min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+
+class TestStats():
+
+    glider = [['d','a','d'],['d','d','a'],['a','a','a']]
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse',
+                                 'counted'])
+    @mark.parametrize("step_mode", ['buffered', 'halfsteps'])
+    def test_births_and_deaths(self, engine, step_mode):
+        '''
+        births & deaths match the cells that changed in each step
+        '''
+        world = World(19, 13, engine, step_mode=step_mode)
+        random.seed(1)
+        world.set_random_grid()
+        for _ in range(15):
+            before = world.get_grid()
+            world.step()
+            after = world.get_grid()
+            assert (world.get_births(), world.get_deaths()) == \
+                    count_changes(before, after)
+            assert world.get_bounding_box() == bounding_box(after)
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_glider_box(self, engine):
+        '''
+        a glider's 3 x 3 box moves a cell down & right every 4 steps &
+        an empty world has no box
+        '''
+        grid = [['d'] * 10 for _ in range(10)]
+        for y, row in enumerate(self.glider):
+            grid[y + 1][1:4] = row
+        world = World(10, 10, engine)
+        world.set_grid(grid)
+        assert world.get_bounding_box() == (1, 1, 3, 3)
+        world.run(4, False)
+        assert world.get_bounding_box() == (2, 2, 3, 3)
+        world.reset_grid()
+        assert world.get_bounding_box() is None
+
+    @mark.parametrize("engine", ['python', 'counted'])
+    @mark.parametrize("step_mode", ['buffered', 'halfsteps'])
+    def test_box_without_scan(self, engine, step_mode):
+        '''
+        the nested list engines find the box from the live counts of the
+        rows & columns kept while stepping, not from the grid
+        '''
+        world = World(19, 13, engine, step_mode=step_mode)
+        random.seed(4)
+        world.set_random_grid()
+        world.run(10, False)
+        box = bounding_box(world.get_grid())
+        grid = world.grid
+        world.grid = []
+        assert world.get_bounding_box() == box
+        world.grid = grid
+
+    def test_unbounded_box(self):
+        '''
+        an unbounded glider's box leaves the grid
+        '''
+        world = World(3, 3, 'sparse', bounded=False)
+        world.set_grid(self.glider)
+        world.run(8, False)
+        assert world.get_bounding_box() == (2, 2, 3, 3)
+        world.run(8, False)
+        assert world.get_bounding_box() == (4, 4, 3, 3)
+
+    def test_get_stats(self):
+        '''
+        get_stats gathers the getters after the last step
+        '''
+        world = World(6, 6)
+        world.set_grid([['d'] * 6] + [['d', 'a', 'a', 'a', 'd', 'd']] +
+                       [['d'] * 6 for _ in range(4)])
+        stats = world.get_stats()
+        assert stats == Stats(0, 3, 0, 0, (1, 1, 3, 1), 0.0)
+        world.step()
+        stats = world.get_stats()
+        assert stats[:5] == (1, 3, 2, 2, (2, 0, 1, 3))
+        assert stats.step_time == world.get_step_time() > 0
+
+    def test_step_callback(self):
+        '''
+        the callback gets the world after every step until removed
+        '''
+        world = World(8, 8, 'numpy')
+        random.seed(2)
+        world.set_random_grid()
+        seen = []
+        world.set_step_callback(lambda stepped: seen.append(
+                (stepped.get_generation(), stepped.get_population())))
+        world.run(3, False)
+        world.set_step_callback(None)
+        world.step()
+        assert [generation for generation, _ in seen] == [1, 2, 3]
+
+    def test_csv_log(self, tmp_path):
+        '''
+        a .csv log has a header & a row per generation, the box split
+        into its 4 columns
+        '''
+        path = tmp_path / 'stats.csv'
+        world = World(10, 10, 'bitpacked')
+        random.seed(3)
+        world.set_random_grid()
+        populations = [world.get_population()]
+        with StatsLog(path) as log:
+            log.attach(world)
+            for _ in range(4):
+                world.step()
+                populations.append(world.get_population())
+        world.step()
+        with open(path, newline='') as log_file:
+            rows = list(csv.reader(log_file))
+        assert rows[0] == CSV_FIELDS
+        assert [int(row[0]) for row in rows[1:]] == list(range(5))
+        assert [int(row[1]) for row in rows[1:]] == populations
+
+    def test_jsonl_log(self, tmp_path):
+        '''
+        other paths get a JSON line per generation with every Stats field
+        '''
+        path = tmp_path / 'stats.log'
+        world = World(5, 5)
+        world.set_grid([['d'] * 5 for _ in range(5)])
+        with StatsLog(path) as log:
+            log.attach(world)
+            world.step()
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line['generation'] for line in lines] == [0, 1]
+        assert list(lines[1]) == list(Stats._fields)
+        assert lines[1]['bounding_box'] is None
+
+    def test_unknown_format(self, tmp_path):
+        '''
+        anything but LOG_FORMATS raises ValueError
+        '''
+        with raises(ValueError):
+            StatsLog(tmp_path / 'stats.xml', 'xml')
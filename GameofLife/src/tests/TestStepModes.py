@@ -0,0 +1,122 @@
+'''
+unit tests for the buffered & half step modes
+a buffered world is checked against the same world stepped through
+the 'z' & 'e' half steps
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from pytest import raises
+from main.GameofLife import World
+
+def make_pair(engine, ncol, nrow, seed, **options):
+    '''
+    a buffered & a half step world seeded the same way
+    '''
+    worlds = []
+    for step_mode in ('buffered', 'halfsteps'):
+        world = World(ncol, nrow, engine, step_mode=step_mode, **options)
+        random.seed(seed)
+        world.set_random_grid()
+        worlds.append(world)
+    return worlds
+
+class TestStepModes():
+
+    blinker = [['d','d','d'],['a','a','a'],['d','d','d']]
+
+    def test_unknown_step_mode(self):
+        '''
+        anything but STEP_MODES raises ValueError
+        '''
+        with raises(ValueError):
+            World(3, 3, step_mode='quarter')
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    @mark.parametrize("boundary", ['dead', 'torus'])
+    @mark.parametrize("ncol, nrow, seed", [(16, 12, 1), (5, 1, 2),
+                                           (30, 30, 3)])
+    def test_modes_match(self, engine, boundary, ncol, nrow, seed):
+        '''
+        both modes give the same generations, hashes & outcome
+        '''
+        buffered, halfsteps = make_pair(engine, ncol, nrow, seed,
+                                        boundary=boundary)
+        for _ in range(15):
+            buffered.step()
+            halfsteps.step()
+            assert buffered.get_grid() == halfsteps.get_grid()
+            assert buffered.get_hash() == halfsteps.get_hash()
+            assert buffered.get_population() == halfsteps.get_population()
+        assert buffered.get_outcome() == halfsteps.get_outcome()
+
+    def test_buffers_swap(self):
+        '''
+        the python world swaps between 2 grids instead of making one
+        per generation
+        '''
+        world = World(3, 3)
+        world.set_grid(self.blinker)
+        world.step()
+        first = world.grid
+        world.step()
+        second = world.grid
+        world.step()
+        assert world.grid is first
+        assert second is not first
+        assert world.get_grid() == [['d','a','d']] * 3
+
+    def test_quiet_cells_skipped(self):
+        '''
+        buffered steps only evaluate cells whose neighborhood changed
+        '''
+        world = World(20, 20)
+        grid = [['d'] * 20 for _ in range(20)]
+        for y, row in enumerate(self.blinker):
+            grid[y + 5][5:8] = row
+        world.set_grid(grid)
+        world.step()
+        assert world.get_cells_evaluated() == 400
+        world.step()
+        assert world.get_cells_evaluated() < 50
+        world.run(6, False)
+        assert world.get_grid() == grid
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_half_steps_opt_in(self, engine):
+        '''
+        a buffered world can still be stepped a half step at a time, &
+        buffered steps carry on correctly afterwards
+        '''
+        buffered, halfsteps = make_pair(engine, 12, 12, 4)
+        buffered.run(3, False)
+        halfsteps.run(3, False)
+        buffered.mark_for_transition()
+        halfsteps.mark_for_transition()
+        assert buffered.get_grid() == halfsteps.get_grid()
+        assert any(cell in ('z', 'e') for row in buffered.get_grid()
+                   for cell in row)
+        buffered.clean_up_grid()
+        halfsteps.clean_up_grid()
+        assert buffered.get_grid() == halfsteps.get_grid()
+        for _ in range(5):
+            buffered.step()
+            halfsteps.step()
+            assert buffered.get_grid() == halfsteps.get_grid()
+
+    def test_set_cell_between_steps(self):
+        '''
+        cells flipped by hand between buffered steps are picked up
+        '''
+        buffered, halfsteps = make_pair('python', 10, 10, 5)
+        for x, y in ((0, 0), (5, 5), (9, 3)):
+            buffered.step()
+            halfsteps.step()
+            # d > e > a or a > z > d
+            for world in (buffered, halfsteps):
+                world.set_cell(x, y)
+                world.set_cell(x, y)
+            buffered.step()
+            halfsteps.step()
+            assert buffered.get_grid() == halfsteps.get_grid()
@@ -0,0 +1,156 @@
+'''
+unit tests for stepping a World in a background thread
+snapshots are checked against a World stepped on the test thread
+
+Created on Oct 18, 2026
+'''
+import time
+import random
+from pytest import mark
+from pytest import fixture
+from pytest import raises
+from main.GameofLife import World
+from main.Stepper import SteppingThread
+
+class TestSteppingThread():
+
+    blinker = [['d','d','d','d','d'],['d','d','a','d','d'],
+               ['d','d','a','d','d'],['d','d','a','d','d'],
+               ['d','d','d','d','d']]
+
+    @fixture
+    def make_stepper(self):
+        '''
+        factory for a stepping thread on a random world, stopped after
+        the test
+        '''
+        steppers = []
+
+        def _make_stepper(seed, generations_per_sec=float('inf'),
+                          engine='python', stop_when_settled=False):
+            world = World(20, 20, engine)
+            random.seed(seed)
+            world.set_random_grid()
+            stepper = SteppingThread(world, generations_per_sec,
+                                     stop_when_settled)
+            steppers.append(stepper)
+            return stepper
+
+        yield _make_stepper
+
+        for stepper in steppers:
+            stepper.stop()
+
+    def wait_for(self, stepper, generation, timeout=5):
+        '''
+        wait until the thread published generation, returns the snapshot
+        '''
+        end = time.perf_counter() + timeout
+        while time.perf_counter() < end:
+            snapshot = stepper.get_snapshot()
+            if snapshot.generation >= generation:
+                return snapshot
+            time.sleep(0.001)
+        raise AssertionError(f"generation {generation} not reached")
+
+    def test_first_snapshot(self, make_stepper):
+        '''
+        before starting, the snapshot is the initial grid
+        '''
+        stepper = make_stepper(1)
+        snapshot = stepper.get_snapshot()
+        assert snapshot.generation == 0
+        assert snapshot.grid == stepper.world.get_grid()
+        assert snapshot.outcome is None
+
+    def test_no_cycle_detection(self, make_stepper):
+        '''
+        without stop_when_settled the thread doesn't turn on cycle
+        detection, a world that already looks for cycles gets outcomes
+        '''
+        stepper = make_stepper(5)
+        stepper.start()
+        snapshot = self.wait_for(stepper, 3)
+        assert snapshot.outcome is None
+        assert not stepper.world.detect_cycles
+        world = World(5, 5)
+        world.set_grid(self.blinker)
+        world.set_cycle_detection()
+        assert SteppingThread(world).get_snapshot().outcome == 'running'
+
+    @mark.parametrize("engine", ['python', 'numpy'])
+    def test_snapshots_match_world(self, make_stepper, engine):
+        '''
+        every snapshot is a whole generation of the stepped world
+        '''
+        stepper = make_stepper(2, engine=engine)
+        world = World(20, 20)
+        world.set_grid(stepper.world.get_grid())
+        grids = [world.get_grid()]
+        for _ in range(30):
+            world.step()
+            grids.append(world.get_grid())
+        stepper.start()
+        for _ in range(20):
+            snapshot = stepper.get_snapshot()
+            if snapshot.generation > 30:
+                break
+            assert snapshot.grid == grids[snapshot.generation]
+            time.sleep(0.001)
+
+    def test_target_rate(self, make_stepper):
+        '''
+        stepping is held to about generations_per_sec
+        '''
+        stepper = make_stepper(3, generations_per_sec=50)
+        stepper.start()
+        time.sleep(0.2)
+        generation = stepper.get_snapshot().generation
+        assert 3 <= generation <= 15
+
+    def test_pause_resume(self, make_stepper):
+        '''
+        no new generations while paused, stepping carries on on resume
+        '''
+        stepper = make_stepper(4, generations_per_sec=1000)
+        stepper.start()
+        self.wait_for(stepper, 1)
+        stepper.pause()
+        assert stepper.is_paused()
+        time.sleep(0.02)
+        generation = stepper.get_snapshot().generation
+        time.sleep(0.05)
+        assert stepper.get_snapshot().generation == generation
+        stepper.resume()
+        self.wait_for(stepper, generation + 1)
+
+    def test_stop_when_settled(self):
+        '''
+        the thread ends once the world settles
+        '''
+        world = World(5, 5)
+        world.set_grid(self.blinker)
+        stepper = SteppingThread(world, stop_when_settled=True)
+        stepper.start()
+        stepper.join(5)
+        assert not stepper.is_alive()
+        snapshot = stepper.get_snapshot()
+        assert snapshot.outcome == 'oscillating'
+        assert snapshot.generation == 2
+
+    def test_stop_while_paused(self, make_stepper):
+        '''
+        stop ends a paused thread
+        '''
+        stepper = make_stepper(6, generations_per_sec=10)
+        stepper.pause()
+        stepper.start()
+        stepper.stop(5)
+        assert not stepper.is_alive()
+
+    def test_incorrect_rate(self):
+        '''
+        the rate has to be positive
+        '''
+        with raises(ValueError):
+            SteppingThread(World(5, 5), 0)
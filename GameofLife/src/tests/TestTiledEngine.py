@@ -0,0 +1,123 @@
+'''
+unit tests for the multi-core tiled World backend
+results are checked against the nested list World
+
+Created on Oct 18, 2026
+'''
+import random
+from pytest import mark
+from pytest import fixture
+from main.GameofLife import World
+from main.TiledEngine import TiledWorld, tile_bounds
+
+class TestTiledWorld():
+
+    @fixture
+    def tiled_world(self):
+        '''
+        factory for TiledWorlds that are closed after the test
+        '''
+        worlds = []
+
+        def _tiled_world(ncol, nrow, tiles, **options):
+            world = World(ncol, nrow, engine='tiled', tiles=tiles, workers=2,
+                          **options)
+            worlds.append(world)
+            return world
+
+        yield _tiled_world
+
+        for world in worlds:
+            world.close()
+
+    @mark.parametrize("tiles, exp_bounds", [((2,1), [(0,0,5,3),(0,3,5,7)]),
+            ((1,2), [(0,0,2,7),(2,0,5,7)]),
+            ((2,2), [(0,0,2,3),(2,0,5,3),(0,3,2,7),(2,3,5,7)]),
+            ((9,1), [(0,y,5,y+1) for y in range(7)])],
+            ids=['strips', 'columns', 'rectangles', 'more_tiles_than_rows'])
+    def test_tile_bounds(self, tiles, exp_bounds):
+        '''
+        tiles cover the grid without overlapping & skip empty tiles
+        '''
+        assert tile_bounds(5, 7, tiles) == exp_bounds
+
+    def test_engine_picked_at_construction(self, tiled_world):
+        '''
+        World(..., engine='tiled') should give a TiledWorld
+        '''
+        world = tiled_world(4, 3, (2, 1))
+        assert isinstance(world, TiledWorld)
+        assert world.get_grid() == [['d'] * 4 for _ in range(3)]
+
+    @mark.parametrize("tiles", [(2,1), (3,3), (1,4)],
+            ids=['strips', 'rectangles', 'columns'])
+    def test_generations_match(self, tiled_world, tiles):
+        '''
+        both half steps match the python World for several generations
+        including the cells on tile edges & grid edges
+        '''
+        python_world = World(23, 17)
+        random.seed(7)
+        python_world.set_random_grid()
+        world = tiled_world(23, 17, tiles)
+        world.set_grid(python_world.get_grid())
+        for _ in range(8):
+            python_world.mark_for_transition()
+            world.mark_for_transition()
+            assert world.get_grid() == python_world.get_grid()
+            python_world.clean_up_grid()
+            world.clean_up_grid()
+            assert world.get_grid() == python_world.get_grid()
+
+    @mark.parametrize("boundary", ['dead', 'torus', 'reflect'])
+    @mark.parametrize("step_mode", ['buffered', 'halfsteps'])
+    def test_counts_from_tiles(self, tiled_world, boundary, step_mode):
+        '''
+        the hash, population, births & deaths summed from the tiles match
+        the python World
+        '''
+        python_world = World(23, 17, boundary=boundary)
+        random.seed(8)
+        python_world.set_random_grid()
+        world = tiled_world(23, 17, (3, 2), boundary=boundary,
+                            step_mode=step_mode)
+        world.set_grid(python_world.get_grid())
+        world.set_cycle_detection()
+        python_world.set_cycle_detection()
+        for _ in range(8):
+            python_world.step()
+            world.step()
+            assert world.get_grid() == python_world.get_grid()
+            assert world.get_hash() == python_world.get_hash()
+            assert world.get_population() == python_world.get_population()
+            assert (world.get_births(), world.get_deaths()) == \
+                    (python_world.get_births(), python_world.get_deaths())
+
+    def test_buffered_step_swaps_grids(self, tiled_world):
+        '''
+        a buffered step is one pass of the pool that writes the other
+        shared grid
+        '''
+        world = tiled_world(10, 10, (2, 2))
+        world.seed_random(0.5, 9)
+        grids = world._grids
+        assert world.grid is grids[0]
+        world.step()
+        assert world.grid is grids[1]
+        world.step()
+        assert world.grid is grids[0]
+        timings = world.get_tile_timings()
+        assert all(timing['step'] > 0 and timing['mark'] == 0
+                   for timing in timings)
+
+    def test_tile_timings(self, tiled_world):
+        '''
+        every tile reports how long each half step took
+        '''
+        world = tiled_world(10, 10, (2, 2))
+        world.mark_for_transition()
+        world.clean_up_grid()
+        timings = world.get_tile_timings()
+        assert [timing['tile'] for timing in timings] == world.tiles
+        assert all(timing['mark'] > 0 and timing['clean'] > 0
+                   for timing in timings)
@@ -0,0 +1,181 @@
+'''
+unit tests for the read-only grid views & copy on write snapshots
+snapshots are checked against get_grid copies taken at the same time
+
+Created on Oct 18, 2026
+'''
+import gc
+import random
+from pytest import mark
+from pytest import fixture
+from pytest import raises
+from main.GameofLife import World, GridView, GridSnapshot
+
+class TestViews():
+
+    blinker = [['d','d','d'],['a','a','a'],['d','d','d']]
+
+    @fixture
+    def make_world(self, tmp_path):
+        '''
+        factory for random worlds of any engine, closed after the test
+        '''
+        worlds = []
+
+        def _make_world(engine, step_mode='buffered', seed=1):
+            options = {}
+            if engine == 'tiled':
+                options = {'tiles' : (2, 2), 'workers' : 2}
+            elif engine == 'mapped':
+                options = {'path' : tmp_path / 'world.golmap'}
+            world = World(14, 9, engine, step_mode=step_mode, **options)
+            random.seed(seed)
+            world.set_random_grid()
+            worlds.append(world)
+            return world
+
+        yield _make_world
+
+        for world in worlds:
+            if hasattr(world, 'close'):
+                world.close()
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse',
+                                 'tiled', 'mapped'])
+    def test_get_grid_from_view(self, make_world, engine):
+        '''
+        get_grid is the nested list of get_view
+        '''
+        world = make_world(engine)
+        world.mark_for_transition()
+        assert world.grid_from_view(world.get_view(), world.numX,
+                                    world.numY) == world.get_grid()
+
+    @mark.parametrize("engine, error", [('python', TypeError),
+                                        ('numpy', ValueError),
+                                        ('bitpacked', TypeError),
+                                        ('sparse', AttributeError)])
+    def test_view_read_only(self, make_world, engine, error):
+        '''
+        views can't change the grid
+        '''
+        view = make_world(engine).get_view()
+        with raises(error):
+            if engine == 'python':
+                view[0][0] = 'a'
+            elif engine == 'numpy':
+                view[0, 0] = 1
+            elif engine == 'bitpacked':
+                view.alive[0] = 1
+            else:
+                view.alive.add((0, 0))
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_view_not_copied(self, make_world, engine):
+        '''
+        a view sees the grid change under it
+        '''
+        world = make_world(engine)
+        view = world.get_view()
+        world.set_cell(0, 0)
+        assert world.grid_from_view(view, world.numX, world.numY) == \
+                world.get_grid()
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse',
+                                 'tiled', 'mapped', 'counted', 'jit'])
+    @mark.parametrize("step_mode", ['buffered', 'halfsteps'])
+    def test_new_view_each_step(self, make_world, engine, step_mode):
+        '''
+        a view taken after each step is the grid of that generation
+        '''
+        world = make_world(engine, step_mode)
+        python_world = World(14, 9)
+        random.seed(1)
+        python_world.set_random_grid()
+        for _ in range(5):
+            world.step()
+            python_world.step()
+            assert world.grid_from_view(world.get_view(), world.numX,
+                                        world.numY) == python_world.grid
+
+    def test_grid_view(self):
+        '''
+        GridView reads like the nested list
+        '''
+        world = World(3, 3)
+        world.set_grid(self.blinker)
+        view = world.get_view()
+        assert isinstance(view, GridView)
+        assert len(view) == 3 and len(view[1]) == 3
+        assert view[1][2] == 'a'
+        assert view == self.blinker
+        assert [''.join(row) for row in view] == ['ddd', 'aaa', 'ddd']
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse',
+                                 'tiled', 'mapped', 'counted'])
+    @mark.parametrize("step_mode", ['buffered', 'halfsteps'])
+    def test_snapshot_never_changes(self, make_world, engine, step_mode):
+        '''
+        each snapshot keeps its generation while the world steps on &
+        is edited by hand
+        '''
+        world = make_world(engine, step_mode)
+        snapshots = []
+        grids = []
+        for _ in range(4):
+            snapshots.append(world.snapshot())
+            grids.append(world.get_grid())
+            world.step()
+            world.set_cell(1, 1)
+            world.set_cell(1, 1)
+        for generation, (snapshot, grid) in enumerate(zip(snapshots,
+                                                          grids)):
+            assert snapshot.generation == generation
+            assert snapshot.get_grid() == grid
+
+    @mark.parametrize("engine", ['python', 'numpy', 'bitpacked', 'sparse'])
+    def test_snapshot_shares_grid(self, make_world, engine):
+        '''
+        a snapshot shares the storage until the world writes to it
+        '''
+        world = make_world(engine)
+        snapshot = world.snapshot()
+        storage = world.alive if engine == 'sparse' else world.grid
+        assert snapshot.storage is storage
+        world.set_cell(0, 0)
+        storage = world.alive if engine == 'sparse' else world.grid
+        assert snapshot.storage is not storage
+
+    @mark.parametrize("engine", ['tiled', 'mapped'])
+    def test_snapshot_copies_fixed_storage(self, make_world, engine):
+        '''
+        shared memory & mapped grids are copied when the snapshot is
+        taken
+        '''
+        world = make_world(engine)
+        assert world.snapshot().storage is not world.grid
+
+    def test_numpy_steps_never_copy(self, make_world):
+        '''
+        a numpy buffered step makes a new grid, so the snapshot keeps
+        the old one without any copy
+        '''
+        world = make_world('numpy')
+        snapshot = world.snapshot()
+        grid = world.grid
+        world.step()
+        assert snapshot.storage is grid
+        assert snapshot.get_view().base is grid
+
+    def test_dropped_snapshot(self, make_world):
+        '''
+        once a snapshot is gone the grid is written in place again
+        '''
+        world = make_world('python')
+        snapshot = world.snapshot()
+        assert isinstance(snapshot, GridSnapshot)
+        del snapshot
+        gc.collect()
+        grid = world.grid
+        world.set_cell(0, 0)
+        assert world.grid is grid